@@ -1,20 +1,162 @@
+import os
 from pathlib import Path
+from src.stage_timer import StageTimer
 
 """
 Configuration module for DemandPredictor API.
 Stores paths and common settings for API use.
+Settings can be overridden with DEMAND_PREDICTOR_* environment variables.
 """
 
 class Config:
 
     def __init__(self):
         self._root = Path(__file__).parent.parent
-        self._models_dir = self._root / "saved_models" / "xgb_model"
+        self._saved_models_dir = self._root / "saved_models"
+        self._models_dir = self._saved_models_dir / "xgb_model"
 
     """
     Returns path to saved model folder.
     """
+    @StageTimer.timed('config.model')
     def model(self) -> Path:
         if not self._models_dir.exists():
             raise FileNotFoundError(f"Model folder not found at {self._models_dir}")
-        return self._models_dir
\ No newline at end of file
+        return self._models_dir
+
+    """
+    Returns path to folder with all saved models.
+    """
+    def models(self) -> Path:
+        return self._saved_models_dir
+
+    """
+    Returns memory budget in bytes for loaded models or None for unlimited cache.
+    """
+    def cache_bytes(self) -> int|None:
+        value = os.environ.get("DEMAND_PREDICTOR_CACHE_BYTES")
+        return int(value) if value else None
+
+    """
+    Returns max-age in seconds for Cache-Control header of prediction responses.
+    """
+    def cache_max_age(self) -> int:
+        return int(os.environ.get("DEMAND_PREDICTOR_CACHE_MAX_AGE", 60))
+
+    """
+    Returns names of models to warm up on startup: default model, list from environment or 'all'.
+    """
+    def warmup_models(self) -> list|str:
+        value = os.environ.get("DEMAND_PREDICTOR_WARMUP", self._models_dir.name)
+        if value.strip() == "all":
+            return "all"
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+    """
+    Returns timeout in seconds of warming up one model or None to wait until it loads.
+    """
+    def warmup_timeout(self) -> float|None:
+        value = os.environ.get("DEMAND_PREDICTOR_WARMUP_TIMEOUT", "")
+        return float(value) if value.strip() and float(value) > 0 else None
+
+    """
+    Returns initial delay in seconds before failed model warm-up is retried, delay doubles after every retry.
+    """
+    def warmup_backoff(self) -> float:
+        return float(os.environ.get("DEMAND_PREDICTOR_WARMUP_BACKOFF", 1.0))
+
+    """
+    Returns executor kind for inference: 'thread' or 'process'.
+    """
+    def executor_kind(self) -> str:
+        kind = os.environ.get("DEMAND_PREDICTOR_EXECUTOR", "thread")
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        return kind
+
+    """
+    Returns number of inference workers.
+    """
+    def executor_workers(self) -> int:
+        return int(os.environ.get("DEMAND_PREDICTOR_WORKERS", os.cpu_count() or 1))
+
+    """
+    Returns number of requests allowed to wait for a free worker.
+    """
+    def executor_queue(self) -> int:
+        return int(os.environ.get("DEMAND_PREDICTOR_QUEUE", 64))
+
+    """
+    Returns inference timeout in seconds.
+    """
+    def executor_timeout(self) -> float:
+        return float(os.environ.get("DEMAND_PREDICTOR_TIMEOUT", 10.0))
+
+    """
+    Returns inference engine for tree models: 'xgboost' or pure-NumPy 'numpy'.
+    """
+    def engine(self) -> str:
+        engine = os.environ.get("DEMAND_PREDICTOR_ENGINE", "xgboost")
+        if engine not in ("xgboost", "numpy"):
+            raise ValueError(f"Unknown inference engine: {engine}")
+        return engine
+
+    """
+    Checks whether stage timings and request metrics are recorded for /metrics.
+    """
+    def metrics_enabled(self) -> bool:
+        return os.environ.get("DEMAND_PREDICTOR_METRICS", "1").strip().lower() not in ("0", "false", "no", "off")
+
+    """
+    Returns maximal number of rows in one batch request, both given feature rows and selected stored months.
+    """
+    def max_batch_rows(self) -> int:
+        return int(os.environ.get("DEMAND_PREDICTOR_MAX_BATCH_ROWS", 100_000))
+
+    """
+    Returns maximal number of variants in one scenario request.
+    """
+    def max_scenarios(self) -> int:
+        return int(os.environ.get("DEMAND_PREDICTOR_MAX_SCENARIOS", 1_000_000))
+
+    """
+    Returns maximal number of paths in one simulation request.
+    """
+    def max_simulation_paths(self) -> int:
+        return int(os.environ.get("DEMAND_PREDICTOR_MAX_PATHS", 100_000))
+
+    """
+    Returns number of threads splitting paths of one simulation.
+    """
+    def simulation_workers(self) -> int:
+        return int(os.environ.get("DEMAND_PREDICTOR_SIMULATION_WORKERS", 1))
+
+    """
+    Returns names of models evaluated in shadow of the default model.
+    """
+    def shadow_models(self) -> list:
+        value = os.environ.get("DEMAND_PREDICTOR_SHADOW", "")
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+    """
+    Returns A/B split of default model traffic: candidate model name to share of requests, e.g. 'xgb_candidate:0.1'.
+    """
+    def ab_split(self) -> dict:
+        split = {}
+        for entry in os.environ.get("DEMAND_PREDICTOR_AB_SPLIT", "").split(","):
+            if entry.strip():
+                name, share = entry.rsplit(":", 1)
+                split[name.strip()] = float(share)
+        return split
+
+    """
+    Returns number of background threads evaluating shadow models.
+    """
+    def shadow_workers(self) -> int:
+        return int(os.environ.get("DEMAND_PREDICTOR_SHADOW_WORKERS", 1))
+
+    """
+    Returns number of shadow evaluations allowed to wait, further ones are dropped.
+    """
+    def shadow_queue(self) -> int:
+        return int(os.environ.get("DEMAND_PREDICTOR_SHADOW_QUEUE", 64))
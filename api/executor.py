@@ -0,0 +1,119 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+"""
+Bounded executor for blocking model loading and inference.
+Runs jobs in a dedicated thread or process pool, rejects jobs when queue is full and stops waiting after timeout.
+Process pool workers run initializer when they start (for example to load models), start() starts all of them at once
+and run_on_workers() runs a job in every worker (for example to check that each of them is warmed up).
+
+Example:
+    executor = InferenceExecutor(kind="thread", workers=4, queue=64, timeout=10.0)
+    prediction = await executor.run(predict_next_month, model_folder)
+    await executor.run(warm_up_model, model_folder, timeout=None)
+    await executor.run_on_workers(warm_up_model, model_folder, timeout=None)
+"""
+
+class ExecutorBusyError(RuntimeError):
+    pass
+
+
+class InferenceExecutor:
+
+    DEFAULT_TIMEOUT = object()
+
+    def __init__(self, kind: str, workers: int, queue: int, timeout: float):
+        self.__kind = kind
+        self.__workers = workers
+        self.__queue = queue
+        self.__timeout = timeout
+        self.__pool = None
+        self.__in_flight = 0
+        self.__initializer = None
+        self.__initargs = ()
+
+    """
+    Runs function in the pool and returns its result.
+    Raises ExecutorBusyError if all workers and queue slots are taken and TimeoutError if job takes too long.
+    Timeout of executor is used unless other timeout is given, None waits without limit.
+    Slot of timed out job is released only when the job really finishes.
+    """
+    async def run(self, function: Callable, *args, timeout: float|None|object = DEFAULT_TIMEOUT) -> Any:
+        if self.__in_flight >= self.__workers + self.__queue:
+            raise ExecutorBusyError(f"Inference queue is full ({self.__in_flight} jobs in flight)")
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.__executor(), function, *args)
+        self.__in_flight += 1
+        future.add_done_callback(self.__release)
+        timeout = self.__timeout if timeout is self.DEFAULT_TIMEOUT else timeout
+        return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+
+    """
+    Runs function in every worker and returns its results, one per worker.
+    Process pool jobs are submitted until every worker answered, threads share the process, so function runs once.
+    Error of any worker is raised.
+    """
+    async def run_on_workers(self, function: Callable, *args, timeout: float|None|object = DEFAULT_TIMEOUT) -> list:
+        if self.__kind != "process":
+            return [await self.run(function, *args, timeout=timeout)]
+        results = {}
+        while len(results) < self.__workers:
+            answers = await asyncio.gather(*(self.run(worker_result, function, *args, timeout=timeout) for _ in range(self.__workers)))
+            results.update(answers)
+        return list(results.values())
+
+    """
+    Sets function that every process worker runs when it starts, before the pool is created.
+    Threads share the process, so thread pool does not need it.
+    """
+    def set_initializer(self, function: Callable, *args):
+        self.__initializer = function
+        self.__initargs = args
+
+    """
+    Creates the pool and, for process pool, starts every worker and waits until each ran initializer and answered.
+    Process workers are otherwise started on demand, so a worker that starts under traffic would load models then.
+    """
+    async def start(self):
+        self.__executor()
+        if self.__kind == "process":
+            await self.run_on_workers(os.getpid, timeout=None)
+
+    """
+    Returns number of jobs running or waiting in the pool.
+    """
+    def in_flight(self) -> int:
+        return self.__in_flight
+
+    """
+    Stops pool workers.
+    """
+    def shutdown(self):
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=False, cancel_futures=True)
+            self.__pool = None
+
+    """
+    Creates pool on first use.
+    """
+    def __executor(self) -> Executor:
+        if self.__pool is None:
+            if self.__kind == "process":
+                self.__pool = ProcessPoolExecutor(max_workers=self.__workers, initializer=self.__initializer, initargs=self.__initargs)
+            else:
+                self.__pool = ThreadPoolExecutor(max_workers=self.__workers, thread_name_prefix="inference")
+        return self.__pool
+
+    """
+    Frees slot after job is done.
+    """
+    def __release(self, future: asyncio.Future):
+        self.__in_flight -= 1
+
+"""
+Runs function in pool worker and returns process id of the worker with its result.
+"""
+def worker_result(function: Callable, *args) -> tuple:
+    return os.getpid(), function(*args)
@@ -1,6 +1,10 @@
+import asyncio
+import time
 import uvicorn
-from fastapi import FastAPI
-from api.routers import predict
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from api.routers import predict, health, metrics as metrics_router
+from api.state import config, registry, executor, warm_up, metrics, shadow
 from fastapi.middleware.cors import CORSMiddleware
 
 """
@@ -12,12 +16,68 @@ Usage:
 Run 'python -m http.server 8080' to start the server
 """
 
+"""
+Gives folders of models that should be warmed up on startup, shadow and A/B candidate models included.
+"""
+def warmup_folders() -> dict:
+    names = config.warmup_models()
+    if names == "all":
+        names = registry.names()
+    names = list(dict.fromkeys([*names, *optional_models()]))
+    return {name: config.models() / name for name in names}
+
+"""
+Gives shadow and A/B candidate models that are warmed up but do not block readiness.
+"""
+def optional_models() -> list:
+    names = config.warmup_models()
+    required = registry.names() if names == "all" else names
+    return [name for name in dict.fromkeys([*config.shadow_models(), *config.ab_split()]) if name not in required]
+
+"""
+Warms up configured models in background on startup and stops inference and shadow workers on shutdown.
+Process workers warm up required models when they start, failed models are retried in background.
+Readiness is reported by /health/ready once every required model is warmed up.
+"""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    folders = warmup_folders()
+    optional = optional_models()
+    executor.set_initializer(predict.warm_up_worker, [folder for name, folder in folders.items() if name not in optional])
+    task = asyncio.create_task(warm_up.run(executor, predict.warm_up_model, folders, optional=optional))
+    yield
+    task.cancel()
+    executor.shutdown()
+    shadow.shutdown()
+
 app = FastAPI(
     title="Demand Predictor API",
     description="API for predicting number of deals for next month",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 app.include_router(predict.router)
+app.include_router(health.router)
+app.include_router(metrics_router.router)
+
+"""
+Counts requests in flight and records request duration by route template for /metrics.
+"""
+async def track_requests(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    with metrics.in_flight().track_inprogress():
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            metrics.observe_request(request.method, getattr(route, "path", "unmatched"), status, time.perf_counter() - started)
+
+if config.metrics_enabled():
+    metrics.enable()
+    app.middleware("http")(track_requests)
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,6 +85,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Model-Variant"],
 )
 
 if __name__ == "__main__":
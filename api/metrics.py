@@ -0,0 +1,101 @@
+from prometheus_client import CollectorRegistry, Gauge, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from api.shadow import ShadowRouter
+from src.model_cache import ModelCache
+from src.stage_timer import StageTimer
+
+"""
+Prometheus metrics of the API.
+Pipeline stage durations come from StageTimer hooks, HTTP request durations and in-flight requests from middleware,
+cache statistics, model load counts, in-flight inference jobs and shadow comparison are read on every scrape.
+With process executor stages timed inside worker processes are not included.
+
+Example:
+    metrics = Metrics(model_cache, executor, shadow)
+    metrics.enable()
+    metrics.exposition()
+"""
+
+class Metrics:
+
+    BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, cache: ModelCache, executor, shadow: ShadowRouter):
+        self.__cache = cache
+        self.__executor = executor
+        self.__shadow = shadow
+        self.__registry = CollectorRegistry()
+        self.__stages = Histogram(
+            'demand_predictor_stage_seconds', 'Duration of pipeline stages.',
+            ['stage'], buckets=self.BUCKETS, registry=self.__registry
+        )
+        self.__requests = Histogram(
+            'demand_predictor_http_request_seconds', 'Duration of HTTP requests.',
+            ['method', 'route', 'status'], buckets=self.BUCKETS, registry=self.__registry
+        )
+        self.__in_flight = Gauge(
+            'demand_predictor_http_requests_in_flight', 'HTTP requests being processed.',
+            registry=self.__registry
+        )
+        self.__registry.register(self)
+
+    """
+    Starts recording stage durations from StageTimer hooks.
+    """
+    def enable(self):
+        StageTimer.enable(self.observe_stage)
+
+    """
+    Records duration of pipeline stage.
+    """
+    def observe_stage(self, stage: str, seconds: float):
+        self.__stages.labels(stage).observe(seconds)
+
+    """
+    Records duration of HTTP request by route template.
+    """
+    def observe_request(self, method: str, route: str, status: int, seconds: float):
+        self.__requests.labels(method, route, str(status)).observe(seconds)
+
+    """
+    Returns gauge of HTTP requests being processed.
+    """
+    def in_flight(self) -> Gauge:
+        return self.__in_flight
+
+    """
+    Returns all metrics in Prometheus text format.
+    """
+    def exposition(self) -> bytes:
+        return generate_latest(self.__registry)
+
+    """
+    Yields cache, model load, executor and shadow metrics read at scrape time.
+    """
+    def collect(self):
+        stats = self.__cache.stats()
+        for name in ('hits', 'misses', 'evictions', 'coalesced', 'swaps'):
+            yield CounterMetricFamily(f'demand_predictor_cache_{name}', f'Model cache {name}.', value=stats[name])
+        yield CounterMetricFamily('demand_predictor_model_loads', 'Artifacts loaded from disk.', value=stats['misses'])
+        yield GaugeMetricFamily('demand_predictor_cache_models', 'Model folders held in cache.', value=stats['size'])
+        yield GaugeMetricFamily('demand_predictor_cache_bytes', 'Approximate size of cached models in bytes.', value=stats['size_bytes'])
+        yield GaugeMetricFamily('demand_predictor_inference_in_flight', 'Inference jobs running or queued in executor.', value=self.__executor.in_flight())
+        yield from self.__shadow_metrics()
+
+    """
+    Yields shadow comparison by shadow model and time spent scheduling shadows on the request path.
+    """
+    def __shadow_metrics(self):
+        report = self.__shadow.report()
+        counters = {name: CounterMetricFamily(f'demand_predictor_shadow_{name}', f'Shadow evaluations {name}.', labels=['model'])
+                    for name in ('pairs', 'errors', 'dropped')}
+        abs_diff = GaugeMetricFamily('demand_predictor_shadow_mean_abs_diff', 'Mean absolute difference from primary prediction.', labels=['model'])
+        for model, stats in report['shadows'].items():
+            for name, counter in counters.items():
+                counter.add_metric([model], stats[name])
+            if stats['mean_abs_diff'] is not None:
+                abs_diff.add_metric([model], stats['mean_abs_diff'])
+        yield from counters.values()
+        yield abs_diff
+        yield GaugeMetricFamily('demand_predictor_shadow_pending', 'Shadow evaluations running or queued.', value=report['pending'])
+        yield GaugeMetricFamily('demand_predictor_shadow_submit_max_seconds', 'Longest time spent scheduling shadows on the request path.', value=report['submit_max_seconds'])
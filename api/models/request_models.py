@@ -0,0 +1,111 @@
+from datetime import date
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field, model_validator
+
+"""
+Request models for FastAPI endpoints.
+Defines structures accepted in API request bodies.
+"""
+
+class BatchPredictionRequest(BaseModel):
+    features: Optional[Dict[str, List[float]]] = Field(
+        default=None,
+        description="Feature rows in columnar form: column name to list of values.",
+        example={"Deals lag1": [1537.0, 1602.0], "sin_season": [0.5, 0.87]}
+    )
+    start_month: Optional[date] = Field(
+        default=None,
+        description="First month of stored features to predict (inclusive).",
+        example="2025-01-01"
+    )
+    end_month: Optional[date] = Field(
+        default=None,
+        description="Last month of stored features to predict (inclusive).",
+        example="2025-09-01"
+    )
+
+    """
+    Checks that request contains either feature rows or month range, not both.
+    """
+    @model_validator(mode="after")
+    def check_source(self):
+        has_range = self.start_month is not None or self.end_month is not None
+        if self.features is not None and has_range:
+            raise ValueError("Pass either features or month range, not both")
+        if self.features is not None and len({len(values) for values in self.features.values()}) > 1:
+            raise ValueError("All feature columns must have the same length")
+        return self
+
+    """
+    Returns number of given feature rows or None if rows are selected from stored features by months.
+    """
+    def rows(self) -> int|None:
+        if self.features is None:
+            return None
+        return max((len(values) for values in self.features.values()), default=0)
+
+
+class ScenarioRequest(BaseModel):
+    overrides: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="Values set in every variant of the last feature row: column name to value.",
+        example={"External feature 4": 16.0}
+    )
+    grid: Optional[Dict[str, List[float]]] = Field(
+        default=None,
+        description="Values of columns whose Cartesian product makes the variants: column name to list of values.",
+        example={"Deals": [1500.0, 1700.0], "Apartment features 1": [290.0, 300.0, 310.0]}
+    )
+
+    """
+    Checks that every grid column has at least one value.
+    """
+    @model_validator(mode="after")
+    def check_grid(self):
+        if self.grid is not None and any(len(values) == 0 for values in self.grid.values()):
+            raise ValueError("Every grid column must have at least one value")
+        return self
+
+    """
+    Returns number of variants made by the grid.
+    """
+    def size(self) -> int:
+        size = 1
+        for values in (self.grid or {}).values():
+            size *= len(values)
+        return size
+
+
+class SimulationRequest(BaseModel):
+    horizon: int = Field(
+        default=12,
+        ge=1,
+        description="Number of months to simulate starting from the next month.",
+        example=12
+    )
+    paths: int = Field(
+        default=1000,
+        ge=1,
+        description="Number of simulated feature paths.",
+        example=10000
+    )
+    seed: Optional[int] = Field(
+        default=None,
+        description="Seed of random draws, equal seeds give equal distributions.",
+        example=42
+    )
+    quantiles: List[float] = Field(
+        default=[0.05, 0.5, 0.95],
+        min_length=1,
+        description="Quantiles of simulated predictions to return, between 0 and 1.",
+        example=[0.05, 0.5, 0.95]
+    )
+
+    """
+    Checks that quantiles are between 0 and 1.
+    """
+    @model_validator(mode="after")
+    def check_quantiles(self):
+        if any(not 0 <= q <= 1 for q in self.quantiles):
+            raise ValueError("Quantiles must be between 0 and 1")
+        return self
@@ -1,3 +1,4 @@
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 """
@@ -9,4 +10,199 @@ class PredictionResponse(BaseModel):
     predicted_deals: float = Field(
         description="Predicted number of deals for the next month.",
         example=128.4
-    )
\ No newline at end of file
+    )
+
+class CacheStatsResponse(BaseModel):
+    hits: int = Field(
+        description="Number of requests served from in-memory model cache.",
+        example=42
+    )
+    misses: int = Field(
+        description="Number of requests that loaded model artifacts from disk.",
+        example=1
+    )
+    evictions: int = Field(
+        description="Number of models evicted from cache to fit memory budget.",
+        example=0
+    )
+    coalesced: int = Field(
+        description="Number of requests that waited for a load already started by another request.",
+        example=0
+    )
+    swaps: int = Field(
+        description="Number of times a cached model version was replaced by a newly published one.",
+        example=0
+    )
+    size: int = Field(
+        description="Number of models currently held in cache.",
+        example=1
+    )
+    size_bytes: int = Field(
+        description="Approximate size of cached models in bytes.",
+        example=1048576
+    )
+
+
+class BatchPredictionResponse(BaseModel):
+    months: Optional[List[str]] = Field(
+        default=None,
+        description="Months of predicted rows when stored features were used.",
+        example=["2025-08-01", "2025-09-01"]
+    )
+    predicted_deals: List[Optional[float]] = Field(
+        description="Predicted number of deals for every requested row, null if prediction is not a finite number.",
+        example=[1602.3, 1669.1]
+    )
+
+
+
+class ForecastResponse(BaseModel):
+    months: List[Optional[str]] = Field(
+        description="Forecast months starting from the next month.",
+        example=["2025-09-01", "2025-10-01"]
+    )
+    predicted_deals: List[float] = Field(
+        description="Predicted number of deals for every forecast month.",
+        example=[1669.0, 1702.5]
+    )
+
+
+class SimulationResponse(BaseModel):
+    months: List[Optional[str]] = Field(
+        description="Simulated months starting from the next month.",
+        example=["2025-09-01", "2025-10-01"]
+    )
+    paths: int = Field(
+        description="Number of simulated feature paths.",
+        example=10000
+    )
+    mean: List[float] = Field(
+        description="Mean of simulated predictions for every month.",
+        example=[1669.0, 1698.2]
+    )
+    quantiles: Dict[str, List[float]] = Field(
+        description="Simulated predictions for every month by quantile, keys are percents ('p5', 'p50', 'p95').",
+        example={"p5": [1669.0, 1540.7], "p50": [1669.0, 1701.3], "p95": [1669.0, 1851.9]}
+    )
+
+
+class ShadowStats(BaseModel):
+    pairs: int = Field(
+        description="Number of requests predicted by both primary and shadow model.",
+        example=120
+    )
+    errors: int = Field(
+        description="Number of failed shadow evaluations.",
+        example=0
+    )
+    dropped: int = Field(
+        description="Number of shadow evaluations dropped because background queue was full.",
+        example=0
+    )
+    mean_diff: Optional[float] = Field(
+        default=None,
+        description="Mean of shadow minus primary prediction.",
+        example=-12.5
+    )
+    mean_abs_diff: Optional[float] = Field(
+        default=None,
+        description="Mean absolute difference between shadow and primary prediction.",
+        example=31.2
+    )
+    mean_seconds: Optional[float] = Field(
+        default=None,
+        description="Mean time of one shadow evaluation in background.",
+        example=0.004
+    )
+
+
+class ShadowReportResponse(BaseModel):
+    shadows: Dict[str, ShadowStats] = Field(
+        description="Comparison statistics of every shadow model."
+    )
+    pending: int = Field(
+        description="Shadow evaluations running or queued.",
+        example=0
+    )
+    submits: int = Field(
+        description="Number of primary predictions sent to shadow models.",
+        example=120
+    )
+    submit_mean_seconds: Optional[float] = Field(
+        default=None,
+        description="Mean time added to primary request by scheduling shadow evaluations.",
+        example=0.00002
+    )
+    submit_max_seconds: float = Field(
+        description="Longest time added to primary request by scheduling shadow evaluations.",
+        example=0.0001
+    )
+
+
+class ModelInfo(BaseModel):
+    name: str = Field(
+        description="Model name (folder name in saved_models).",
+        example="xgb_model"
+    )
+    version: Optional[str] = Field(
+        default=None,
+        description="Current published version of the model, null for models saved without versions.",
+        example="20250901T120000000000-1a2b3c4d"
+    )
+    resident: bool = Field(
+        description="Whether model is currently loaded in memory.",
+        example=True
+    )
+    size_bytes: int = Field(
+        description="Approximate size of loaded model in bytes, 0 if not resident.",
+        example=1048576
+    )
+    load_seconds: float = Field(
+        description="Time spent loading model artifacts, 0 if not resident.",
+        example=0.12
+    )
+
+
+class ModelsResponse(BaseModel):
+    models: List[ModelInfo] = Field(
+        description="All models available for prediction."
+    )
+
+
+class LivenessResponse(BaseModel):
+    status: str = Field(
+        description="Always 'alive' while process serves requests.",
+        example="alive"
+    )
+
+
+class ModelWarmUp(BaseModel):
+    seconds: float = Field(
+        description="Time spent loading and priming the model.",
+        example=0.35
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="Warm-up error or null if model is ready.",
+        example=None
+    )
+    attempts: int = Field(
+        default=1,
+        description="Number of warm-up attempts, failed models are retried with backoff.",
+        example=1
+    )
+    required: bool = Field(
+        default=True,
+        description="Whether the model blocks readiness, shadow and A/B candidates do not.",
+        example=True
+    )
+
+
+class ReadinessResponse(BaseModel):
+    ready: bool = Field(
+        description="Whether all configured models were loaded and primed.",
+        example=True
+    )
+    models: Dict[str, ModelWarmUp] = Field(
+        description="Warm-up result of every configured model."
+    )
@@ -0,0 +1,42 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from api.models.response_models import LivenessResponse, ReadinessResponse
+from api.state import warm_up
+
+"""
+Router for health endpoints.
+
+/health/live reports that process is up, /health/ready reports ready
+only after all required models were loaded and primed, it recovers when a retried model loads later.
+"""
+
+router = APIRouter(
+    prefix="/health",
+    tags=["Health"]
+)
+
+"""
+Returns liveness status of the process.
+
+Returns:
+    LivenessResponse: JSON object with status field.
+"""
+
+@router.get("/live", response_model=LivenessResponse)
+def get_liveness():
+    return LivenessResponse(status="alive")
+
+"""
+Returns readiness of the process to accept prediction traffic.
+
+Returns:
+    ReadinessResponse: JSON object with ready flag and warm-up result of every model,
+    with 503 status code until warm-up completes successfully.
+"""
+
+@router.get("/ready", response_model=ReadinessResponse)
+def get_readiness():
+    readiness = ReadinessResponse(ready=warm_up.ready(), models=warm_up.report())
+    if not readiness.ready:
+        return JSONResponse(status_code=503, content=readiness.model_dump())
+    return readiness
@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from api.state import metrics
+
+"""
+Router for metrics endpoint.
+
+/metrics exposes pipeline stage and HTTP request latency histograms, cache statistics,
+model load counts and in-flight gauges in Prometheus text format.
+"""
+
+router = APIRouter(
+    tags=["Metrics"]
+)
+
+"""
+Returns metrics in Prometheus text format.
+
+Returns:
+    Response: Prometheus text exposition.
+"""
+
+@router.get("/metrics")
+def get_metrics():
+    return Response(content=metrics.exposition(), media_type=CONTENT_TYPE_LATEST)
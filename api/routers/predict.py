@@ -1,39 +1,438 @@
-from fastapi import APIRouter, HTTPException
-from api.models.response_models import PredictionResponse
-from api.config import Config
+import json
+import logging
+import math
+import os
+import pandas as pd
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from api.models.request_models import BatchPredictionRequest, ScenarioRequest, SimulationRequest
+from api.models.response_models import (
+    PredictionResponse, CacheStatsResponse, BatchPredictionResponse, ForecastResponse, ModelInfo, ModelsResponse,
+    SimulationResponse, ShadowReportResponse
+)
+from api.executor import ExecutorBusyError
+from api.state import config, model_cache, registry, executor, shadow
 from src.predictor import Predictor
 
 """
 Router for prediction endpoints.
 
-Handles /predict requests that return next month's deal count.
+Handles /predict requests that return next month's deal count
+and /predict/batch requests that score many feature rows at once.
+Every model in saved_models is served by name at /predict/{model_name}.
+GET /predict splits traffic between the default model and A/B candidates and evaluates shadow models
+in background after the primary prediction, see ShadowRouter.
+GET /predict?horizon=n forecasts n months ahead by feeding predictions back into lag features.
+POST /predict/scenarios scores a grid of what-if variants of the last feature row block by block with one model version
+and streams predictions back in columnar form.
+POST /predict/simulation returns forecast quantiles over Monte Carlo paths of exogenous features.
+Loaded models are shared between requests through process-wide cache with LRU memory budget.
+Model loading and inference run in a bounded executor configured by DEMAND_PREDICTOR_* variables,
+so the event loop is never blocked.
+Single predictions carry ETag of model artifact fingerprint and Cache-Control headers,
+repeated requests with matching If-None-Match get 304 Not Modified without touching the model.
 """
 
+LOGGER = logging.getLogger("api.predict")
+MAX_HORIZON = 36
+SCENARIO_CHUNK = 8192
+
 router = APIRouter(
     prefix="/predict",
     tags=["Prediction"]
 )
 
 """
-Returns predicted number of deals for next month.
+Checks whether If-None-Match header contains given entity tag.
+"""
+def etag_matches(if_none_match: str|None, etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+"""
+Predicts next month in executor worker unless client already has prediction of current model version.
+Returns ETag and prediction or None if prediction is not modified.
+"""
+def predict_if_modified(model_folder, if_none_match: str|None) -> tuple:
+    predictor = Predictor(model_folder, cache=model_cache, engine=config.engine())
+    etag = f'"{predictor.fingerprint()}"'
+    if etag_matches(if_none_match, etag):
+        return etag, None
+    return etag, predictor.predict()
+
+"""
+Forecasts horizon months in executor worker unless client already has forecast of current model version.
+Returns ETag and (months, predictions) or None if forecast is not modified.
+"""
+def forecast_if_modified(model_folder, horizon: int, if_none_match: str|None) -> tuple:
+    predictor = Predictor(model_folder, cache=model_cache, engine=config.engine())
+    etag = f'"{predictor.fingerprint()}"'
+    if etag_matches(if_none_match, etag):
+        return etag, None
+    forecast = predictor.forecast(horizon)
+    return etag, (forecast['Month'].tolist(), forecast['prediction'].tolist())
+
+"""
+Predicts next month by shadow model in background pool, cached artifacts are shared with served models.
+"""
+def predict_shadow(model_name: str) -> float:
+    return Predictor(registry.folder(model_name), cache=model_cache, engine=config.engine()).predict()
+
+"""
+Loads model and runs one prediction in executor worker to prime native code before traffic.
+"""
+def warm_up_model(model_folder) -> float:
+    return (
+        Predictor(model_folder, cache=model_cache, engine=config.engine())
+        .warm_up()
+    )
+
+"""
+Warms up models in every process worker when it starts and logs failures.
+Error is not raised because failed initializer would break the whole pool, warm-up runs warm_up_model
+in every worker afterwards, so the error is raised there and the model is retried.
+"""
+def warm_up_worker(model_folders: list):
+    for model_folder in model_folders:
+        try:
+            warm_up_model(model_folder)
+        except Exception:
+            LOGGER.exception("Warm-up of %s failed in worker %s", model_folder, os.getpid())
+
+"""
+Replaces non-finite predictions (NaN, infinity) by None, so they are sent as null in JSON.
+"""
+def finite_or_none(values: list) -> list:
+    return [value if math.isfinite(value) else None for value in values]
+
+"""
+Predicts feature rows or stored month range in executor worker.
+Month range with more rows than batch limit is rejected, non-finite predictions are returned as None.
+"""
+def predict_batch(model_folder, features: dict|None, start, end) -> tuple:
+    predictor = Predictor(model_folder, cache=model_cache, engine=config.engine())
+    if features is not None:
+        months = None
+        frame = pd.DataFrame(features)
+    else:
+        frame = predictor.features(start=start, end=end)
+        if len(frame) > config.max_batch_rows():
+            raise ValueError(f"Month range has {len(frame)} rows, limit is {config.max_batch_rows()}")
+        months = [str(month)[:10] for month in frame['Month']]
+    predictions = finite_or_none(predictor.predict_many(frame).tolist()) if len(frame) else []
+    return months, predictions
+
+"""
+Validates batch request size, scores rows in executor and builds response.
+"""
+async def batch_response(model_folder, request: BatchPredictionRequest) -> BatchPredictionResponse:
+    rows = request.rows()
+    if rows is not None and rows > config.max_batch_rows():
+        raise HTTPException(status_code=422, detail=f"Batch has {rows} rows, limit is {config.max_batch_rows()}")
+    months, predictions = await run_inference(
+        predict_batch, model_folder, request.features, request.start_month, request.end_month
+    )
+    return BatchPredictionResponse(months=months, predicted_deals=predictions)
+
+"""
+Scores scenario variants with flat grid positions from start to stop in executor worker.
+Variants are scored by given version folder or by current version if it is None.
+Returns version folder and predictions in grid order, non-finite values become None (null in JSON).
+"""
+def predict_scenario_block(model_folder, version_folder, overrides: dict|None, grid: dict|None,
+                           start: int, stop: int) -> tuple:
+    predictor = Predictor(model_folder, cache=model_cache, engine=config.engine())
+    version_folder = version_folder or predictor.version_folder()
+    predictions = predictor.scenario_block(overrides, grid, start, stop, version_folder=version_folder)
+    return version_folder, finite_or_none(predictions.tolist())
+
+"""
+Yields scenario response as JSON in parts: grid axes first, then predictions block by block.
+Every next block of variants is scored in executor only when the previous one is sent,
+so memory of one request does not grow with the grid. All blocks are scored by the version of the first one.
+Headers are already sent when a later block fails, so the document is closed with error field instead.
+"""
+async def scenario_stream(model_folder, version_folder, request: ScenarioRequest, first: list):
+    grid = request.grid or {}
+    yield json.dumps({"columns": list(grid), "axes": grid, "shape": [len(values) for values in grid.values()]})[:-1]
+    yield ', "predicted_deals": ['
+    yield json.dumps(first)[1:-1]
+    for start in range(SCENARIO_CHUNK, request.size(), SCENARIO_CHUNK):
+        stop = min(start + SCENARIO_CHUNK, request.size())
+        try:
+            _, block = await run_inference(
+                predict_scenario_block, model_folder, version_folder, request.overrides, request.grid, start, stop
+            )
+        except HTTPException as e:
+            yield "], " + json.dumps({"error": {"status_code": e.status_code, "detail": e.detail, "scored": start}})[1:]
+            return
+        yield ", " + json.dumps(block)[1:-1]
+    yield "]}"
+
+"""
+Validates scenario request size, scores the first block of variants and streams all of them back.
+Errors of the first block (unknown model or column) give error status before streaming starts.
+"""
+async def scenario_response(model_folder, request: ScenarioRequest) -> StreamingResponse:
+    if request.size() > config.max_scenarios():
+        raise HTTPException(status_code=422, detail=f"Grid has {request.size()} variants, limit is {config.max_scenarios()}")
+    version_folder, first = await run_inference(
+        predict_scenario_block, model_folder, None, request.overrides, request.grid, 0, min(SCENARIO_CHUNK, request.size())
+    )
+    return StreamingResponse(scenario_stream(model_folder, version_folder, request, first), media_type="application/json")
+
+"""
+Simulates forecast paths in executor worker, returns months, mean and quantiles by percent name.
+"""
+def simulate_forecast(model_folder, horizon: int, paths: int, seed: int|None, quantiles: list) -> tuple:
+    simulation = (
+        Predictor(model_folder, cache=model_cache, engine=config.engine())
+        .simulate(horizon, paths=paths, seed=seed, workers=config.simulation_workers(), quantiles=tuple(quantiles))
+    )
+    percentiles = [column for column in simulation.columns if column not in ('Month', 'mean')]
+    return (
+        simulation['Month'].tolist(),
+        simulation['mean'].tolist(),
+        {column: simulation[column].tolist() for column in percentiles}
+    )
+
+"""
+Validates simulation request size and simulates forecast distribution.
+"""
+async def simulation_response(model_folder, request: SimulationRequest) -> SimulationResponse:
+    if request.horizon > MAX_HORIZON:
+        raise HTTPException(status_code=422, detail=f"Horizon {request.horizon} exceeds limit {MAX_HORIZON}")
+    if request.paths > config.max_simulation_paths():
+        raise HTTPException(status_code=422, detail=f"{request.paths} paths requested, limit is {config.max_simulation_paths()}")
+    months, mean, quantiles = await run_inference(
+        simulate_forecast, model_folder, request.horizon, request.paths, request.seed, request.quantiles
+    )
+    return SimulationResponse(months=months, paths=request.paths, mean=mean, quantiles=quantiles)
+
+"""
+Runs job in executor and converts its errors to HTTP errors.
+"""
+async def run_inference(function, *args):
+    try:
+        return await executor.run(function, *args)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ExecutorBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except TimeoutError:
+        raise HTTPException(status_code=504, detail="Prediction timed out")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
+
+"""
+Builds prediction or forecast response with caching headers or 304 response if model version is not modified.
+If primary model name is given, next month prediction is also sent to shadow models in background.
+"""
+async def conditional_prediction(model_folder, if_none_match: str|None, horizon: int|None = None,
+                                 primary: str|None = None) -> Response:
+    if horizon is None:
+        etag, prediction = await run_inference(predict_if_modified, model_folder, if_none_match)
+    else:
+        etag, prediction = await run_inference(forecast_if_modified, model_folder, horizon, if_none_match)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={config.cache_max_age()}, must-revalidate"}
+    if prediction is None:
+        return Response(status_code=304, headers=headers)
+    if horizon is None:
+        if primary is not None and shadow.shadows():
+            shadow.submit(predict_shadow, primary, prediction)
+        content = PredictionResponse(predicted_deals=int(prediction)).model_dump()
+    else:
+        months, predictions = prediction
+        content = ForecastResponse(months=months, predicted_deals=predictions).model_dump()
+    return JSONResponse(content=content, headers=headers)
+
+"""
+Gives folder of default model or of model with given name.
+"""
+def model_folder(model_name: str|None = None):
+    try:
+        return config.model() if model_name is None else registry.folder(model_name)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+"""
+Returns predicted number of deals for next month or, if horizon is given, for horizon months ahead.
+With A/B split request goes to the default model or to a candidate chosen by X-Client-ID (randomly without it),
+served model is named in X-Model-Variant header. Requests served by the default model feed shadow models.
 
 Returns:
-    PredictionResponse: JSON object with predicted_deals field.
+    PredictionResponse: JSON object with predicted_deals field and ETag header,
+    ForecastResponse: JSON object with months and predicted_deals lists if horizon is given,
+    or empty 304 response if If-None-Match matches current model version.
 
 Raises:
-    HTTPException: If model or data files are missing or prediction fails.
+    HTTPException: If model or data files are missing, model cannot forecast horizon, executor is busy or prediction fails.
 """
 
-@router.get("/", response_model=PredictionResponse)
-def get_prediction():
+@router.get("/", response_model=PredictionResponse|ForecastResponse)
+async def get_prediction(
+    horizon: int|None = Query(default=None, ge=1, le=MAX_HORIZON),
+    if_none_match: str|None = Header(default=None),
+    x_client_id: str|None = Header(default=None)
+):
+    variant = shadow.variant(x_client_id)
+    folder = model_folder(variant)
+    response = await conditional_prediction(folder, if_none_match, horizon, primary=folder.name if variant is None else None)
+    response.headers["X-Model-Variant"] = folder.name
+    if shadow.splits():
+        response.headers["Vary"] = "X-Client-ID"
+    return response
+
+"""
+Returns predicted number of deals for many feature rows in one model call.
+Rows are given in columnar form or selected from stored features by month range.
+
+Returns:
+    BatchPredictionResponse: JSON object with months and predicted_deals lists.
+
+Raises:
+    HTTPException: If model files are missing, features have wrong columns, executor is busy or prediction fails.
+"""
+
+@router.post("/batch", response_model=BatchPredictionResponse)
+async def post_batch_prediction(request: BatchPredictionRequest):
+    return await batch_response(model_folder(), request)
+
+"""
+Returns predictions for what-if variants of the last feature row.
+Columns can be given by feature name or by raw data column name.
+
+Returns:
+    StreamingResponse: JSON object with columns (grid column order), axes (grid values), shape
+    and predicted_deals flat list in row-major grid order.
+
+Raises:
+    HTTPException: If model files are missing, columns are unknown, grid is too large, executor is busy or prediction fails.
+"""
+
+@router.post("/scenarios")
+async def post_scenarios(request: ScenarioRequest):
+    return await scenario_response(model_folder(), request)
+
+"""
+Returns distribution of forecast simulated over random paths of exogenous features.
+Paths move by historical month-over-month changes, all paths of one month are predicted in one model call.
+
+Returns:
+    SimulationResponse: JSON object with months, paths, mean and quantiles of predicted deals.
+
+Raises:
+    HTTPException: If model files are missing, model cannot forecast horizon, request is too large,
+    executor is busy or simulation fails.
+"""
+
+@router.post("/simulation", response_model=SimulationResponse)
+async def post_simulation(request: SimulationRequest):
+    return await simulation_response(model_folder(), request)
+
+"""
+Returns comparison of shadow models with the default model and time spent scheduling them on the request path.
+
+Returns:
+    ShadowReportResponse: JSON object with statistics of every shadow model, pending evaluations and scheduling time.
+"""
+
+@router.get("/shadow", response_model=ShadowReportResponse)
+def get_shadow_report():
+    return ShadowReportResponse(**shadow.report())
+
+"""
+Returns hit and miss counters of the model cache.
+With process executor counters of worker processes are not included.
+
+Returns:
+    CacheStatsResponse: JSON object with hits, misses, evictions and size fields.
+"""
+
+@router.get("/cache", response_model=CacheStatsResponse)
+def get_cache_stats():
+    return CacheStatsResponse(**model_cache.stats())
+
+"""
+Returns all available models with their residency, size and load time.
+
+Returns:
+    ModelsResponse: JSON object with models list.
+
+Raises:
+    HTTPException: If models folder is missing.
+"""
+
+@router.get("/models", response_model=ModelsResponse)
+def get_models():
     try:
-        config = Config()
-        prediction = int(
-            Predictor(config.model())
-            .predict()
-        )
-        return PredictionResponse(predicted_deals=prediction)
+        return ModelsResponse(models=[ModelInfo(**info) for info in registry.report()])
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
\ No newline at end of file
+
+"""
+Returns predicted number of deals for next month or horizon months ahead by model with given name.
+
+Returns:
+    PredictionResponse: JSON object with predicted_deals field and ETag header,
+    ForecastResponse: JSON object with months and predicted_deals lists if horizon is given,
+    or empty 304 response if If-None-Match matches current model version.
+
+Raises:
+    HTTPException: If model is not found, model cannot forecast horizon, executor is busy or prediction fails.
+"""
+
+@router.get("/{model_name}", response_model=PredictionResponse|ForecastResponse)
+async def get_model_prediction(
+    model_name: str,
+    horizon: int|None = Query(default=None, ge=1, le=MAX_HORIZON),
+    if_none_match: str|None = Header(default=None)
+):
+    return await conditional_prediction(model_folder(model_name), if_none_match, horizon)
+
+"""
+Returns batch predictions by model with given name.
+
+Returns:
+    BatchPredictionResponse: JSON object with months and predicted_deals lists.
+
+Raises:
+    HTTPException: If model is not found, features have wrong columns, executor is busy or prediction fails.
+"""
+
+@router.post("/{model_name}/batch", response_model=BatchPredictionResponse)
+async def post_model_batch_prediction(model_name: str, request: BatchPredictionRequest):
+    return await batch_response(model_folder(model_name), request)
+
+"""
+Returns predictions for what-if variants of the last feature row by model with given name.
+
+Returns:
+    StreamingResponse: JSON object with columns, axes, shape and predicted_deals in row-major grid order.
+
+Raises:
+    HTTPException: If model is not found, columns are unknown, grid is too large, executor is busy or prediction fails.
+"""
+
+@router.post("/{model_name}/scenarios")
+async def post_model_scenarios(model_name: str, request: ScenarioRequest):
+    return await scenario_response(model_folder(model_name), request)
+
+"""
+Returns distribution of forecast simulated over random feature paths by model with given name.
+
+Returns:
+    SimulationResponse: JSON object with months, paths, mean and quantiles of predicted deals.
+
+Raises:
+    HTTPException: If model is not found, model cannot forecast horizon, request is too large,
+    executor is busy or simulation fails.
+"""
+
+@router.post("/{model_name}/simulation", response_model=SimulationResponse)
+async def post_model_simulation(model_name: str, request: SimulationRequest):
+    return await simulation_response(model_folder(model_name), request)
@@ -0,0 +1,166 @@
+import json
+import logging
+import random
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+"""
+Shadow and A/B routing of prediction traffic.
+A/B split sends configured share of requests to candidate models, assignment is stable per client key
+(same key always gets the same variant) and random for requests without key.
+Shadow models are evaluated for requests served by the primary model in a separate background pool after
+the primary prediction is made: the request only enqueues jobs, never waits for them, and jobs beyond
+queue limit are dropped instead of delaying anything. Paired predictions are logged as JSON lines
+and summarized per shadow model, time spent scheduling on the request path is measured.
+
+Example:
+    shadow = ShadowRouter(split={"xgb_candidate": 0.1}, shadows=["xgb_candidate"], workers=1, queue=64)
+    variant = shadow.variant(client_id)
+    shadow.submit(predict_shadow, "xgb_model", 1669.0)
+    shadow.report()
+"""
+
+class ShadowRouter:
+
+    LOGGER = logging.getLogger("api.shadow")
+
+    def __init__(self, split: dict, shadows: list, workers: int = 1, queue: int = 64):
+        if sum(split.values()) > 1 or any(share < 0 for share in split.values()):
+            raise ValueError(f"A/B shares must be non-negative and sum to at most 1, got {split}")
+        self.__split = dict(split)
+        self.__shadows = list(shadows)
+        self.__workers = workers
+        self.__queue = queue
+        self.__pool = None
+        self.__pending = 0
+        self.__lock = threading.Lock()
+        self.__stats = {name: self.__empty_stats() for name in self.__shadows}
+        self.__submits = 0
+        self.__submit_seconds = 0.0
+        self.__submit_max_seconds = 0.0
+
+    """
+    Returns names of shadow models.
+    """
+    def shadows(self) -> list:
+        return list(self.__shadows)
+
+    """
+    Checks that A/B split is configured.
+    """
+    def splits(self) -> bool:
+        return bool(self.__split)
+
+    """
+    Returns candidate model for request or None if request goes to the primary model.
+    Client key is hashed into [0, 1) and shares of candidates are laid out one after another.
+    """
+    def variant(self, key: str|None = None) -> str|None:
+        if not self.__split:
+            return None
+        point = random.random() if key is None else zlib.crc32(key.encode('utf-8')) / 2**32
+        for name, share in self.__split.items():
+            if point < share:
+                return name
+            point -= share
+        return None
+
+    """
+    Enqueues evaluation of every shadow model against primary prediction and returns at once.
+    Function is called in background pool with shadow model name and returns its prediction.
+    """
+    def submit(self, function: Callable[[str], float], primary: str, prediction: float):
+        started = time.perf_counter()
+        for name in self.__shadows:
+            if name == primary:
+                continue
+            with self.__lock:
+                if self.__pending >= self.__workers + self.__queue:
+                    self.__stats[name]['dropped'] += 1
+                    continue
+                self.__pending += 1
+            self.__executor().submit(self.__evaluate, function, name, primary, prediction)
+        elapsed = time.perf_counter() - started
+        with self.__lock:
+            self.__submits += 1
+            self.__submit_seconds += elapsed
+            self.__submit_max_seconds = max(self.__submit_max_seconds, elapsed)
+
+    """
+    Returns comparison of every shadow model with the primary model and scheduling cost on the request path.
+    """
+    def report(self) -> dict:
+        with self.__lock:
+            shadows = {}
+            for name, stats in self.__stats.items():
+                pairs = stats['pairs']
+                shadows[name] = {
+                    'pairs': pairs,
+                    'errors': stats['errors'],
+                    'dropped': stats['dropped'],
+                    'mean_diff': stats['diff'] / pairs if pairs else None,
+                    'mean_abs_diff': stats['abs_diff'] / pairs if pairs else None,
+                    'mean_seconds': stats['seconds'] / (pairs + stats['errors']) if pairs + stats['errors'] else None
+                }
+            return {
+                'shadows': shadows,
+                'pending': self.__pending,
+                'submits': self.__submits,
+                'submit_mean_seconds': self.__submit_seconds / self.__submits if self.__submits else None,
+                'submit_max_seconds': self.__submit_max_seconds
+            }
+
+    """
+    Stops background pool without waiting for shadow jobs.
+    """
+    def shutdown(self):
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=False, cancel_futures=True)
+            self.__pool = None
+
+    """
+    Runs one shadow model, logs prediction pair and updates comparison statistics.
+    """
+    def __evaluate(self, function: Callable[[str], float], name: str, primary: str, prediction: float):
+        started = time.perf_counter()
+        try:
+            shadow_prediction = float(function(name))
+        except Exception as e:
+            with self.__lock:
+                self.__stats[name]['errors'] += 1
+                self.__stats[name]['seconds'] += time.perf_counter() - started
+                self.__pending -= 1
+            self.LOGGER.warning("Shadow model %s failed: %s", name, e)
+            return
+        seconds = time.perf_counter() - started
+        with self.__lock:
+            stats = self.__stats[name]
+            stats['pairs'] += 1
+            stats['diff'] += shadow_prediction - prediction
+            stats['abs_diff'] += abs(shadow_prediction - prediction)
+            stats['seconds'] += seconds
+            self.__pending -= 1
+        self.LOGGER.info(json.dumps({
+            'primary': primary,
+            'shadow': name,
+            'primary_prediction': prediction,
+            'shadow_prediction': shadow_prediction,
+            'shadow_seconds': seconds
+        }))
+
+    """
+    Creates background pool on first use.
+    """
+    def __executor(self) -> ThreadPoolExecutor:
+        if self.__pool is None:
+            self.__pool = ThreadPoolExecutor(max_workers=self.__workers, thread_name_prefix="shadow")
+        return self.__pool
+
+    """
+    Returns zero comparison statistics of one shadow model.
+    """
+    def __empty_stats(self) -> dict:
+        return {'pairs': 0, 'errors': 0, 'dropped': 0, 'diff': 0.0, 'abs_diff': 0.0, 'seconds': 0.0}
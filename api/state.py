@@ -0,0 +1,30 @@
+from api.config import Config
+from api.executor import InferenceExecutor
+from api.metrics import Metrics
+from api.shadow import ShadowRouter
+from api.warmup import WarmUp
+from src.model_cache import ModelCache
+from src.model_registry import ModelRegistry
+
+"""
+Process-wide objects shared by API routers: settings, model cache, model registry,
+inference executor, shadow and A/B router, warm-up state and metrics.
+"""
+
+config = Config()
+model_cache = ModelCache(max_bytes=config.cache_bytes())
+registry = ModelRegistry(config.models(), cache=model_cache)
+executor = InferenceExecutor(
+    kind=config.executor_kind(),
+    workers=config.executor_workers(),
+    queue=config.executor_queue(),
+    timeout=config.executor_timeout()
+)
+shadow = ShadowRouter(
+    split=config.ab_split(),
+    shadows=config.shadow_models(),
+    workers=config.shadow_workers(),
+    queue=config.shadow_queue()
+)
+warm_up = WarmUp(timeout=config.warmup_timeout(), backoff=config.warmup_backoff())
+metrics = Metrics(model_cache, executor, shadow)
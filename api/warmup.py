@@ -0,0 +1,76 @@
+import asyncio
+import time
+from typing import Callable
+
+"""
+Warm-up of models before API accepts traffic.
+Starts inference workers, loads every configured model and runs one prediction through it in every inference worker,
+then reports readiness and time spent on every model. A model is warmed up only when every worker primed it.
+Warm-up has its own timeout (none by default), so a cold import of a large model is not cut by the request timeout.
+Failed models are retried in background with exponential backoff, so readiness recovers once a model loads.
+Optional models (shadow and A/B candidates) are warmed after required ones and never block readiness.
+
+Example:
+    warm_up = WarmUp(timeout=None, retries=None, backoff=1.0)
+    await warm_up.run(executor, warm_up_model, {"xgb_model": Path("saved_models/xgb_model")}, optional=["xgb_candidate"])
+    warm_up.ready()
+"""
+
+class WarmUp:
+
+    def __init__(self, timeout: float|None = None, retries: int|None = None, backoff: float = 1.0, max_backoff: float = 60.0):
+        self.__timeout = timeout
+        self.__retries = retries
+        self.__backoff = backoff
+        self.__max_backoff = max_backoff
+        self.__required = set()
+        self.__report = {}
+
+    """
+    Warms up every model folder one by one and records time or error for each, required models first.
+    Failed models are retried after backoff until they load or retries are spent (None retries forever).
+    """
+    async def run(self, executor, function: Callable, model_folders: dict, optional: list|tuple = ()):
+        self.__required = {name for name in model_folders if name not in optional}
+        self.__report = {}
+        await executor.start()
+        pending = sorted(model_folders, key=lambda name: name not in self.__required)
+        attempt = 0
+        while True:
+            for name in pending:
+                await self.__warm(executor, function, name, model_folders[name])
+            pending = [name for name in pending if self.__report[name]['error'] is not None]
+            if not pending or (self.__retries is not None and attempt >= self.__retries):
+                return
+            await asyncio.sleep(min(self.__backoff * 2 ** attempt, self.__max_backoff))
+            attempt += 1
+
+    """
+    Returns True when every required model was primed without errors.
+    """
+    def ready(self) -> bool:
+        return all(name in self.__report and self.__report[name]['error'] is None for name in self.__required)
+
+    """
+    Returns warm-up time, error, attempts and requirement of every model.
+    """
+    def report(self) -> dict:
+        return {name: dict(entry) for name, entry in self.__report.items()}
+
+    """
+    Runs one warm-up attempt of model in every worker and records its result, error of any worker fails the attempt.
+    """
+    async def __warm(self, executor, function: Callable, name: str, model_folder):
+        attempts = self.__report.get(name, {}).get('attempts', 0) + 1
+        started = time.perf_counter()
+        try:
+            await executor.run_on_workers(function, model_folder, timeout=self.__timeout)
+            error = None
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        self.__report[name] = {
+            'seconds': time.perf_counter() - started,
+            'error': error,
+            'attempts': attempts,
+            'required': name in self.__required
+        }
@@ -1,7 +1,4 @@
 import argparse
-from xgboost import XGBRegressor
-from scripts.predict_target import predict_target
-from scripts.save_model import save_model
 
 """
 Main CLI for DemandPredictor project. You can write only one string to run scripts. Just copy one of the line below to the terminal.
@@ -9,20 +6,29 @@ Main CLI for DemandPredictor project. You can write only one string to run scrip
 Usage examples:
     python main.py predict --model_folder saved_models/xgb_model
     python main.py train --data_path data/raw_data.csv --target Deals --models_folder_path saved_models --model_name xgb_model
+    python main.py train --data_path data/raw_data.csv --target Deals --models_folder_path saved_models --model_name xgb_model --model_format ubj
+
+Every subcommand imports only what it needs: predict reads saved prediction without NumPy, pandas, sklearn or XGBoost,
+training stack is imported only by train.
 """
 
 def run_predict(model_folder: str):
+    from scripts.predict_target import predict_target
     result = predict_target(model_folder=model_folder)
     print(f"Predicted deals for next month: {int(result)}")
 
-def run_train(data_path: str, target: str, models_folder_path: str, model_name: str):
+def run_train(data_path: str, target: str, models_folder_path: str, model_name: str, model_format: str, features_csv: bool):
+    from xgboost import XGBRegressor
+    from scripts.save_model import save_model
     model = XGBRegressor()
     save_path = save_model(
         model=model,
         data_path=data_path,
         target=target,
         models_folder_path=models_folder_path,
-        model_name=model_name
+        model_name=model_name,
+        model_format=model_format,
+        features_csv=features_csv
     )
     print(f"Model trained and saved to: {save_path}")
 
@@ -38,10 +44,12 @@ if __name__ == "__main__":
     train_parser.add_argument("--target", type=str, required=True, help="Target column name")
     train_parser.add_argument("--models_folder_path", type=str, required=True, help="Folder to save models")
     train_parser.add_argument("--model_name", type=str, required=True, help="Model name to save")
+    train_parser.add_argument("--model_format", type=str, default="joblib", choices=["joblib", "ubj", "json"], help="Model artifact format")
+    train_parser.add_argument("--features_csv", action="store_true", help="Also save features.csv for debugging")
 
     args = parser.parse_args()
 
     if args.command == "predict":
         run_predict(args.model_folder)
     elif args.command == "train":
-        run_train(args.data_path, args.target, args.models_folder_path, args.model_name)
\ No newline at end of file
+        run_train(args.data_path, args.target, args.models_folder_path, args.model_name, args.model_format, args.features_csv)
\ No newline at end of file
@@ -0,0 +1,299 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+import httpx
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+if __name__ == "__main__":
+    sys.path.append(str(ROOT))
+
+"""
+Load-testing and latency benchmark for the API.
+Starts api.main:app in-process (ASGI transport, no network) or as local uvicorn, or targets running server by URL,
+waits for readiness and drives closed-loop concurrent load against prediction endpoints with async HTTP client.
+Reports throughput, p50/p95/p99 latency and error rate per scenario as JSON and compares them with stored baseline.
+With shadow models given, every scenario is measured with shadow evaluation off and on and primary request latency
+of both runs is compared, so cost of shadow work running next to primary requests is measured, not assumed.
+
+Example:
+    python scripts/benchmark_api.py --scenarios predict batch --concurrency 16 --requests 2000 --output report.json
+    python scripts/benchmark_api.py --mode uvicorn --workers 4 --baseline baseline.json
+    python scripts/benchmark_api.py --url http://127.0.0.1:8000 --duration 30
+    python scripts/benchmark_api.py --scenarios predict --shadow xgb_testing_model --tolerance 0.05
+"""
+
+SCENARIOS = {
+    'predict': ('GET', '/predict/', None),
+    'batch': ('POST', '/predict/batch', {'start_month': '2024-08-01', 'end_month': '2025-08-01'}),
+    'forecast': ('GET', '/predict/?horizon={horizon}', None),
+    'models': ('GET', '/predict/models', None),
+    'simulation': ('POST', '/predict/simulation', {'horizon': 1, 'paths': 10000, 'seed': 0})
+}
+LOWER_IS_BETTER = ('p50_ms', 'p95_ms', 'p99_ms')
+HIGHER_IS_BETTER = ('throughput_rps',)
+
+"""
+Gives HTTP client for app started in the same process through ASGI transport, lifespan included.
+If shadow models are given (empty list turns shadow evaluation off), prediction routes use shadow router
+with these models instead of configured one while the client is open.
+"""
+@asynccontextmanager
+async def inprocess_client(shadows: list|None = None):
+    from api.main import app
+    from api.routers import predict
+    from api.shadow import ShadowRouter
+    from api.state import config
+    configured = predict.shadow
+    if shadows is not None:
+        predict.shadow = ShadowRouter(
+            split=config.ab_split(), shadows=shadows, workers=config.shadow_workers(), queue=config.shadow_queue()
+        )
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+                yield client
+    finally:
+        if predict.shadow is not configured:
+            predict.shadow.shutdown()
+            predict.shadow = configured
+
+"""
+Gives HTTP client for app started as local uvicorn process on a free port.
+If shadow models are given (empty list turns shadow evaluation off), they are set in DEMAND_PREDICTOR_SHADOW.
+"""
+@asynccontextmanager
+async def uvicorn_client(workers: int, shadows: list|None = None):
+    env = dict(os.environ)
+    if shadows is not None:
+        env["DEMAND_PREDICTOR_SHADOW"] = ",".join(shadows)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=ROOT,
+        env=env
+    )
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+            yield client
+    finally:
+        process.terminate()
+        process.wait()
+
+"""
+Gives HTTP client for already running server.
+"""
+@asynccontextmanager
+async def url_client(url: str):
+    async with httpx.AsyncClient(base_url=url) as client:
+        yield client
+
+"""
+Polls readiness endpoint until the app is ready or timeout expires. Returns readiness.
+"""
+async def wait_ready(client: httpx.AsyncClient, timeout: float) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if (await client.get("/health/ready")).status_code == 200:
+                return True
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    return False
+
+"""
+Returns value at percentile q of sorted values (nearest rank).
+"""
+def percentile(values: list, q: float) -> float|None:
+    if not values:
+        return None
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+"""
+Sends requests of one scenario from concurrent workers until request count or duration is reached.
+Any status from 400 up and transport errors count as errors.
+"""
+async def run_scenario(client: httpx.AsyncClient, method: str, path: str, body: dict|None,
+                       concurrency: int, requests: int, duration: float|None) -> dict:
+    latencies, statuses = [], Counter()
+    remaining = requests
+    started = time.perf_counter()
+    deadline = None if duration is None else started + duration
+
+    async def worker():
+        nonlocal remaining
+        while (remaining > 0 if deadline is None else time.perf_counter() < deadline):
+            remaining -= 1
+            sent = time.perf_counter()
+            try:
+                status = str((await client.request(method, path, json=body)).status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - sent)
+            statuses[status] += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    errors = sum(count for status, count in statuses.items() if not (status.isdigit() and int(status) < 400))
+    return {
+        'method': method,
+        'path': path,
+        'requests': len(latencies),
+        'concurrency': concurrency,
+        'duration_s': elapsed,
+        'throughput_rps': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000 if latencies else None,
+        'p95_ms': percentile(latencies, 95) * 1000 if latencies else None,
+        'p99_ms': percentile(latencies, 99) * 1000 if latencies else None,
+        'mean_ms': sum(latencies) / len(latencies) * 1000 if latencies else None,
+        'max_ms': latencies[-1] * 1000 if latencies else None,
+        'error_rate': errors / len(latencies) if latencies else 0.0,
+        'statuses': dict(statuses)
+    }
+
+"""
+Gives client of in-process app, local uvicorn or server URL with given shadow models (None keeps configured ones).
+Shadow models of running server can not be changed.
+"""
+def app_client(mode: str, url: str|None, workers: int, shadows: list|None = None):
+    if url is not None:
+        if shadows is not None:
+            raise ValueError("Shadow comparison needs app started by benchmark, not server URL")
+        return url_client(url)
+    if mode == 'uvicorn':
+        return uvicorn_client(workers, shadows)
+    return inprocess_client(shadows)
+
+"""
+Waits for readiness and runs benchmark scenarios one after another.
+Warm-up requests of every scenario are sent before measuring and are not reported.
+"""
+async def run_scenarios(client: httpx.AsyncClient, scenarios: list, concurrency: int, requests: int,
+                        duration: float|None, warmup: int, horizon: int, ready_timeout: float) -> tuple:
+    ready = await wait_ready(client, ready_timeout)
+    results = {}
+    for name in scenarios:
+        method, path, body = SCENARIOS[name]
+        path = path.format(horizon=horizon)
+        await run_scenario(client, method, path, body, min(concurrency, warmup) or 1, warmup, None)
+        results[name] = await run_scenario(client, method, path, body, concurrency, requests, duration)
+    return ready, results
+
+"""
+Runs benchmark scenarios one after another against in-process app, local uvicorn or server URL.
+If shadow models are given, scenarios are run with shadow evaluation off (reported as scenarios) and on
+(reported under shadow with shadow report of the app), and latency with shadow on is compared to latency without it.
+"""
+async def benchmark_api(scenarios: list, concurrency: int = 8, requests: int = 500, duration: float|None = None,
+                        warmup: int = 20, horizon: int = 6, mode: str = 'inprocess', url: str|None = None,
+                        workers: int = 1, ready_timeout: float = 60.0, shadows: list|None = None,
+                        tolerance: float = 0.1) -> dict:
+    if url is not None:
+        target = url
+    elif mode == 'uvicorn':
+        target = f"uvicorn x{workers}"
+    else:
+        target = "inprocess"
+    report = {'target': target, 'concurrency': concurrency}
+    async with app_client(mode, url, workers, None if shadows is None else []) as client:
+        report['ready'], report['scenarios'] = await run_scenarios(
+            client, scenarios, concurrency, requests, duration, warmup, horizon, ready_timeout
+        )
+    if shadows is None:
+        return report
+    async with app_client(mode, url, workers, shadows) as client:
+        ready, results = await run_scenarios(client, scenarios, concurrency, requests, duration, warmup, horizon, ready_timeout)
+        shadow_report = (await client.get("/predict/shadow")).json()
+    report['ready'] = report['ready'] and ready
+    report['shadow'] = {
+        'models': list(shadows),
+        'scenarios': results,
+        'report': shadow_report,
+        'comparison': compare({'scenarios': results}, report, tolerance=tolerance)
+    }
+    return report
+
+"""
+Compares report with baseline report scenario by scenario.
+Latency above baseline or throughput below baseline by more than tolerance
+and error rate above baseline by more than error_tolerance are regressions.
+"""
+def compare(report: dict, baseline: dict, tolerance: float = 0.1, error_tolerance: float = 0.01) -> dict:
+    comparison = {'regression': False, 'scenarios': {}}
+    for name, current in report['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if previous is None:
+            continue
+        metrics = {}
+        for metric in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            if current.get(metric) is None or not previous.get(metric):
+                continue
+            change = current[metric] / previous[metric] - 1
+            worse = change > tolerance if metric in LOWER_IS_BETTER else change < -tolerance
+            metrics[metric] = {'current': current[metric], 'baseline': previous[metric], 'change': change, 'regression': worse}
+        error_change = current['error_rate'] - previous['error_rate']
+        metrics['error_rate'] = {
+            'current': current['error_rate'],
+            'baseline': previous['error_rate'],
+            'change': error_change,
+            'regression': error_change > error_tolerance
+        }
+        comparison['scenarios'][name] = metrics
+        comparison['regression'] |= any(metric['regression'] for metric in metrics.values())
+    return comparison
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DemandPredictor API load test")
+    parser.add_argument("--scenarios", nargs="+", default=["predict", "batch"], choices=list(SCENARIOS), help="Endpoints to load")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds per scenario instead of request count")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per scenario")
+    parser.add_argument("--horizon", type=int, default=6, help="Horizon of forecast scenario")
+    parser.add_argument("--mode", default="inprocess", choices=["inprocess", "uvicorn"], help="How to start the app")
+    parser.add_argument("--workers", type=int, default=1, help="Uvicorn workers in uvicorn mode")
+    parser.add_argument("--url", default=None, help="Benchmark running server instead of starting the app")
+    parser.add_argument("--baseline", default=None, help="Baseline report to compare with")
+    parser.add_argument("--shadow", nargs="+", default=None, help="Shadow models to measure primary latency with and without")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed relative latency and throughput change")
+    parser.add_argument("--output", default=None, help="File to write JSON report to")
+    args = parser.parse_args()
+
+    result = asyncio.run(benchmark_api(
+        scenarios=args.scenarios,
+        concurrency=args.concurrency,
+        requests=args.requests,
+        duration=args.duration,
+        warmup=args.warmup,
+        horizon=args.horizon,
+        mode=args.mode,
+        url=args.url,
+        workers=args.workers,
+        shadows=args.shadow,
+        tolerance=args.tolerance
+    ))
+    if args.baseline is not None:
+        with open(args.baseline, encoding="utf-8") as file:
+            result['comparison'] = compare(result, json.load(file), tolerance=args.tolerance)
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    print(text)
+    regression = result.get('comparison', {}).get('regression') or result.get('shadow', {}).get('comparison', {}).get('regression')
+    sys.exit(1 if regression else 0)
@@ -0,0 +1,66 @@
+import sys
+import time
+import numpy as np
+from xgboost import XGBRegressor
+from pathlib import Path
+
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).parent.parent))
+
+from src.features import Features
+from src.rawdata import RawData
+from src.tree_evaluator import TreeEvaluator
+
+"""
+Compares latency of XGBoost model.predict with TreeEvaluator for 1, 100 and 100k rows.
+Model is trained on project data, benchmark rows are sampled from its features.
+"""
+
+def benchmark_tree_evaluator(data_path:str, target:str, rows:tuple=(1, 100, 100_000), seed:int=0) -> list:
+    raw_data = RawData(data_path)
+    features = (
+        Features(
+            raw_data
+            .make_features()
+        )
+        .add_sin_seasonality(period=12)
+        .add_cos_seasonality(period=12)
+        .prepare_data()
+    )
+    target_values = raw_data.target(target)
+    months = sorted(set(features['Month']) & set(target_values['Month']))
+    x = features[features['Month'].isin(months)].drop(columns=['Month']).to_numpy(dtype=np.float32)
+    y = target_values[target_values['Month'].isin(months)].iloc[:, 1].to_numpy()
+    model = XGBRegressor().fit(x, y)
+    evaluator = TreeEvaluator.from_model(model)
+    rng = np.random.default_rng(seed)
+    report = []
+    for count in rows:
+        sample = x[rng.integers(0, len(x), size=count)]
+        repeats = max(5, min(1000, 100_000 // count))
+        xgboost_seconds = measure(lambda: model.predict(sample), repeats)
+        numpy_seconds = measure(lambda: evaluator.predict(sample), repeats)
+        report.append({
+            'rows': count,
+            'xgboost_ms': xgboost_seconds * 1000,
+            'numpy_ms': numpy_seconds * 1000,
+            'speedup': xgboost_seconds / numpy_seconds,
+            'max_abs_diff': float(np.max(np.abs(model.predict(sample) - evaluator.predict(sample))))
+        })
+    return report
+
+def measure(function, repeats:int) -> float:
+    function()
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings))
+
+if __name__ == "__main__":
+    for line in benchmark_tree_evaluator(data_path="../data/raw_data.csv", target="Deals"):
+        print(
+            f"{line['rows']:>7} rows: xgboost {line['xgboost_ms']:.3f} ms, numpy {line['numpy_ms']:.3f} ms, "
+            f"speedup {line['speedup']:.1f}x, max diff {line['max_abs_diff']:.2e}"
+        )
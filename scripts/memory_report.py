@@ -0,0 +1,113 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import httpx
+import psutil
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+"""
+Memory report of API server processes: resident, unique and shared memory of the server and every worker.
+Unique set size (USS) is memory that would be freed if the process exited, the rest of resident memory is shared
+with other processes (memory-mapped model and feature files, shared libraries). Proportional set size (PSS, Linux only)
+splits shared pages between processes, so sum of PSS is real memory taken by the whole server.
+Starts local uvicorn with given number of workers and inference engine or inspects running server by PID.
+
+Example:
+    python scripts/memory_report.py --workers 4 --engine numpy
+    python scripts/memory_report.py --pid 12345
+"""
+
+"""
+Returns memory of one process in bytes.
+"""
+def process_memory(process: psutil.Process) -> dict:
+    info = process.memory_full_info()
+    return {
+        'pid': process.pid,
+        'command': " ".join(process.cmdline()[-4:]),
+        'rss': info.rss,
+        'uss': info.uss,
+        'pss': getattr(info, 'pss', None),
+        'shared': info.rss - info.uss
+    }
+
+"""
+Returns memory of server process and all its worker processes with totals.
+Total RSS counts shared pages once in every process that maps them, total PSS counts them once.
+"""
+def memory_report(pid: int) -> dict:
+    server = psutil.Process(pid)
+    processes = []
+    for process in [server] + server.children(recursive=True):
+        try:
+            processes.append(process_memory(process))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    pss = [entry['pss'] for entry in processes]
+    return {
+        'processes': processes,
+        'total_rss': sum(entry['rss'] for entry in processes),
+        'total_uss': sum(entry['uss'] for entry in processes),
+        'total_pss': None if None in pss else sum(pss),
+        'total_shared': sum(entry['shared'] for entry in processes)
+    }
+
+"""
+Polls readiness endpoint until server is ready or timeout expires. Returns readiness.
+"""
+def wait_ready(url: str, timeout: float) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(f"{url}/health/ready").status_code == 200:
+                return True
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    return False
+
+"""
+Starts uvicorn with workers, waits until models are loaded, sends requests so every worker predicts
+and returns memory report of the server.
+"""
+def serve_and_report(workers: int, engine: str, port: int, requests: int, settle: float, ready_timeout: float) -> dict:
+    env = dict(os.environ, DEMAND_PREDICTOR_ENGINE=engine)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=ROOT, env=env
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        ready = wait_ready(url, ready_timeout)
+        for _ in range(requests):
+            httpx.get(f"{url}/predict/")
+        time.sleep(settle)
+        report = memory_report(process.pid)
+    finally:
+        process.terminate()
+        process.wait()
+    report.update({'workers': workers, 'engine': engine, 'ready': ready})
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DemandPredictor API memory report")
+    parser.add_argument("--pid", type=int, default=None, help="Inspect running server instead of starting one")
+    parser.add_argument("--workers", type=int, default=2, help="Uvicorn workers to start")
+    parser.add_argument("--engine", default="numpy", choices=["xgboost", "numpy"], help="Inference engine of started server")
+    parser.add_argument("--port", type=int, default=8765, help="Port of started server")
+    parser.add_argument("--requests", type=int, default=20, help="Prediction requests sent before measuring")
+    parser.add_argument("--settle", type=float, default=1.0, help="Seconds to wait after requests before measuring")
+    parser.add_argument("--ready-timeout", type=float, default=60.0, help="Seconds to wait for readiness")
+    args = parser.parse_args()
+
+    if args.pid is not None:
+        result = memory_report(args.pid)
+    else:
+        result = serve_and_report(args.workers, args.engine, args.port, args.requests, args.settle, args.ready_timeout)
+    print(json.dumps(result, indent=2))
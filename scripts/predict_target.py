@@ -1,10 +1,26 @@
 import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from src.predictor import Predictor
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).parent.parent))
+
+from src.model_versions import ModelVersions
+from src.saved_prediction import SavedPrediction
+
+"""
+Predicts target for the next month.
+Prediction saved with the current model version is read with standard library only,
+model stack (NumPy, pandas, joblib, XGBoost) is imported only if the model has to be run.
+"""
 
 def predict_target(model_folder:str) -> int|float:
+    version_folder = ModelVersions(model_folder).current()
+    saved = SavedPrediction(version_folder)
+    if saved.exists():
+        value = saved.value(ModelVersions.fingerprint(version_folder))
+        if value is not None:
+            return value
+    from src.predictor import Predictor
     result = (
         Predictor(
             model_folder = model_folder
@@ -22,4 +38,4 @@ if __name__ == "__main__":
                 )
             )
         }."
-    )
\ No newline at end of file
+    )
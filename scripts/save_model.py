@@ -1,9 +1,10 @@
 import sys
-from xgboost import XGBRegressor
 from pathlib import Path
 from typing import Any
 
-sys.path.append(str(Path(__file__).parent.parent))
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).parent.parent))
+
 from src.model_trainer import ModelTrainer
 from src.features import Features
 from src.rawdata import RawData
@@ -12,14 +13,15 @@ from src.rawdata import RawData
 Saves model to folder
 """
 
-def save_model(model:Any, data_path:str, target:str, models_folder_path:str, model_name:str) -> str:
+def save_model(model:Any, data_path:str, target:str, models_folder_path:str, model_name:str, model_format:str='joblib', features_csv:bool=False, feature_spec:dict|None=None) -> str:
+    raw_data = RawData(data_path)
     model_path=(
         ModelTrainer(
             model,
             (
                 Features(
-                    RawData(data_path)
-                    .make_features()
+                    raw_data
+                    .make_features(spec=feature_spec)
                 )
                 .add_sin_seasonality(period=12)
                 .add_cos_seasonality(period=12)
@@ -27,14 +29,15 @@ def save_model(model:Any, data_path:str, target:str, models_folder_path:str, mod
             )
         )
         .train(
-            RawData(data_path)
+            raw_data
             .target(target)
         )
-        .save_model(folder_path=models_folder_path, model_name=model_name)
+        .save_model(folder_path=models_folder_path, model_name=model_name, model_format=model_format, features_csv=features_csv)
     )
     return model_path
 
 if __name__ == "__main__":
+    from xgboost import XGBRegressor
     print(
         f"Model was saved to {
             save_model(
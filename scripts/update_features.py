@@ -0,0 +1,57 @@
+import argparse
+import sys
+from pathlib import Path
+
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).parent.parent))
+
+from src.feature_store import FeatureStore
+from src.rawdata import RawData
+
+"""
+Builds feature store from the whole raw data once and appends new months of raw data to it afterwards.
+File with new months contains only new rows with the same columns as raw data.
+Raw data is read in typed batches, memory limit bounds parsed data of one batch for exports larger than memory.
+
+Example:
+    python scripts/update_features.py build --data_path data/raw_data.csv --target Deals --features_folder data/features
+    python scripts/update_features.py build --data_path data/export.csv --target Deals --features_folder data/features --memory_limit 1073741824
+    python scripts/update_features.py append --rows_path data/new_month.csv --features_folder data/features
+"""
+
+"""
+Builds features and target of the whole raw data file into features folder, returns number of feature rows.
+"""
+def build_features(data_path:str, target:str, features_folder:str, feature_spec:dict|None=None, period:int=12,
+                   memory_limit:int|None=None, chunk_rows:int|None=None) -> int:
+    raw_data = RawData(data_path, memory_limit=memory_limit, chunk_rows=chunk_rows)
+    matrix = FeatureStore(features_folder).ingest(raw_data, target=target, spec=feature_spec, period=period)
+    return len(matrix)
+
+"""
+Appends new raw rows from file to features folder, returns number of feature rows.
+"""
+def append_features(rows_path:str, features_folder:str) -> int:
+    matrix = FeatureStore(features_folder).append(RawData(rows_path).frame())
+    return len(matrix)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incremental feature store update")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="Build features from the whole raw data")
+    build_parser.add_argument("--data_path", type=str, required=True, help="Path to raw data")
+    build_parser.add_argument("--target", type=str, required=True, help="Target column name")
+    build_parser.add_argument("--features_folder", type=str, required=True, help="Folder of feature store")
+    build_parser.add_argument("--memory_limit", type=int, default=None, help="Memory limit of parsed raw data in bytes")
+    build_parser.add_argument("--chunk_rows", type=int, default=None, help="Rows of raw data per batch")
+    append_parser = subparsers.add_parser("append", help="Append new months of raw data")
+    append_parser.add_argument("--rows_path", type=str, required=True, help="Path to file with new rows only")
+    append_parser.add_argument("--features_folder", type=str, required=True, help="Folder of feature store")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        rows = build_features(args.data_path, args.target, args.features_folder,
+                              memory_limit=args.memory_limit, chunk_rows=args.chunk_rows)
+    else:
+        rows = append_features(args.rows_path, args.features_folder)
+    print(f"Feature store {args.features_folder} has {rows} rows")
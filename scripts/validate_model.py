@@ -1,22 +1,24 @@
 import sys
 from pathlib import Path
-from xgboost import XGBRegressor
 from typing import Any
 import pandas as pd
 
-sys.path.append(str(Path(__file__).parent.parent))
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).parent.parent))
+
 from src.model_validator import ModelValidator
 from src.features import Features
 from src.rawdata import RawData
 
-def validate_model(model:Any, data_path:str, target:str) -> pd.DataFrame:
+def validate_model(model:Any, data_path:str, target:str, feature_spec:dict|None=None) -> pd.DataFrame:
+    raw_data = RawData(data_path)
     result = (
         ModelValidator(
             model,
             (
                 Features(
-                    RawData(data_path)
-                    .make_features()
+                    raw_data
+                    .make_features(spec=feature_spec)
                 )
                 .add_sin_seasonality(period=12)
                 .add_cos_seasonality(period=12)
@@ -25,7 +27,7 @@ def validate_model(model:Any, data_path:str, target:str) -> pd.DataFrame:
         )
         .validate(
             (
-                RawData(data_path)
+                raw_data
                 .target(target)
             )
         )
@@ -33,6 +35,7 @@ def validate_model(model:Any, data_path:str, target:str) -> pd.DataFrame:
     return result
 
 if __name__ == "__main__":
+    from xgboost import XGBRegressor
     print(
         f" Result of the test:\n{
         validate_model(
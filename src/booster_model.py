@@ -0,0 +1,84 @@
+import json
+import os
+import numpy as np
+from pathlib import Path
+from typing import Any
+
+"""
+Model stored in native XGBoost format (UBJSON or JSON) with small metadata file.
+Loads straight into Booster without unpickling sklearn wrapper and predicts with inplace_predict on NumPy array.
+XGBoost is imported only when a model is loaded or saved, so importing this module stays cheap.
+
+Example:
+    BoosterModel.save(XGBRegressor().fit(x, y), "../saved_models/xgb_model/xgb_model.ubj")
+    (
+        BoosterModel(
+            model_path = "../saved_models/xgb_model/xgb_model.ubj"
+        )
+        .predict(features)
+    )
+"""
+
+class BoosterModel:
+
+    FORMATS = ('ubj', 'json')
+    METADATA_FILE = 'metadata.json'
+
+    def __init__(self, model_path: str|Path):
+        import xgboost as xgb
+        self.__booster = xgb.Booster(model_file=str(model_path))
+        self.__metadata = self.__load_metadata(Path(model_path).parent)
+
+    """
+    Predicts target for every row of features frame or array.
+    """
+    def predict(self, features: Any) -> np.ndarray:
+        values = np.ascontiguousarray(features, dtype=np.float32)
+        return self.__booster.inplace_predict(values)
+
+    """
+    Returns underlying XGBoost booster.
+    """
+    def booster(self) -> Any:
+        return self.__booster
+
+    """
+    Returns metadata saved with the model.
+    """
+    def metadata(self) -> dict:
+        return self.__metadata
+
+    """
+    Saves booster of fitted XGBoost model in native format and writes metadata file next to it.
+    """
+    @staticmethod
+    def save(model: Any, model_path: str|Path) -> str:
+        import xgboost as xgb
+        model_format = Path(model_path).suffix.lstrip('.')
+        if model_format not in BoosterModel.FORMATS:
+            raise ValueError(f"Unknown native model format: {model_format}")
+        if not hasattr(model, 'get_booster'):
+            raise ValueError(f"Native format is supported only for XGBoost models, got {type(model).__name__}")
+        booster = model.get_booster()
+        booster.save_model(str(model_path))
+        metadata = {
+            'format': model_format,
+            'model_file': os.path.basename(model_path),
+            'model_class': type(model).__name__,
+            'feature_names': booster.feature_names,
+            'xgboost_version': xgb.__version__
+        }
+        metadata_path = os.path.join(os.path.dirname(model_path), BoosterModel.METADATA_FILE)
+        with open(metadata_path, 'w', encoding='utf-8') as file:
+            json.dump(metadata, file)
+        return str(model_path)
+
+    """
+    Reads metadata file if it exists.
+    """
+    def __load_metadata(self, model_folder: Path) -> dict:
+        metadata_path = model_folder / self.METADATA_FILE
+        if not metadata_path.exists():
+            return {}
+        with open(metadata_path, encoding='utf-8') as file:
+            return json.load(file)
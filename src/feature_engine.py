@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from src.stage_timer import StageTimer
+
+"""
+Vectorized lag, rolling-window and difference features for the month after every row of history.
+Spec gives lags (list or k for 1..k), rolling statistics with windows and differences for all numeric columns,
+'columns' overrides the spec for single columns. Columns with the same spec are processed as one contiguous
+float block: history is padded with NaN once, one sliding-window view over the block gives every lag and window
+without copying, and all features are written into one preallocated array.
+Feature of the month after row i uses values of rows up to i: 'X lag1' is the value of row i, 'X rolling_mean3'
+is the mean of rows i-2..i, 'X diff1' is row i minus row i-1. Months without enough history get NaN.
+Panel data (many series in one table) is processed in the same pass: rows are sorted by series once,
+segment starts mark first rows of series and features reaching over a series start are set to NaN with row masks,
+so there is no loop over series.
+
+Example:
+    FeatureEngine({
+        'lags': 3,
+        'rolling': {'mean': [3, 6], 'std': [3]},
+        'diffs': [1],
+        'columns': {'Deals': {'lags': [1, 2, 12]}}
+    }).transform(history, months)
+
+    starts = FeatureEngine.segment_starts(panel, ['Complex', 'Segment'])
+    FeatureEngine().transform(panel[numeric_columns], months, starts)
+"""
+
+class FeatureEngine:
+
+    DEFAULT_SPEC = {'lags': [1]}
+    STATISTICS = ('mean', 'std', 'min', 'max')
+    KEYS = ('lags', 'rolling', 'diffs')
+
+    def __init__(self, spec: dict|None = None):
+        spec = self.DEFAULT_SPEC if spec is None else spec
+        self.__spec = self.__normalize({key: value for key, value in spec.items() if key != 'columns'})
+        self.__columns = {column: self.__normalize(column_spec) for column, column_spec in spec.get('columns', {}).items()}
+
+    """
+    Returns features of numeric columns of history for given months, one row per history row, with Month first.
+    If starts are given, history is a sequence of series and starts marks the first row of every series.
+    """
+    @StageTimer.timed('feature_engine.transform')
+    def transform(self, history: pd.DataFrame, months, starts: np.ndarray|None = None) -> pd.DataFrame:
+        numeric = list(history.select_dtypes(include=[np.number]).columns)
+        groups = {}
+        for column in numeric:
+            spec = self.__columns.get(column, self.__spec)
+            groups.setdefault(self.__key(spec), (spec, []))[1].append(column)
+        names = [name for spec, columns in groups.values() for name in self.__names(spec, columns)]
+        result = np.empty((len(history), len(names)), dtype=np.float64)
+        positions = None if starts is None else self.segment_positions(starts)
+        offset = 0
+        for spec, columns in groups.values():
+            block = history[columns].to_numpy(dtype=np.float64)
+            offset = self.__fill(result, offset, block, spec, positions)
+        features = pd.DataFrame(result, columns=names, copy=False)
+        features.insert(0, 'Month', np.asarray(months))
+        return features
+
+    """
+    Returns mask of rows where series key changes, rows must be sorted by keys.
+    """
+    @staticmethod
+    def segment_starts(frame: pd.DataFrame, keys: list) -> np.ndarray:
+        starts = np.zeros(len(frame), dtype=bool)
+        starts[:1] = True
+        for key in keys:
+            values = frame[key].to_numpy()
+            starts[1:] |= values[1:] != values[:-1]
+        return starts
+
+    """
+    Returns position of every row within its series given mask of series starts.
+    """
+    @staticmethod
+    def segment_positions(starts: np.ndarray) -> np.ndarray:
+        index = np.arange(len(starts))
+        return index - np.maximum.accumulate(np.where(starts, index, 0))
+
+    """
+    Returns number of history rows the deepest feature of any column looks at.
+    """
+    def lookback(self) -> int:
+        return max(self.__lookback(spec) for spec in [self.__spec, *self.__columns.values()])
+
+    """
+    Writes features of one block of columns into result starting at column offset, returns next offset.
+    With positions within series, features that need more rows than the series has before the row are NaN.
+    """
+    def __fill(self, result: np.ndarray, offset: int, block: np.ndarray, spec: dict, positions: np.ndarray|None = None) -> int:
+        rows, width = block.shape
+        lookback = self.__lookback(spec)
+        padded = np.empty((rows + lookback - 1, width), dtype=np.float64)
+        padded[:lookback - 1] = np.nan
+        padded[lookback - 1:] = block
+        windows = sliding_window_view(padded, lookback, axis=0)
+        for lag in spec['lags']:
+            result[:, offset:offset + width] = windows[:, :, lookback - lag]
+            self.__mask(result, offset, width, positions, lag - 1)
+            offset += width
+        for statistic, sizes in spec['rolling'].items():
+            for size in sizes:
+                window = windows[:, :, lookback - size:]
+                result[:, offset:offset + width] = self.__statistic(statistic, window)
+                self.__mask(result, offset, width, positions, size - 1)
+                offset += width
+        for step in spec['diffs']:
+            np.subtract(windows[:, :, lookback - 1], windows[:, :, lookback - 1 - step], out=result[:, offset:offset + width])
+            self.__mask(result, offset, width, positions, step)
+            offset += width
+        return offset
+
+    """
+    Sets NaN in rows whose series has fewer than depth rows before them.
+    """
+    def __mask(self, result: np.ndarray, offset: int, width: int, positions: np.ndarray|None, depth: int):
+        if positions is not None and depth > 0:
+            result[positions < depth, offset:offset + width] = np.nan
+
+    """
+    Computes rolling statistic over the last axis, sample standard deviation as in pandas.
+    """
+    def __statistic(self, statistic: str, window: np.ndarray) -> np.ndarray:
+        if statistic == 'mean':
+            return window.mean(axis=2)
+        if statistic == 'std':
+            return window.std(axis=2, ddof=1) if window.shape[2] > 1 else np.full(window.shape[:2], np.nan)
+        if statistic == 'min':
+            return window.min(axis=2)
+        return window.max(axis=2)
+
+    """
+    Returns feature names of block in the order they are written.
+    """
+    def __names(self, spec: dict, columns: list) -> list:
+        suffixes = [f"lag{lag}" for lag in spec['lags']]
+        suffixes += [f"rolling_{statistic}{size}" for statistic, sizes in spec['rolling'].items() for size in sizes]
+        suffixes += [f"diff{step}" for step in spec['diffs']]
+        return [f"{column} {suffix}" for suffix in suffixes for column in columns]
+
+    """
+    Returns number of rows one feature row looks at.
+    """
+    def __lookback(self, spec: dict) -> int:
+        sizes = [1, *spec['lags']]
+        sizes += [size for window_sizes in spec['rolling'].values() for size in window_sizes]
+        sizes += [step + 1 for step in spec['diffs']]
+        return max(sizes)
+
+    """
+    Returns hashable form of spec for grouping columns.
+    """
+    def __key(self, spec: dict) -> tuple:
+        return tuple(spec['lags']), tuple((statistic, tuple(sizes)) for statistic, sizes in spec['rolling'].items()), tuple(spec['diffs'])
+
+    """
+    Checks spec and converts it to lists of positive integers.
+    """
+    def __normalize(self, spec: dict) -> dict:
+        unknown = set(spec) - set(self.KEYS)
+        if unknown:
+            raise ValueError(f"Unknown feature spec keys: {sorted(unknown)}")
+        lags = spec.get('lags', [])
+        lags = list(range(1, lags + 1)) if isinstance(lags, int) else list(lags)
+        rolling = {statistic: list(sizes) for statistic, sizes in spec.get('rolling', {}).items()}
+        diffs = list(spec.get('diffs', []))
+        unknown = set(rolling) - set(self.STATISTICS)
+        if unknown:
+            raise ValueError(f"Unknown rolling statistics: {sorted(unknown)}")
+        for value in lags + diffs + [size for sizes in rolling.values() for size in sizes]:
+            if int(value) != value or value < 1:
+                raise ValueError(f"Lags, windows and differences must be positive integers, got {value}")
+        return {
+            'lags': [int(lag) for lag in lags],
+            'rolling': {statistic: [int(size) for size in sizes] for statistic, sizes in rolling.items()},
+            'diffs': [int(step) for step in diffs]
+        }
@@ -0,0 +1,232 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+"""
+Feature matrix stored in binary columnar form: raw float64 .npy file that is memory-mapped on load,
+months of rows as datetime64 .npy file and schema file with column order and name of the predicted target.
+Any row, including the last one, is read in O(1) without parsing text.
+Folders saved before this format (only features.csv or months in schema) are read through the same interface.
+New rows are appended in place: values and months are written right after the last counted row, the file is cut there
+and header shape is rewritten, so appending costs the size of new rows, not of the whole matrix.
+Header shape of values file is the commit point: rows left behind by an interrupted append are not counted and
+are overwritten by the next append.
+
+Example:
+    FeatureMatrix.save(features_df, "../saved_models/xgb_model", target="Deals")
+    matrix = FeatureMatrix.load("../saved_models/xgb_model")
+    matrix.last()
+    matrix.frame()
+    FeatureMatrix.append("../data/features", new_rows_df)
+"""
+
+class FeatureMatrix:
+
+    VALUES_FILE = 'features.npy'
+    SCHEMA_FILE = 'features.schema.json'
+    MONTHS_FILE = 'features.months.npy'
+    CSV_FILE = 'features.csv'
+
+    def __init__(self, values: np.ndarray, columns: list, months: list|None, target: str|None = None):
+        self.__values = values
+        self.__columns = list(columns)
+        self.__months = months
+        self.__target = target
+
+    """
+    Returns number of rows.
+    """
+    def __len__(self) -> int:
+        return self.__values.shape[0]
+
+    """
+    Returns feature column names in training order.
+    """
+    def columns(self) -> list:
+        return self.__columns
+
+    """
+    Returns month labels of rows or None if features had no Month column.
+    """
+    def months(self) -> list|None:
+        return self.__months
+
+    """
+    Returns name of target predicted from these features or None if it was not saved.
+    """
+    def target(self) -> str|None:
+        return self.__target
+
+    """
+    Returns values of all rows as 2D array (memory-mapped if loaded from .npy).
+    """
+    def values(self) -> np.ndarray:
+        return self.__values
+
+    """
+    Returns one row as 2D array of shape (1, columns).
+    """
+    def row(self, index: int) -> np.ndarray:
+        index = index if index >= 0 else len(self) + index
+        return self.__values[index:index + 1]
+
+    """
+    Returns the last row as 2D array of shape (1, columns).
+    """
+    def last(self) -> np.ndarray:
+        return self.row(-1)
+
+    """
+    Returns matrix of the first count rows.
+    """
+    def head(self, count: int) -> 'FeatureMatrix':
+        months = None if self.__months is None else self.__months[:count]
+        return FeatureMatrix(self.__values[:count], self.__columns, months, self.__target)
+
+    """
+    Returns selected rows as DataFrame with Month column first.
+    """
+    def frame(self, rows: slice|np.ndarray = slice(None)) -> pd.DataFrame:
+        frame = pd.DataFrame(np.asarray(self.__values[rows]), columns=self.__columns)
+        if self.__months is not None:
+            frame.insert(0, 'Month', np.asarray(self.__months, dtype=object)[rows])
+        return frame
+
+    """
+    Writes features to folder as .npy values and schema, optionally also as CSV for debugging.
+    """
+    @staticmethod
+    def save(features: pd.DataFrame, model_folder: str|Path, csv: bool = False, target: str|None = None):
+        matrix = FeatureMatrix.from_frame(features, target)
+        matrix.__write(model_folder)
+        csv_path = os.path.join(model_folder, FeatureMatrix.CSV_FILE)
+        if csv:
+            features.to_csv(csv_path, index=False)
+        elif os.path.exists(csv_path):
+            os.remove(csv_path)
+
+    """
+    Loads features from folder: memory-maps .npy if it exists, otherwise parses features.csv.
+    """
+    @staticmethod
+    def load(model_folder: str|Path) -> 'FeatureMatrix':
+        values_path = os.path.join(model_folder, FeatureMatrix.VALUES_FILE)
+        if os.path.exists(values_path):
+            with open(os.path.join(model_folder, FeatureMatrix.SCHEMA_FILE), encoding='utf-8') as file:
+                schema = json.load(file)
+            values = np.load(values_path, mmap_mode='r', allow_pickle=False)
+            months = schema['months']
+            if schema.get('months_file'):
+                months = np.load(os.path.join(model_folder, schema['months_file']), mmap_mode='r', allow_pickle=False)
+                months = np.datetime_as_string(months[:len(values)], unit='D').tolist()
+            elif months is not None:
+                months = months[:len(values)]
+            return FeatureMatrix(values, schema['columns'], months, schema.get('target'))
+        return FeatureMatrix.from_frame(pd.read_csv(os.path.join(model_folder, FeatureMatrix.CSV_FILE)))
+
+    """
+    Appends feature rows with the same columns to matrix saved in folder and returns updated matrix.
+    Rows are written after the first start rows (all counted rows by default), rows after them are replaced.
+    Months are written before values, so values header decides which rows exist.
+    """
+    @staticmethod
+    def append(model_folder: str|Path, features: pd.DataFrame, start: int|None = None) -> 'FeatureMatrix':
+        schema_path = os.path.join(model_folder, FeatureMatrix.SCHEMA_FILE)
+        values_path = os.path.join(model_folder, FeatureMatrix.VALUES_FILE)
+        with open(schema_path, encoding='utf-8') as file:
+            schema = json.load(file)
+        rows = FeatureMatrix.from_frame(features)
+        if rows.columns() != schema['columns']:
+            raise ValueError(f"Appended columns {rows.columns()} differ from saved columns {schema['columns']}")
+        if start is None:
+            start = len(np.load(values_path, mmap_mode='r', allow_pickle=False))
+        if schema.get('months_file'):
+            months = FeatureMatrix.__month_values(rows.months())
+            if months is None:
+                raise ValueError(f"Appended months are not dates: {rows.months()}")
+            FeatureMatrix.append_rows(os.path.join(model_folder, schema['months_file']), months, start=start)
+        elif schema['months'] is not None:
+            schema['months'] = schema['months'][:start] + rows.months()
+            with open(schema_path + '.tmp', 'w', encoding='utf-8') as file:
+                json.dump(schema, file, ensure_ascii=False)
+            os.replace(schema_path + '.tmp', schema_path)
+        FeatureMatrix.append_rows(values_path, rows.values(), start=start)
+        return FeatureMatrix.load(model_folder)
+
+    """
+    Appends rows to .npy file in place after the first start rows (all rows by default):
+    data is written and the file is cut after it, then shape in header is updated.
+    Header is padded by NumPy, if new shape does not fit into it the file is rewritten.
+    """
+    @staticmethod
+    def append_rows(path: str|Path, rows: np.ndarray, start: int|None = None):
+        with open(path, 'r+b') as file:
+            version = np.lib.format.read_magic(file)
+            header_start = file.tell() + (2 if version == (1, 0) else 4)
+            read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+            shape, fortran_order, dtype = read_header(file)
+            data_start = file.tell()
+            if fortran_order or dtype != rows.dtype or tuple(shape[1:]) != rows.shape[1:]:
+                raise ValueError(f"Cannot append rows {rows.dtype}{rows.shape} to array {dtype}{shape}")
+            start = shape[0] if start is None else start
+            if not 0 <= start <= shape[0]:
+                raise ValueError(f"Cannot append rows after row {start} of array with {shape[0]} rows")
+            new_shape = (start + rows.shape[0],) + tuple(shape[1:])
+            header = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (np.lib.format.dtype_to_descr(dtype), new_shape)
+            if len(header) + 1 <= data_start - header_start:
+                row_bytes = dtype.itemsize * int(np.prod(shape[1:], dtype=np.int64))
+                file.seek(data_start + start * row_bytes)
+                file.write(np.ascontiguousarray(rows).tobytes())
+                file.truncate()
+                file.flush()
+                file.seek(header_start)
+                file.write(header.ljust(data_start - header_start - 1).encode('latin1') + b'\n')
+                return
+        values = np.concatenate([np.load(path, allow_pickle=False)[:start], rows])
+        np.save(str(path) + '.tmp.npy', values, allow_pickle=False)
+        os.replace(str(path) + '.tmp.npy', path)
+
+    """
+    Builds in-memory matrix from features DataFrame.
+    """
+    @staticmethod
+    def from_frame(features: pd.DataFrame, target: str|None = None) -> 'FeatureMatrix':
+        columns = [col for col in features.columns if col != 'Month']
+        values = np.ascontiguousarray(features[columns].to_numpy(dtype=np.float64))
+        months = features['Month'].astype(str).tolist() if 'Month' in features.columns else None
+        return FeatureMatrix(values, columns, months, target)
+
+    """
+    Returns months as datetime64 day array if every month is a date written as YYYY-MM-DD, None otherwise.
+    """
+    @staticmethod
+    def __month_values(months: list) -> np.ndarray|None:
+        try:
+            values = np.array(months, dtype='datetime64[D]')
+        except ValueError:
+            return None
+        return values if np.datetime_as_string(values, unit='D').tolist() == list(months) else None
+
+    """
+    Writes values to .npy file, months to months .npy file and column order to schema file.
+    Months that are not dates are kept in schema.
+    """
+    def __write(self, model_folder: str|Path):
+        np.save(os.path.join(model_folder, self.VALUES_FILE), self.__values, allow_pickle=False)
+        months = None if self.__months is None else self.__month_values(self.__months)
+        months_path = os.path.join(model_folder, self.MONTHS_FILE)
+        if months is not None:
+            np.save(months_path, months, allow_pickle=False)
+        elif os.path.exists(months_path):
+            os.remove(months_path)
+        schema = {
+            'columns': self.__columns,
+            'months': self.__months if months is None else None,
+            'months_file': self.MONTHS_FILE if months is not None else None,
+            'target': self.__target,
+            'dtype': str(self.__values.dtype)
+        }
+        with open(os.path.join(model_folder, self.SCHEMA_FILE), 'w', encoding='utf-8') as file:
+            json.dump(schema, file, ensure_ascii=False)
@@ -0,0 +1,102 @@
+import re
+import numpy as np
+from src.feature_matrix import FeatureMatrix
+
+"""
+Rolls FeatureEngine features of stored feature matrix forward by one month for many rows at once.
+Raw history of every raw column is recovered from its lag features of the last stored rows
+(row of month m has 'X lagK' equal to raw value of month m-K), so no raw data is needed.
+New raw values are pushed into history and all lags, rolling statistics and differences are recomputed from it,
+columns that are not FeatureEngine features (seasonality, custom columns) are left to the caller.
+
+Example:
+    roller = FeatureRoller(matrix)
+    history = roller.history(paths)
+    roller.push(history, new_raw_values)
+    roller.write(history, rows)
+"""
+
+class FeatureRoller:
+
+    PATTERN = re.compile(r"^(?P<column>.+) (?P<kind>lag|rolling_mean|rolling_std|rolling_min|rolling_max|diff)(?P<size>\d+)$")
+
+    def __init__(self, matrix: FeatureMatrix):
+        self.__features = []
+        self.__raw_columns = []
+        lags = {}
+        depth = 1
+        for index, name in enumerate(matrix.columns()):
+            match = self.PATTERN.match(name)
+            if match is None:
+                continue
+            column, kind, size = match['column'], match['kind'], int(match['size'])
+            if column not in self.__raw_columns:
+                self.__raw_columns.append(column)
+            self.__features.append((index, self.__raw_columns.index(column), kind, size))
+            if kind == 'lag':
+                lags.setdefault(column, {})[size] = index
+            depth = max(depth, size + 1 if kind == 'diff' else size)
+        without_lags = [column for column in self.__raw_columns if column not in lags]
+        if without_lags:
+            raise ValueError(f"Features of {without_lags} can not be rolled forward without their lag features")
+        self.__lags = [lags[column] for column in self.__raw_columns]
+        self.__depth = depth
+        self.__matrix = matrix
+
+    """
+    Returns names of raw columns that have FeatureEngine features, in the order of history columns.
+    """
+    def raw_columns(self) -> list:
+        return list(self.__raw_columns)
+
+    """
+    Returns raw history of the last months before the month after the last stored row, repeated for count rows.
+    Shape is (count, raw columns, depth), the last element is the most recent month, unknown months are NaN.
+    """
+    def history(self, count: int = 1) -> np.ndarray:
+        rows = len(self.__matrix)
+        history = np.full((len(self.__raw_columns), self.__depth), np.nan)
+        for raw_index, lags in enumerate(self.__lags):
+            for back in range(1, self.__depth + 1):
+                known = [lag for lag in lags if lag <= back and back - lag < rows]
+                if known:
+                    lag = max(known)
+                    history[raw_index, -back] = self.__matrix.row(rows - 1 - (back - lag))[0, lags[lag]]
+        return np.repeat(history[np.newaxis], count, axis=0)
+
+    """
+    Returns month-over-month changes of raw columns with given history indices, one row per stored month.
+    Months whose raw values are unknown (first rows without history) are left out.
+    """
+    def changes(self, raw_indices: list) -> np.ndarray:
+        values = np.asarray(self.__matrix.values(), dtype=np.float64)
+        series = np.column_stack([values[:, self.__lags[index][min(self.__lags[index])]] for index in raw_indices]) \
+            if raw_indices else np.empty((len(values), 0))
+        changes = np.diff(series, axis=0)
+        return changes[~np.isnan(changes).any(axis=1)]
+
+    """
+    Shifts history one month back and puts new raw values (rows x raw columns) as the most recent month, in place.
+    """
+    def push(self, history: np.ndarray, values: np.ndarray):
+        history[:, :, :-1] = history[:, :, 1:]
+        history[:, :, -1] = values
+
+    """
+    Writes all FeatureEngine features computed from history into rows of feature matrix layout, in place.
+    """
+    def write(self, history: np.ndarray, rows: np.ndarray):
+        for index, raw_index, kind, size in self.__features:
+            values = history[:, raw_index]
+            if kind == 'lag':
+                rows[:, index] = values[:, -size]
+            elif kind == 'diff':
+                rows[:, index] = values[:, -1] - values[:, -1 - size]
+            elif kind == 'rolling_mean':
+                rows[:, index] = values[:, -size:].mean(axis=1)
+            elif kind == 'rolling_std':
+                rows[:, index] = values[:, -size:].std(axis=1, ddof=1) if size > 1 else np.nan
+            elif kind == 'rolling_min':
+                rows[:, index] = values[:, -size:].min(axis=1)
+            else:
+                rows[:, index] = values[:, -size:].max(axis=1)
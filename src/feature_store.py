@@ -0,0 +1,195 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from src.feature_engine import FeatureEngine
+from src.feature_matrix import FeatureMatrix
+from src.features import Features
+from src.rawdata import RawData
+from src.stage_timer import StageTimer
+
+"""
+Persisted training features and target that are updated incrementally when new months of raw data arrive.
+Folder holds feature matrix (features.npy with schema), raw target values (target.npy) and state file with
+feature spec, seasonality period, raw columns and the last raw rows that the deepest feature needs.
+Appending new rows computes features only for the months after them from the stored tail and the new rows,
+earlier feature rows are not touched: the previous "next month" row stays valid because it depends only on older rows.
+Update cost depends on the number of new rows, not on the length of history.
+State file is the commit point: rows are written after the rows counted in state, so rows of an interrupted append
+are not read and are overwritten by the next one. Months must be consecutive, seasonality and target months follow rows.
+Features are the same as RawData.make_features followed by Features.add_sin_seasonality and add_cos_seasonality.
+Raw data larger than memory is ingested batch by batch: the first batch builds the store and the next ones are appended,
+so only one batch with its features is held at a time.
+
+Example:
+    store = FeatureStore("../data/features")
+    store.build(RawData("../data/raw_data.csv").frame(), target="Deals", spec={'lags': 3}, period=12)
+    store.append(new_rows_df)
+    store.ingest(RawData("../data/export.csv", memory_limit=2**30), target="Deals", spec={'lags': 3})
+    ModelTrainer(XGBRegressor(), store.features()).train(store.target())
+"""
+
+class FeatureStore:
+
+    STATE_FILE = 'features.state.json'
+    TARGET_FILE = 'target.npy'
+
+    def __init__(self, folder: str|Path):
+        self.__folder = Path(folder)
+
+    """
+    Builds features and target from the whole raw data frame and saves them with tail state.
+    """
+    @StageTimer.timed('feature_store.build')
+    def build(self, raw: pd.DataFrame, target: str, spec: dict|None = None, period: int = 12) -> FeatureMatrix:
+        os.makedirs(self.__folder, exist_ok=True)
+        self.__check_consecutive(pd.to_datetime(raw['Month']))
+        engine = FeatureEngine(spec)
+        columns = list(raw.drop(columns=['Month']).select_dtypes(include=[np.number]).columns)
+        if target not in columns:
+            raise KeyError(f"Target column {target} is not a numeric raw data column")
+        features = self.__tail_features(engine, raw, columns, len(raw), period, 0)
+        FeatureMatrix.save(features, self.__folder, target=target)
+        np.save(self.__folder / self.TARGET_FILE, raw[target].to_numpy(dtype=np.float64), allow_pickle=False)
+        self.__write_state({
+            'spec': spec,
+            'period': period,
+            'target': target,
+            'columns': columns,
+            'first_month': str(pd.Timestamp(raw['Month'].iloc[0]).date()),
+            'last_month': str(pd.Timestamp(raw['Month'].iloc[-1]).date()),
+            'rows': len(raw),
+            'tail': self.__tail(raw, columns, engine)
+        })
+        return FeatureMatrix.load(self.__folder)
+
+    """
+    Builds features and target from typed batches of raw data in month order, one batch in memory at a time.
+    """
+    @StageTimer.timed('feature_store.ingest')
+    def ingest(self, raw: RawData, target: str, spec: dict|None = None, period: int = 12) -> FeatureMatrix:
+        if raw.series():
+            raise ValueError("Feature store keeps single series data, panel data can not be ingested")
+        matrix = None
+        for batch in raw.batches():
+            if len(batch) == 0:
+                continue
+            if matrix is None:
+                matrix = self.build(batch, target=target, spec=spec, period=period)
+            else:
+                matrix = self.append(batch)
+        if matrix is None:
+            raise ValueError("Raw data has no rows to ingest")
+        return matrix
+
+    """
+    Appends new raw rows (Month and raw columns, months after the last stored month) and returns updated matrix.
+    Only features of months after the new rows are computed, from stored tail and new rows.
+    """
+    @StageTimer.timed('feature_store.append')
+    def append(self, rows: pd.DataFrame) -> FeatureMatrix:
+        state = self.__read_state()
+        rows = rows.assign(Month=pd.to_datetime(rows['Month'])).reset_index(drop=True)
+        self.__check_rows(rows, state)
+        engine = FeatureEngine(state['spec'])
+        columns = state['columns']
+        tail = pd.DataFrame(state['tail'], columns=columns, dtype=np.float64)
+        history = pd.concat([tail, rows[columns].astype(np.float64)], ignore_index=True)
+        history.insert(0, 'Month', [pd.NaT] * len(tail) + list(rows['Month']))
+        features = self.__tail_features(engine, history, columns, len(rows), state['period'], state['rows'])
+        FeatureMatrix.append(self.__folder, features, start=state['rows'])
+        FeatureMatrix.append_rows(self.__folder / self.TARGET_FILE, rows[state['target']].to_numpy(dtype=np.float64), start=state['rows'])
+        state.update({
+            'last_month': str(rows['Month'].iloc[-1].date()),
+            'rows': state['rows'] + len(rows),
+            'tail': self.__tail(history, columns, engine)
+        })
+        self.__write_state(state)
+        return self.matrix()
+
+    """
+    Returns stored feature matrix (memory-mapped) with rows counted in state.
+    """
+    def matrix(self) -> FeatureMatrix:
+        return FeatureMatrix.load(self.__folder).head(self.__read_state()['rows'])
+
+    """
+    Returns stored features as DataFrame with datetime Month column for ModelTrainer and ModelValidator.
+    """
+    def features(self) -> pd.DataFrame:
+        features = self.matrix().frame()
+        features['Month'] = pd.to_datetime(features['Month'])
+        return features
+
+    """
+    Returns raw target values with datetime Month column.
+    """
+    def target(self) -> pd.DataFrame:
+        state = self.__read_state()
+        months = [state['first_month']] + self.matrix().months()[:state['rows'] - 1]
+        values = np.array(np.load(self.__folder / self.TARGET_FILE, mmap_mode='r', allow_pickle=False)[:state['rows']])
+        return pd.DataFrame({'Month': pd.to_datetime(months), state['target']: values})
+
+    """
+    Computes features with seasonality for months after the last count rows of history.
+    Seasonal index of the first computed row is start, as if seasonality was added to the whole matrix.
+    """
+    def __tail_features(self, engine: FeatureEngine, history: pd.DataFrame, columns: list,
+                        count: int, period: int, start: int) -> pd.DataFrame:
+        months = list(history['Month'].iloc[len(history) - count + 1:])
+        months.append(history['Month'].iloc[-1] + pd.DateOffset(months=1))
+        features = engine.transform(history[columns], [None] * (len(history) - count) + months)
+        features = features.iloc[len(history) - count:].reset_index(drop=True)
+        features['Month'] = pd.to_datetime(features['Month'])
+        return (
+            Features(features)
+            .add_sin_seasonality(period=period, start=start)
+            .add_cos_seasonality(period=period, start=start)
+            .prepare_data()
+        )
+
+    """
+    Returns last raw rows needed by the deepest feature as list of rows.
+    """
+    def __tail(self, history: pd.DataFrame, columns: list, engine: FeatureEngine) -> list:
+        size = engine.lookback() - 1
+        if size == 0:
+            return []
+        return history[columns].iloc[-size:].to_numpy(dtype=np.float64).tolist()
+
+    """
+    Checks that new rows have all raw columns and consecutive months right after the last stored month.
+    """
+    def __check_rows(self, rows: pd.DataFrame, state: dict):
+        missing = [column for column in state['columns'] if column not in rows.columns]
+        if missing:
+            raise KeyError(f"New rows are missing columns: {missing}")
+        if len(rows) == 0:
+            raise ValueError("No rows to append")
+        months = pd.concat([pd.Series([pd.Timestamp(state['last_month'])]), rows['Month']], ignore_index=True)
+        self.__check_consecutive(months)
+
+    """
+    Checks that months go one after another without gaps or repeats, seasonality index and month labels rely on it.
+    """
+    def __check_consecutive(self, months: pd.Series):
+        index = months.dt.year.to_numpy() * 12 + months.dt.month.to_numpy()
+        if len(index) > 1 and not (np.diff(index) == 1).all():
+            raise ValueError(f"Months must be consecutive without gaps, got {[str(month.date()) for month in months]}")
+
+    """
+    Reads state saved by build or the last append.
+    """
+    def __read_state(self) -> dict:
+        with open(self.__folder / self.STATE_FILE, encoding='utf-8') as file:
+            return json.load(file)
+
+    """
+    Writes state through temporary file, so it is never seen half-written.
+    """
+    def __write_state(self, state: dict):
+        path = self.__folder / self.STATE_FILE
+        with open(str(path) + '.tmp', 'w', encoding='utf-8') as file:
+            json.dump(state, file, ensure_ascii=False)
+        os.replace(str(path) + '.tmp', path)
@@ -1,9 +1,13 @@
 import pandas as pd
 import numpy as np
 from typing import Self, List
+from src.feature_engine import FeatureEngine
+from src.stage_timer import StageTimer
 
 """
 Works with features and adds seasonality.
+For panel data series columns are given, rows must be sorted by series and month (as RawData returns them),
+seasonal index counts months within every series and series columns are kept by choose_features.
 
 Example:
     df = (
@@ -19,35 +23,41 @@ Example:
 
 class Features:
 
-    def __init__(self, features: pd.DataFrame):
+    def __init__(self, features: pd.DataFrame, series: List[str]|None = None):
         self.__features = features
+        self.__series = list(series or [])
 
     """
-    Adds sin seasonal feature based on monthly index.
+    Adds sin seasonal feature based on monthly index, index of the first row is start.
     """
-    def add_sin_seasonality(self, period: int) -> Self:
-        month_index = np.arange(len(self.__features))
+    @StageTimer.timed('features.add_sin_seasonality')
+    def add_sin_seasonality(self, period: int, start: int = 0) -> Self:
+        month_index = start + self.__month_index()
         self.__features['sin_season'] = np.sin(2*np.pi*month_index/period)
         return self
 
     """
-    Adds cos seasonal feature based on monthly index.
+    Adds cos seasonal feature based on monthly index, index of the first row is start.
     """
-    def add_cos_seasonality(self, period: int) -> Self:
-        month_index = np.arange(len(self.__features))
+    @StageTimer.timed('features.add_cos_seasonality')
+    def add_cos_seasonality(self, period: int, start: int = 0) -> Self:
+        month_index = start + self.__month_index()
         self.__features['cos_season'] = np.cos(2*np.pi*month_index/period)
         return self
 
     """
     Leaves specified columns from the features dataframe.
     """
+    @StageTimer.timed('features.choose_features')
     def choose_features(self, columns: List[str]) -> Self:
-        self.__features = self.__features[['Month'] + [col for col in columns if col in self.__features.columns]]
+        kept = ['Month'] + self.__series
+        self.__features = self.__features[kept + [col for col in columns if col in self.__features.columns and col not in kept]]
         return self
 
     """
     Removes specified columns from the features dataframe.
     """
+    @StageTimer.timed('features.drop_features')
     def drop_features(self, columns: List[str]) -> Self:
         self.__features = self.__features.drop(columns=columns, errors='ignore')
         return self
@@ -56,4 +66,12 @@ class Features:
     Returns dataframe from Features class for using it for training.
     """
     def prepare_data(self) -> pd.DataFrame:
-        return self.__features
\ No newline at end of file
+        return self.__features
+
+    """
+    Private function for month index of every row: row number or, for panel data, position within series.
+    """
+    def __month_index(self) -> np.ndarray:
+        if not self.__series:
+            return np.arange(len(self.__features))
+        return FeatureEngine.segment_positions(FeatureEngine.segment_starts(self.__features, self.__series))
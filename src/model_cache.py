@@ -0,0 +1,211 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+"""
+Process-wide cache for loaded model artifacts.
+Keeps loaded objects in memory and reloads them only when files in the model folder change.
+If memory budget is set, least recently used model folders are evicted when cached models exceed it.
+Size of a model is approximated by size of its artifact files on disk.
+Concurrent misses for the same artifact are coalesced: only one loader runs and other callers share its result or error.
+Folders can be grouped (versions of one model): a loaded folder replaces other folders of its group in one step,
+callers that already hold objects of the replaced folder keep using them until they finish.
+
+Example:
+    cache = ModelCache(max_bytes=512 * 1024 ** 2)
+    (
+        Predictor(
+            model_folder = "../saved_models/xgb_model",
+            cache = cache
+        )
+        .predict()
+    )
+    cache.stats()
+"""
+
+class ModelCache:
+
+    def __init__(self, max_bytes: int|None = None):
+        self.__models = OrderedDict()
+        self.__flights = {}
+        self.__lock = threading.Lock()
+        self.__max_bytes = max_bytes
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__coalesced = 0
+        self.__swaps = 0
+
+    """
+    Returns cached artifact for the model folder or calls loader if folder files were changed.
+    Several artifacts of one folder (model, precomputed prediction) are cached under different names.
+    If group is given, the folder replaces cached folders of the same group when it is loaded.
+    """
+    def get(self, model_folder: str|Path, loader: Callable[[], Any], artifact: str = 'model', group: str|Path|None = None) -> Any:
+        key = self.__key(model_folder)
+        signature = self.signature(model_folder)
+        with self.__lock:
+            entry = self.__models.get(key)
+            if entry is not None and entry['signature'] == signature and artifact in entry['artifacts']:
+                self.__models.move_to_end(key)
+                self.__hits += 1
+                return entry['artifacts'][artifact]
+            flight = self.__flights.get((key, artifact))
+            leader = flight is None or flight['signature'] != signature
+            if leader:
+                self.__misses += 1
+                flight = self.__start_flight(key, artifact, signature)
+            else:
+                self.__coalesced += 1
+        if leader:
+            return self.__load(key, artifact, signature, loader, flight, self.__group(group))
+        return self.__wait(flight)
+
+    """
+    Returns hit, miss, eviction, coalesced request and version swap counters, number of cached models and their total size.
+    """
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                'hits': self.__hits,
+                'misses': self.__misses,
+                'evictions': self.__evictions,
+                'coalesced': self.__coalesced,
+                'swaps': self.__swaps,
+                'size': len(self.__models),
+                'size_bytes': sum(entry['size_bytes'] for entry in self.__models.values())
+            }
+
+    """
+    Returns resident model folders with their size in bytes, load time and cached artifact names.
+    Folders are ordered from least to most recently used.
+    """
+    def resident(self) -> dict:
+        with self.__lock:
+            return {
+                key: {
+                    'size_bytes': entry['size_bytes'],
+                    'load_seconds': entry['load_seconds'],
+                    'artifacts': sorted(entry['artifacts'])
+                }
+                for key, entry in self.__models.items()
+            }
+
+    """
+    Removes all cached artifacts and resets counters.
+    """
+    def clear(self):
+        with self.__lock:
+            self.__models.clear()
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+            self.__coalesced = 0
+            self.__swaps = 0
+
+    """
+    Returns name, size and modification time of every file in the model folder.
+    """
+    @staticmethod
+    def signature(model_folder: str|Path) -> tuple:
+        with os.scandir(model_folder) as entries:
+            files = [(entry.name, entry.stat()) for entry in entries if entry.is_file()]
+        return tuple(sorted((name, stat.st_size, stat.st_mtime_ns) for name, stat in files))
+
+    """
+    Builds cache key from absolute model folder path.
+    """
+    def __key(self, model_folder: str|Path) -> str:
+        return str(Path(model_folder).resolve())
+
+    """
+    Builds group key from absolute path of the group folder.
+    """
+    def __group(self, group: str|Path|None) -> str|None:
+        return None if group is None else self.__key(group)
+
+    """
+    Registers loading of artifact so that concurrent callers wait for it instead of loading again.
+    """
+    def __start_flight(self, key: str, artifact: str, signature: tuple) -> dict:
+        flight = {'signature': signature, 'done': threading.Event(), 'value': None, 'error': None}
+        self.__flights[(key, artifact)] = flight
+        return flight
+
+    """
+    Runs loader, stores its result in cache and hands result or error to waiting callers.
+    """
+    def __load(self, key: str, artifact: str, signature: tuple, loader: Callable[[], Any], flight: dict, group: str|None) -> Any:
+        try:
+            started = time.perf_counter()
+            value = loader()
+            load_seconds = time.perf_counter() - started
+            with self.__lock:
+                entry = self.__models.get(key)
+                if entry is None or entry['signature'] != signature:
+                    entry = self.__new_entry(signature, group)
+                    self.__models[key] = entry
+                    self.__swap(key, group)
+                entry['artifacts'][artifact] = value
+                entry['load_seconds'] += load_seconds
+                self.__models.move_to_end(key)
+                self.__evict(keep=key)
+            flight['value'] = value
+            return value
+        except BaseException as e:
+            flight['error'] = e
+            raise
+        finally:
+            with self.__lock:
+                if self.__flights.get((key, artifact)) is flight:
+                    del self.__flights[(key, artifact)]
+            flight['done'].set()
+
+    """
+    Waits for loading started by another caller and returns its result or raises its error.
+    """
+    def __wait(self, flight: dict) -> Any:
+        flight['done'].wait()
+        if flight['error'] is not None:
+            raise flight['error']
+        return flight['value']
+
+    """
+    Creates empty cache entry for folder with given signature.
+    """
+    def __new_entry(self, signature: tuple, group: str|None) -> dict:
+        return {
+            'signature': signature,
+            'group': group,
+            'artifacts': {},
+            'size_bytes': sum(size for _, size, _ in signature),
+            'load_seconds': 0.0
+        }
+
+    """
+    Removes other folders of the group so that only the newly loaded folder stays cached.
+    """
+    def __swap(self, keep: str, group: str|None):
+        if group is None:
+            return
+        for key in [key for key, entry in self.__models.items() if entry['group'] == group and key != keep]:
+            del self.__models[key]
+            self.__swaps += 1
+
+    """
+    Removes least recently used folders until cached size fits memory budget.
+    """
+    def __evict(self, keep: str):
+        if self.__max_bytes is None:
+            return
+        total = sum(entry['size_bytes'] for entry in self.__models.values())
+        for key in list(self.__models):
+            if total <= self.__max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self.__models.pop(key)['size_bytes']
+            self.__evictions += 1
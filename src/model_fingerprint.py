@@ -0,0 +1,51 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable
+
+"""
+Computes content fingerprint of model artifacts stored in the model folder.
+Sidecar files written after the model (prediction.json, manifest.json) are excluded from the fingerprint.
+
+Example:
+    (
+        ModelFingerprint(
+            model_folder = "../saved_models/xgb_model"
+        )
+        .hexdigest()
+    )
+"""
+
+class ModelFingerprint:
+
+    SIDECAR_FILES = ('prediction.json', 'manifest.json')
+
+    def __init__(self, model_folder: str|Path, exclude: Iterable[str] = SIDECAR_FILES):
+        self.__model_folder = Path(model_folder)
+        self.__exclude = set(exclude)
+
+    """
+    Returns sha256 hex digest of names and contents of all artifact files in the folder.
+    """
+    def hexdigest(self) -> str:
+        digest = hashlib.sha256()
+        for name in self.__artifact_files(self.__model_folder):
+            digest.update(name.encode('utf-8'))
+            self.__update_with_file(digest, os.path.join(self.__model_folder, name))
+        return digest.hexdigest()
+
+    """
+    Gives sorted names of files that belong to model artifact.
+    """
+    def __artifact_files(self, model_folder: Path) -> list:
+        with os.scandir(model_folder) as entries:
+            names = [entry.name for entry in entries if entry.is_file() and entry.name not in self.__exclude]
+        return sorted(names)
+
+    """
+    Reads file by blocks and adds its content to digest.
+    """
+    def __update_with_file(self, digest, path: str, block_size: int = 1 << 20):
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(block_size), b''):
+                digest.update(block)
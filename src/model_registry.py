@@ -0,0 +1,95 @@
+import os
+from pathlib import Path
+from src.booster_model import BoosterModel
+from src.model_cache import ModelCache
+from src.model_versions import ModelVersions
+from src.predictor import Predictor
+
+"""
+Registry of all models saved in one folder.
+Every subfolder that contains a model artifact (directly or in its current version) is served by its name,
+models are loaded lazily through shared cache.
+Names of static /predict routes (cache, models, shadow) are reserved: such folders would be shadowed by the routes,
+so they are neither listed nor served.
+
+Example:
+    registry = ModelRegistry(
+        models_folder = "../saved_models",
+        cache = ModelCache(max_bytes=512 * 1024 ** 2)
+    )
+    registry.predictor("xgb_model").predict()
+    registry.report()
+"""
+
+class ModelRegistry:
+
+    RESERVED_NAMES = ('cache', 'models', 'shadow')
+
+    def __init__(self, models_folder: str|Path, cache: ModelCache):
+        self.__models_folder = Path(models_folder)
+        self.__cache = cache
+
+    """
+    Returns sorted names of all models in the folder.
+    """
+    def names(self) -> list:
+        with os.scandir(self.__models_folder) as entries:
+            names = [
+                entry.name for entry in entries
+                if self.__valid_name(entry.name) and entry.is_dir() and self.__is_model(Path(entry.path))
+            ]
+        return sorted(names)
+
+    """
+    Returns folder of model with given name.
+    Only the requested folder is checked, so lookup cost does not depend on the number of models.
+    Names with path separators or dot names are rejected, so lookup never leaves the models folder.
+    """
+    def folder(self, model_name: str) -> Path:
+        if model_name in self.RESERVED_NAMES:
+            raise FileNotFoundError(f"Model name '{model_name}' is reserved for /predict/{model_name} route")
+        model_folder = self.__models_folder / model_name
+        if not self.__valid_name(model_name) or not model_folder.is_dir() or not self.__is_model(model_folder):
+            raise FileNotFoundError(f"Model '{model_name}' not found in {self.__models_folder}")
+        return model_folder
+
+    """
+    Returns predictor for model with given name that shares registry cache.
+    """
+    def predictor(self, model_name: str) -> Predictor:
+        return Predictor(self.folder(model_name), cache=self.__cache)
+
+    """
+    Returns every model with its current version, residency, size in bytes and load time.
+    """
+    def report(self) -> list:
+        resident = self.__cache.resident()
+        report = []
+        for name in self.names():
+            versions = ModelVersions(self.__models_folder / name)
+            entry = resident.get(str(versions.current().resolve()))
+            report.append({
+                'name': name,
+                'version': versions.version(),
+                'resident': entry is not None,
+                'size_bytes': entry['size_bytes'] if entry else 0,
+                'load_seconds': entry['load_seconds'] if entry else 0.0
+            })
+        return report
+
+    """
+    Checks that model name is a single folder name inside the models folder and is not reserved by a route.
+    """
+    def __valid_name(self, model_name: str) -> bool:
+        return (
+            model_name not in ('', '.', '..', *self.RESERVED_NAMES)
+            and '/' not in model_name and '\\' not in model_name
+        )
+
+    """
+    Checks that current version of folder contains model artifact named after the folder.
+    """
+    def __is_model(self, model_folder: Path) -> bool:
+        extensions = ('joblib',) + BoosterModel.FORMATS
+        version_folder = ModelVersions(model_folder).current()
+        return any((version_folder / (model_folder.name + "." + extension)).exists() for extension in extensions)
@@ -1,7 +1,15 @@
 import joblib
 import os
+import shutil
 import pandas as pd
 from typing import Any, Self
+from src.booster_model import BoosterModel
+from src.feature_matrix import FeatureMatrix
+from src.model_fingerprint import ModelFingerprint
+from src.model_versions import ModelVersions
+from src.saved_prediction import SavedPrediction
+from src.stage_timer import StageTimer
+from src.tree_evaluator import TreeEvaluator
 
 """
 Model class for prediction target that trains and saves model.
@@ -31,31 +39,75 @@ class ModelTrainer:
     def __init__(self, model: Any, features: pd.DataFrame):
         self.__model = model
         self.__features = features
+        self.__target_name = None
 
     """
     Trains the model using time-series logic.
     """
+    @StageTimer.timed('trainer.train')
     def train(self, target: pd.DataFrame) -> Self:
         x, y = self.__process_to_equel_months(self.__features, target)
         self.__fit_model(x, y)
+        self.__target_name = str(target.columns[1])
         return self
 
     """
     Saves the trained model to the directory for using it in prediction class.
+    Also saves prediction for the last features row with model fingerprint to prediction.json.
+    Model format is 'joblib' (pickle) or native XGBoost 'ubj'/'json' with metadata.json.
+    Features are saved as memory-mappable features.npy with schema and target name, features.csv is written only if features_csv is set.
+    XGBoost models are also saved compiled for TreeEvaluator (tree_evaluator.npy), which servers memory-map with engine='numpy'.
+    Artifacts are written to a staging directory and published as a new version with one atomic switch,
+    so readers never see partially written files.
     """
-    def save_model(self, folder_path: str, model_name: str) -> str:
+    @StageTimer.timed('trainer.save_model')
+    def save_model(self, folder_path: str, model_name: str, model_format: str = 'joblib', features_csv: bool = False) -> str:
         model_folder = os.path.join(folder_path, model_name)
-        os.makedirs(model_folder, exist_ok=True)
-        model_file = os.path.join(model_folder, model_name + '.joblib')
-        joblib.dump(self.__model, model_file)
-        features_file = os.path.join(model_folder, 'features.csv')
-        self.__features.to_csv(features_file, index=False)
+        versions = ModelVersions(model_folder)
+        staging = versions.stage()
+        try:
+            model_file = os.path.join(staging, model_name + '.' + model_format)
+            if model_format == 'joblib':
+                joblib.dump(self.__model, model_file)
+            else:
+                BoosterModel.save(self.__model, model_file)
+            FeatureMatrix.save(self.__features, staging, csv=features_csv, target=self.__target_name)
+            self.__save_compiled(staging)
+            self.__save_prediction(staging)
+            versions.publish(staging)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
         abs_path = os.path.abspath(model_folder)
         return abs_path
 
+    """
+    Writes tree evaluator compiled from XGBoost model, so that servers can memory-map it instead of loading model.
+    Models the evaluator does not support are saved without it.
+    """
+    @StageTimer.timed('trainer.save_compiled')
+    def __save_compiled(self, model_folder: str):
+        if TreeEvaluator.booster_of(self.__model) is None:
+            return
+        try:
+            evaluator = TreeEvaluator.from_model(self.__model)
+        except ValueError:
+            return
+        evaluator.save_compiled(model_folder)
+
+    """
+    Predicts the last features row and writes it with fingerprint of saved artifacts.
+    """
+    @StageTimer.timed('trainer.save_prediction')
+    def __save_prediction(self, model_folder: str):
+        last_features = self.__features.drop(columns=['Month'], errors='ignore').iloc[[-1]]
+        prediction = float(self.__model.predict(last_features)[0])
+        SavedPrediction(model_folder).save(prediction, ModelFingerprint(model_folder).hexdigest())
+
     """
     Fits the model.
     """
+    @StageTimer.timed('trainer.fit')
     def __fit_model(self, x, y):
         self.__model.fit(x, y)
 
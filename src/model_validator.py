@@ -1,5 +1,6 @@
 import pandas as pd
 from typing import Any, List, Tuple
+from src.stage_timer import StageTimer
 
 """
 Model validation class that tests model performance using time-series walk-forward validation.
@@ -33,6 +34,7 @@ class ModelValidator:
     """
     Validates the model using walk-forward time-series approach and returns predictions, proportions and MAPE.
     """
+    @StageTimer.timed('validator.validate')
     def validate(self, target: pd.DataFrame) -> pd.DataFrame:
         x, y = self.__process_to_equel_months(self.__features, target)
         splits = self.__get_splits(len(x))
@@ -48,6 +50,7 @@ class ModelValidator:
     """
     Trains split and gets metrics of current model.
     """
+    @StageTimer.timed('validator.train_and_predict')
     def __train_and_predict(self, x:pd.DataFrame, y:pd.Series, split:int, total:int) -> Tuple[str, float, float, float]:
         train_x, train_y = x.iloc[:split], y.iloc[:split]
         test_x, test_y = x.iloc[split:split + 1], y.iloc[split:split + 1]
@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from src.model_fingerprint import ModelFingerprint
+
+"""
+Versioned layout of the model folder with atomic publishing.
+Artifacts are written to a staging directory, checked into manifest.json with checksums,
+renamed into versions/<version> and made current by atomic replace of CURRENT pointer file.
+Readers resolve CURRENT once and read all artifacts from one immutable version folder.
+Model folders saved before versioning (artifacts directly in the folder) are resolved to the folder itself.
+
+Layout:
+    xgb_model/
+        CURRENT                 # id of current version
+        versions/
+            20250901T120000000000-1a2b3c4d/
+                xgb_model.joblib
+                features.npy
+                features.schema.json
+                prediction.json
+                manifest.json
+
+Example:
+    versions = ModelVersions("../saved_models/xgb_model")
+    staging = versions.stage()
+    ... write artifacts to staging ...
+    versions.publish(staging)
+    versions.current()
+"""
+
+class ModelVersions:
+
+    CURRENT_FILE = 'CURRENT'
+    VERSIONS_DIR = 'versions'
+    MANIFEST_FILE = 'manifest.json'
+
+    def __init__(self, model_folder: str|Path, keep: int = 3):
+        self.__model_folder = Path(model_folder)
+        self.__keep = keep
+
+    """
+    Returns folder with artifacts of current version or model folder itself if it is not versioned.
+    """
+    def current(self) -> Path:
+        version = self.version()
+        if version is None:
+            return self.__model_folder
+        return self.__model_folder / self.VERSIONS_DIR / version
+
+    """
+    Returns id of current version or None if model folder is not versioned.
+    """
+    def version(self) -> str|None:
+        try:
+            with open(self.__model_folder / self.CURRENT_FILE, encoding='utf-8') as file:
+                return file.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    """
+    Creates empty staging directory for artifacts of a new version.
+    """
+    def stage(self) -> Path:
+        versions_folder = self.__model_folder / self.VERSIONS_DIR
+        versions_folder.mkdir(parents=True, exist_ok=True)
+        staging = versions_folder / f".staging-{self.__new_version()}"
+        staging.mkdir()
+        return staging
+
+    """
+    Writes manifest, moves staging directory into versions and atomically makes it current.
+    Old versions beyond keep limit are removed. Returns id of published version.
+    """
+    def publish(self, staging: str|Path) -> str:
+        staging = Path(staging)
+        version = staging.name.removeprefix('.staging-')
+        self.__write_manifest(staging, version)
+        os.rename(staging, self.__model_folder / self.VERSIONS_DIR / version)
+        self.__switch_current(version)
+        self.__remove_old_versions(version)
+        return version
+
+    """
+    Returns manifest of version folder or None if folder has no manifest.
+    """
+    @staticmethod
+    def manifest(version_folder: str|Path) -> dict|None:
+        try:
+            with open(Path(version_folder) / ModelVersions.MANIFEST_FILE, encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    """
+    Returns fingerprint recorded in manifest of version folder or computes it from artifacts of unversioned folder.
+    """
+    @staticmethod
+    def fingerprint(version_folder: str|Path) -> str:
+        manifest = ModelVersions.manifest(version_folder)
+        if manifest is not None:
+            return manifest['fingerprint']
+        return ModelFingerprint(version_folder).hexdigest()
+
+    """
+    Checks that every file listed in manifest exists and has the recorded checksum.
+    """
+    @staticmethod
+    def verify(version_folder: str|Path) -> bool:
+        manifest = ModelVersions.manifest(version_folder)
+        if manifest is None:
+            return False
+        for name, entry in manifest['files'].items():
+            path = Path(version_folder) / name
+            if not path.exists() or ModelVersions.__sha256(path) != entry['sha256']:
+                return False
+        return True
+
+    """
+    Builds version id sortable by publish time (UTC, microseconds) with random suffix.
+    """
+    def __new_version(self) -> str:
+        return datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f') + '-' + uuid.uuid4().hex[:8]
+
+    """
+    Writes manifest with checksum and size of every artifact and fingerprint of the version.
+    """
+    def __write_manifest(self, staging: Path, version: str):
+        files = {}
+        for path in sorted(staging.iterdir()):
+            if path.is_file() and path.name != self.MANIFEST_FILE:
+                files[path.name] = {'sha256': self.__sha256(path), 'size': path.stat().st_size}
+        manifest = {
+            'version': version,
+            'fingerprint': ModelFingerprint(staging).hexdigest(),
+            'files': files
+        }
+        with open(staging / self.MANIFEST_FILE, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+
+    """
+    Replaces CURRENT pointer file atomically.
+    """
+    def __switch_current(self, version: str):
+        temporary = self.__model_folder / f".{self.CURRENT_FILE}.{uuid.uuid4().hex[:8]}"
+        with open(temporary, 'w', encoding='utf-8') as file:
+            file.write(version)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.__model_folder / self.CURRENT_FILE)
+
+    """
+    Removes oldest versions except current one, keeping at most keep versions.
+    Versions still opened by readers on platforms that forbid removal are left for the next publish.
+    """
+    def __remove_old_versions(self, current: str):
+        versions_folder = self.__model_folder / self.VERSIONS_DIR
+        versions = sorted(path.name for path in versions_folder.iterdir() if not path.name.startswith('.'))
+        old = [version for version in versions if version != current][:max(len(versions) - self.__keep, 0)]
+        for version in old:
+            shutil.rmtree(versions_folder / version, ignore_errors=True)
+
+    """
+    Computes sha256 of file content.
+    """
+    @staticmethod
+    def __sha256(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
@@ -1,46 +1,398 @@
-import joblib
 import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import Any
+from src.booster_model import BoosterModel
+from src.feature_matrix import FeatureMatrix
+from src.feature_roller import FeatureRoller
+from src.model_cache import ModelCache
+from src.model_versions import ModelVersions
+from src.saved_prediction import SavedPrediction
+from src.tree_evaluator import TreeEvaluator
+from src.stage_timer import StageTimer
 
 """
 Loads a trained model and predicts for the latest row of the provided DataFrame.
+If cache is given, loaded model and features are kept in memory until model folder files change.
+If folder contains prediction.json saved for the same model fingerprint, its value is returned without loading the model.
+Loading, fingerprinting and model calls are timed as stages through StageTimer.
+Versioned model folders are resolved to the current version once per call, so all artifacts of one call come from one version
+and a newly published version is picked up by the next call.
+With engine='numpy' XGBoost models are compiled into TreeEvaluator arrays and predicted without XGBoost call overhead,
+evaluator compiled by ModelTrainer is memory-mapped so that all server workers share one copy of it.
+Simulation rolls thousands of perturbed exogenous paths forward as one stacked matrix, one model call per month,
+and returns forecast quantiles instead of a single point forecast.
 
 Example:
     Predictor(
         models_folder = "../saved_models/xgb_model"
     )
     .predict()
+
+    predictor = Predictor(models_folder = "../saved_models/xgb_model")
+    predictor.predict_many(predictor.features(start="2025-01-01", end="2025-06-01"))
+    predictor.forecast(horizon=12)
+    predictor.simulate(horizon=12, paths=10000, seed=42, quantiles=(0.05, 0.5, 0.95))
+    predictor.scenarios(overrides={"External feature 4": 16.0}, grid={"Deals": [1500, 1700], "Apartment features 1": [290, 300, 310]})
 """
 
 class Predictor:
 
-    def __init__(self, model_folder: str|Path):
+    ENGINES = ('xgboost', 'numpy')
+    QUANTILES = (0.05, 0.5, 0.95)
+
+    def __init__(self, model_folder: str|Path, cache: ModelCache|None = None, engine: str = 'xgboost'):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown inference engine: {engine}")
         self.__model_folder = Path(model_folder)
+        self.__cache = cache
+        self.__engine = engine
 
     """
     Predicts the target for the next month.
     """
     def predict(self) -> float:
-        model = self.__load_model(self.__model_folder)
-        features = self.__last_month_features(self.__model_folder)
-        prediction = model.predict(features)
+        model_folder = self.version_folder()
+        precomputed = self.__cached(model_folder, 'prediction', self.__precomputed_prediction)
+        if precomputed is not None:
+            return precomputed
+        model = self.__cached(model_folder, self.__model_artifact(), self.__engine_model)
+        last_features = self.__last_month_features(model_folder)
+        with StageTimer.stage('predictor.model_predict'):
+            prediction = model.predict(last_features)
         return float(prediction[0])
 
+    """
+    Returns content fingerprint of model artifacts, computed once until folder files change.
+    """
+    def fingerprint(self) -> str:
+        return self.__cached(self.version_folder(), 'fingerprint', self.__fingerprint)
+
+    """
+    Returns folder with artifacts of the current model version.
+    """
+    def version_folder(self) -> Path:
+        return ModelVersions(self.__model_folder).current()
+
+    """
+    Loads model even if saved prediction makes predict skip it, then predicts the next month as requests do.
+    """
+    def warm_up(self) -> float:
+        model_folder = self.version_folder()
+        self.__cached(model_folder, self.__model_artifact(), self.__engine_model)
+        return self.predict()
+
+    """
+    Predicts the target for every row of features frame with one model call.
+    Columns are reordered to the order used in training, Month column is ignored.
+    """
+    def predict_many(self, features: pd.DataFrame) -> np.ndarray:
+        model_folder = self.version_folder()
+        model = self.__cached(model_folder, self.__model_artifact(), self.__engine_model)
+        columns = self.__feature_columns(model_folder)
+        missing = [col for col in columns if col not in features.columns]
+        if missing:
+            raise KeyError(f"Features are missing columns: {missing}")
+        with StageTimer.stage('predictor.model_predict_many'):
+            prediction = model.predict(features[columns])
+        return np.asarray(prediction, dtype=float)
+
+    """
+    Predicts the target for horizon months ahead, result is cached per model version and horizon.
+    Every next month is predicted from the previous row rolled forward in one reused buffer:
+    previous prediction becomes the newest target value, other raw columns keep their last known values,
+    lags, rolling statistics and differences are recomputed from rolled history by FeatureRoller
+    and sin/cos seasonality is rotated by one month step.
+    """
+    def forecast(self, horizon: int) -> pd.DataFrame:
+        if horizon < 1:
+            raise ValueError(f"Forecast horizon must be positive, got {horizon}")
+        model_folder = self.version_folder()
+        artifact = f"{self.__model_artifact()}.forecast.{horizon}"
+        forecast = self.__cached(model_folder, artifact, lambda folder: self.__roll_forward(folder, horizon))
+        return forecast.copy()
+
+    """
+    Simulates distribution of forecast for horizon months ahead.
+    Every path starts from the last features row, at every next month exogenous raw columns move by month-over-month change
+    of a randomly drawn historical month (whole row of changes, so joint movements of features are kept),
+    target takes the path's previous prediction, features are recomputed and seasonality is rotated as in forecast.
+    All paths of one month are predicted with one model call, workers split paths into blocks predicted in parallel threads.
+    Draws depend only on seed, so result does not depend on number of workers.
+    Returns DataFrame with Month, mean and one column per quantile named by percent ('p5', 'p50', 'p95').
+    """
+    def simulate(self, horizon: int, paths: int = 1000, seed: int|None = None, workers: int = 1,
+                 quantiles: tuple = QUANTILES) -> pd.DataFrame:
+        if horizon < 1 or paths < 1 or workers < 1:
+            raise ValueError(f"Horizon, paths and workers must be positive, got {horizon}, {paths}, {workers}")
+        if any(not 0 <= q <= 1 for q in quantiles):
+            raise ValueError(f"Quantiles must be between 0 and 1, got {list(quantiles)}")
+        model_folder = self.version_folder()
+        model = self.__cached(model_folder, self.__model_artifact(), self.__engine_model)
+        matrix = self.__cached(model_folder, 'features', self.__stored_features)
+        roller, target_index = self.__roller(matrix, horizon)
+        exogenous, changes = self.__monthly_changes(roller, target_index)
+        draws = np.random.default_rng(seed).integers(0, max(len(changes), 1), size=(horizon - 1, paths))
+        blocks = np.array_split(np.arange(paths), min(workers, paths))
+
+        def simulate_block(block: np.ndarray) -> np.ndarray:
+            return self.__simulate_paths(model, matrix, roller, target_index, exogenous, changes, draws[:, block], horizon)
+
+        with StageTimer.stage('predictor.simulate'):
+            if len(blocks) == 1:
+                predictions = simulate_block(blocks[0])
+            else:
+                with ThreadPoolExecutor(max_workers=len(blocks), thread_name_prefix="simulation") as pool:
+                    predictions = np.concatenate(list(pool.map(simulate_block, blocks)), axis=1)
+        result = pd.DataFrame({'Month': self.__forecast_months(matrix, horizon), 'mean': predictions.mean(axis=1)})
+        for q, values in zip(quantiles, np.quantile(predictions, quantiles, axis=1)):
+            result[f"p{q * 100:g}"] = values
+        return result
+
+    """
+    Predicts the next month for every variant of the last features row in one model call.
+    Overrides set columns of all variants, grid gives values of columns whose Cartesian product makes the variants.
+    Columns may be named as features ('External feature 4 lag1') or as raw data columns ('External feature 4').
+    Returns predictions shaped by grid: one axis per grid column in given order.
+    """
+    def scenarios(self, overrides: dict|None = None, grid: dict|None = None) -> np.ndarray:
+        shape = tuple(len(values) for values in (grid or {}).values())
+        return self.scenario_block(overrides, grid, 0, int(np.prod(shape, dtype=np.int64))).reshape(shape)
+
+    """
+    Predicts variants with flat grid positions from start to stop (exclusive) in one model call.
+    Only rows of these variants are materialized, so large grids can be scored block by block.
+    Version folder pins all blocks of one grid to one model version, current version is used if it is not given.
+    """
+    def scenario_block(self, overrides: dict|None, grid: dict|None, start: int, stop: int,
+                       version_folder: str|Path|None = None) -> np.ndarray:
+        model_folder = Path(version_folder) if version_folder is not None else self.version_folder()
+        model = self.__cached(model_folder, self.__model_artifact(), self.__engine_model)
+        matrix = self.__cached(model_folder, 'features', self.__stored_features)
+        columns = matrix.columns()
+        grid = grid or {}
+        shape = tuple(len(values) for values in grid.values())
+        base = np.array(matrix.last(), dtype=np.float64)
+        for column, value in (overrides or {}).items():
+            base[0, self.__column_index(columns, column)] = value
+        with StageTimer.stage('predictor.scenarios_materialize'):
+            positions = np.unravel_index(np.arange(start, stop, dtype=np.int64), shape) if shape else ()
+            variants = np.repeat(base, stop - start, axis=0)
+            for axis, (column, values) in enumerate(grid.items()):
+                variants[:, self.__column_index(columns, column)] = np.asarray(values, dtype=np.float64)[positions[axis]]
+        with StageTimer.stage('predictor.model_predict_many'):
+            prediction = model.predict(self.__model_input(model, variants, columns))
+        return np.asarray(prediction, dtype=float)
+
+    """
+    Gives stored features rows with months between start and end inclusive.
+    """
+    def features(self, start: str|None = None, end: str|None = None) -> pd.DataFrame:
+        matrix = self.__cached(self.version_folder(), 'features', self.__stored_features)
+        months = pd.to_datetime(pd.Series(matrix.months()))
+        mask = np.ones(len(matrix), dtype=bool)
+        if start is not None:
+            mask &= (months >= pd.Timestamp(start)).to_numpy()
+        if end is not None:
+            mask &= (months <= pd.Timestamp(end)).to_numpy()
+        return matrix.frame(mask)
+
+    """
+    Predicts months one by one, feeding every prediction into the target history of the next month.
+    """
+    @StageTimer.timed('predictor.forecast')
+    def __roll_forward(self, model_folder: str|Path, horizon: int) -> pd.DataFrame:
+        model = self.__cached(model_folder, self.__model_artifact(), self.__engine_model)
+        matrix = self.__cached(model_folder, 'features', self.__stored_features)
+        roller, target_index = self.__roller(matrix, horizon)
+        rotate = self.__season_rotation(matrix)
+        row = np.array(matrix.last(), dtype=np.float64)
+        history = roller.history(1) if roller is not None else None
+        predictions = np.empty(horizon, dtype=np.float64)
+        for step in range(horizon):
+            if step > 0:
+                values = history[:, :, -1].copy()
+                values[:, target_index] = predictions[step - 1]
+                roller.push(history, values)
+                roller.write(history, row)
+                rotate(row)
+            predictions[step] = float(model.predict(self.__model_input(model, row, matrix.columns()))[0])
+        return pd.DataFrame({'Month': self.__forecast_months(matrix, horizon), 'prediction': predictions})
+
+    """
+    Predicts block of simulated paths month by month in one reused paths x features buffer.
+    Returns predictions shaped (horizon, paths).
+    """
+    def __simulate_paths(self, model, matrix: FeatureMatrix, roller: FeatureRoller|None, target_index: int|None,
+                         exogenous: list, changes: np.ndarray, draws: np.ndarray, horizon: int) -> np.ndarray:
+        rotate = self.__season_rotation(matrix)
+        rows = np.repeat(np.array(matrix.last(), dtype=np.float64), draws.shape[1], axis=0)
+        history = roller.history(draws.shape[1]) if roller is not None else None
+        predictions = np.empty((horizon, draws.shape[1]), dtype=np.float64)
+        for step in range(horizon):
+            if step > 0:
+                values = history[:, :, -1].copy()
+                values[:, target_index] = predictions[step - 1]
+                values[:, exogenous] += changes[draws[step - 1]]
+                roller.push(history, values)
+                roller.write(history, rows)
+                rotate(rows)
+            predictions[step] = model.predict(self.__model_input(model, rows, matrix.columns()))
+        return predictions
+
+    """
+    Gives history indices of exogenous raw columns and their historical month-over-month changes, one row per month.
+    Months with unknown raw values (first rows without enough history) are left out of changes.
+    """
+    def __monthly_changes(self, roller: FeatureRoller|None, target_index: int|None) -> tuple:
+        if roller is None:
+            return [], np.empty((0, 0))
+        exogenous = [index for index in range(len(roller.raw_columns())) if index != target_index]
+        changes = roller.changes(exogenous)
+        if len(changes) == 0:
+            raise ValueError("At least two stored feature rows with known raw values are needed to simulate month-over-month changes")
+        return exogenous, changes
+
+    """
+    Gives feature roller and history index of target that receives previous prediction, None for one month horizon.
+    """
+    def __roller(self, matrix: FeatureMatrix, horizon: int) -> tuple:
+        if horizon == 1:
+            return None, None
+        roller = FeatureRoller(matrix)
+        if matrix.target() is None or matrix.target() not in roller.raw_columns():
+            raise ValueError("Model has no saved target lag feature, save the model again to forecast more than one month")
+        return roller, roller.raw_columns().index(matrix.target())
+
+    """
+    Gives function that moves sin_season and cos_season of all rows one month forward in place.
+    Month step is the rotation angle between the last two stored rows, so seasonality period is not needed.
+    """
+    def __season_rotation(self, matrix: FeatureMatrix):
+        columns = matrix.columns()
+        if 'sin_season' not in columns or 'cos_season' not in columns or len(matrix) < 2:
+            return lambda row: None
+        sin_index, cos_index = columns.index('sin_season'), columns.index('cos_season')
+        previous, last = matrix.row(-2)[0], matrix.row(-1)[0]
+        step_sin = last[sin_index] * previous[cos_index] - last[cos_index] * previous[sin_index]
+        step_cos = last[cos_index] * previous[cos_index] + last[sin_index] * previous[sin_index]
+
+        def rotate(rows: np.ndarray):
+            sin, cos = rows[:, sin_index].copy(), rows[:, cos_index].copy()
+            rows[:, sin_index] = sin * step_cos + cos * step_sin
+            rows[:, cos_index] = cos * step_cos - sin * step_sin
+
+        return rotate
+
+    """
+    Gives index of feature column by its name or by name of raw data column it is lagged from.
+    """
+    def __column_index(self, columns: list, column: str) -> int:
+        for name in (column, f"{column} lag1"):
+            if name in columns:
+                return columns.index(name)
+        raise KeyError(f"Unknown feature column: {column}")
+
+    """
+    Gives model input for rows: array for native models, DataFrame with training columns for others.
+    """
+    def __model_input(self, model, rows: np.ndarray, columns: list):
+        if isinstance(model, (BoosterModel, TreeEvaluator)):
+            return rows
+        return pd.DataFrame(rows, columns=columns, copy=False)
+
+    """
+    Gives months of forecast starting from the month of the last stored row.
+    """
+    def __forecast_months(self, matrix: FeatureMatrix, horizon: int) -> list:
+        if matrix.months() is None:
+            return [None] * horizon
+        last = pd.Timestamp(matrix.months()[-1])
+        return [str((last + pd.DateOffset(months=step)).date()) for step in range(horizon)]
+
+    """
+    Gives artifact from cache or loads it from disk.
+    """
+    def __cached(self, model_folder: str|Path, artifact: str, loader):
+        if self.__cache is None:
+            return loader(model_folder)
+        return self.__cache.get(model_folder, lambda: loader(model_folder), artifact, group=self.__model_folder)
+
+    """
+    Gives prediction saved by ModelTrainer if it was made by the model currently stored in folder.
+    """
+    @StageTimer.timed('predictor.saved_prediction')
+    def __precomputed_prediction(self, model_folder: str|Path) -> float|None:
+        return SavedPrediction(model_folder).value(self.__cached(model_folder, 'fingerprint', self.__fingerprint))
+
+    """
+    Reads fingerprint from manifest of published version or computes it from artifacts in folder.
+    """
+    @StageTimer.timed('predictor.fingerprint')
+    def __fingerprint(self, model_folder: str|Path) -> str:
+        return ModelVersions.fingerprint(model_folder)
+
     """
     Gives last month features for prediction.
     """
     def __last_month_features(self, model_folder: str|Path) -> pd.DataFrame:
-        features_path = os.path.join(model_folder, "features.csv")
-        features = pd.read_csv(features_path)
-        last_features = features.drop(columns=['Month'], errors='ignore').iloc[[-1]]
+        matrix = self.__cached(model_folder, 'features', self.__stored_features)
+        last_features = pd.DataFrame(matrix.last(), columns=matrix.columns())
         return last_features
 
     """
-    Loads model from folder.
+    Gives names of feature columns in training order.
+    """
+    def __feature_columns(self, model_folder: str|Path) -> list:
+        return self.__cached(model_folder, 'features', self.__stored_features).columns()
+
+    """
+    Loads all features saved with the model (memory-mapped .npy or legacy features.csv).
+    """
+    @StageTimer.timed('predictor.load_features')
+    def __stored_features(self, model_folder: str|Path) -> FeatureMatrix:
+        return FeatureMatrix.load(model_folder)
+
+    """
+    Gives cache name of the model artifact, compiled models are cached apart from loaded ones.
+    """
+    def __model_artifact(self) -> str:
+        return 'model' if self.__engine == 'xgboost' else 'model.' + self.__engine
+
+    """
+    Loads model and compiles it for numpy engine if it is a tree booster, other models are used as loaded.
+    Evaluator compiled at save time is opened memory-mapped, so server workers share its pages and XGBoost is not loaded.
+    """
+    def __engine_model(self, model_folder: str|Path):
+        if self.__engine == 'numpy' and TreeEvaluator.compiled_exists(model_folder):
+            return self.__open_compiled(model_folder)
+        model = self.__load_model(model_folder)
+        if self.__engine == 'numpy' and TreeEvaluator.booster_of(model) is not None:
+            return TreeEvaluator.from_model(model)
+        return model
+
+    """
+    Opens tree evaluator compiled next to the model as read-only memory map.
+    """
+    @StageTimer.timed('predictor.open_compiled')
+    def __open_compiled(self, model_folder: str|Path) -> TreeEvaluator:
+        return TreeEvaluator.load_compiled(model_folder)
+
+    """
+    Loads model from folder, model files are named after the model folder.
+    Native XGBoost artifact is preferred, pickled .joblib model is used otherwise.
+    joblib is imported here so that reading saved prediction does not pay for it.
     """
-    def __load_model(self, model_folder: str|Path) -> joblib.load:
-        model_name = os.path.basename(os.path.normpath(model_folder))
+    @StageTimer.timed('predictor.load_model')
+    def __load_model(self, model_folder: str|Path) -> Any:
+        import joblib
+        model_name = os.path.basename(os.path.normpath(self.__model_folder))
+        for model_format in BoosterModel.FORMATS:
+            native_path = os.path.join(model_folder, model_name + "." + model_format)
+            if os.path.exists(native_path):
+                return BoosterModel(native_path)
         model_path = os.path.join(model_folder, model_name + ".joblib")
         model = joblib.load(model_path)
-        return model
\ No newline at end of file
+        return model
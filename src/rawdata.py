@@ -1,51 +1,240 @@
+import importlib.util
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from typing import Iterator
+from src.feature_engine import FeatureEngine
+from src.stage_timer import StageTimer
+
+ARROW_INSTALLED = importlib.util.find_spec('pyarrow') is not None
 
 """
 Processes raw data to features and target values for prediction model.
+File is parsed lazily and at most once per RawData object: features and target of one pipeline run
+read the same parsed frame. If target is requested before features, only Month and target columns are read.
+Features are built by FeatureEngine from spec of lags, rolling windows and differences, 1-month lags by default.
+Panel data with many series in one file is supported by series key columns: rows are sorted by series and month once
+after parsing, features of all series are computed in one vectorized pass and every series gets its own next month.
+Large exports are read in streaming mode when rows per batch or memory limit is set: the file is parsed in typed batches
+(pyarrow streaming reader if pyarrow is installed, pandas chunks otherwise, parser can be chosen explicitly), types are fixed after the first rows
+(numeric columns as float64, explicit dtypes win, text columns such as series keys are left to the parser),
+only needed columns are parsed and rows of one batch take at most a quarter of memory limit.
+pyarrow is imported only when a file is streamed with it. Parsed data above the limit raises MemoryError instead of exhausting the worker,
+FeatureStore.ingest builds features from batches without holding the whole file.
 
 Examples:
-    df = (
-        RawData("../data/raw_data.csv")
-        .make_features()
-    )
-    df = (
-        RawData("../data/raw_data.csv")
-        .target('Deals')
-    )
+    raw = RawData("../data/raw_data.csv")
+    features = raw.make_features()
+    target = raw.target('Deals')
+    features = raw.make_features(spec={'lags': 3, 'rolling': {'mean': [3]}, 'diffs': [1]})
+    panel = RawData("../data/panel.csv", series=['Complex', 'Segment'])
+    features = panel.make_features(spec={'lags': 3})
+    export = RawData("../data/export.csv", dtypes={'Deals': 'float32'}, memory_limit=2**30)
+    for batch in export.batches(['Month', 'Deals']):
+        ...
 """
 
 class RawData:
 
-    def __init__(self, file_path):
+    PARSERS = ('pandas', 'pyarrow')
+    CHUNK_ROWS = 100_000
+    SAMPLE_ROWS = 1_000
+    BATCH_SHARE = 4
+    ARROW_BLOCK_BYTES = 2**24
+
+    def __init__(self, file_path, series: str|list|None = None, dtypes: dict|None = None,
+                 chunk_rows: int|None = None, memory_limit: int|None = None, parser: str|None = None):
+        parser = parser or ('pyarrow' if ARROW_INSTALLED else 'pandas')
+        if parser not in self.PARSERS:
+            raise ValueError(f"Unknown CSV parser: {parser}")
+        if parser == 'pyarrow' and not ARROW_INSTALLED:
+            raise ValueError("pyarrow parser is requested, but pyarrow is not installed")
         self.__path = Path(file_path)
+        self.__parser = parser
+        self.__series = [series] if isinstance(series, str) else list(series or [])
+        self.__dtypes = dict(dtypes or {})
+        self.__chunk_rows = chunk_rows
+        self.__memory_limit = memory_limit
+        self.__frame = None
 
     """
-    Creates 1-month lag features for all numerical columns to use it for Features class.
+    Creates features for all numerical columns to use it for Features class, 1-month lags if spec is not given.
+    See FeatureEngine for spec format. For panel data series columns follow Month.
     """
-    def make_features(self) -> pd.DataFrame:
-        df = self.__load_csv(self.__path)
+    @StageTimer.timed('rawdata.make_features')
+    def make_features(self, spec: dict|None = None) -> pd.DataFrame:
+        df = self.__data()
+        if self.__series:
+            return self.__create_panel_feature(df, spec)
         df = self.__add_next_month(df)
-        features = self.__create_feature(df)
+        features = self.__create_feature(df, spec)
         return features
 
     """
-    Creates target column to use it for training models.
+    Creates target column to use it for training models, for panel data with series columns after Month.
     """
+    @StageTimer.timed('rawdata.target')
     def target(self, target_param:str) -> pd.DataFrame:
-        df = self.__load_csv(self.__path)
-        df = df[['Month', target_param]]
-        return df
+        columns = ['Month', *self.__series, target_param]
+        if self.__frame is None:
+            return self.__sort(self.__load_csv(self.__path, columns=columns))
+        return self.__frame[columns]
+
+    """
+    Returns series key columns, empty list for single series data.
+    """
+    def series(self) -> list:
+        return list(self.__series)
+
+    """
+    Yields typed batches of raw data in file order with datetime Month column, only given columns if they are set.
+    Batches have the same dtypes, rows of one batch take at most a quarter of memory limit if it is set.
+    """
+    def batches(self, columns: list|None = None) -> Iterator[pd.DataFrame]:
+        if self.__parser == 'pyarrow':
+            return self.__arrow_batches(columns)
+        return self.__pandas_batches(columns)
+
+    """
+    Returns parsed raw data with datetime Month column, the file is parsed on first call only.
+    Panel data is sorted by series and month.
+    """
+    def frame(self) -> pd.DataFrame:
+        return self.__data()
+
+    """
+    Private function that parses the whole file on first call and returns the same frame afterwards.
+    """
+    def __data(self) -> pd.DataFrame:
+        if self.__frame is None:
+            self.__frame = self.__sort(self.__load_csv(self.__path))
+        return self.__frame
 
     """
-    Private function for loading data. 
+    Private function that sorts panel data by series and month once, single series data is returned as is.
+    """
+    def __sort(self, df: pd.DataFrame) -> pd.DataFrame:
+        if not self.__series:
+            return df
+        return df.sort_values([*self.__series, 'Month'], kind='stable', ignore_index=True)
+
     """
-    def __load_csv(self, path:str) -> pd.DataFrame:
-        df = pd.read_csv(path)
+    Private function for loading data, only given columns are parsed if they are set.
+    In streaming mode the file is parsed in batches and parsed data is checked against memory limit.
+    """
+    @StageTimer.timed('rawdata.read_csv')
+    def __load_csv(self, path:str, columns: list|None = None) -> pd.DataFrame:
+        if self.__chunk_rows is not None or self.__memory_limit is not None:
+            return self.__concat(self.batches(columns), columns)
+        df = pd.read_csv(path, usecols=columns, dtype=self.__column_dtypes(self.__dtypes, columns))
         df['Month'] = pd.to_datetime(df['Month'])
         return df
 
+    """
+    Private function that joins batches, MemoryError is raised as soon as parsed data exceeds memory limit.
+    File without rows gives empty frame with its columns.
+    """
+    def __concat(self, batches: Iterator[pd.DataFrame], columns: list|None = None) -> pd.DataFrame:
+        frames = []
+        size = 0
+        for batch in batches:
+            size += int(batch.memory_usage(deep=True).sum())
+            if self.__memory_limit is not None and size > self.__memory_limit:
+                raise MemoryError(f"Raw data {self.__path} needs more than {self.__memory_limit} bytes, "
+                                  f"read fewer columns, narrower dtypes or use FeatureStore.ingest")
+            frames.append(batch)
+        if not frames:
+            empty = pd.read_csv(self.__path, usecols=columns, nrows=0)
+            empty['Month'] = pd.to_datetime(empty['Month'])
+            return empty
+        return pd.concat(frames, ignore_index=True)
+
+    """
+    Private function for pandas batches: first rows are parsed with type inference, their types are fixed
+    for the rest of the file and size of their rows gives rows per batch under memory limit.
+    """
+    def __pandas_batches(self, columns: list|None = None) -> Iterator[pd.DataFrame]:
+        sample_rows = min(self.SAMPLE_ROWS, self.__chunk_rows or self.SAMPLE_ROWS)
+        sample, dtypes = self.__sample(columns, sample_rows)
+        yield from self.__split(sample)
+        if len(sample) < sample_rows:
+            return
+        rows = self.__batch_rows(sample, self.CHUNK_ROWS)
+        reader = pd.read_csv(self.__path, usecols=columns, dtype=dtypes, skiprows=range(1, sample_rows + 1), chunksize=rows)
+        for batch in reader:
+            batch['Month'] = pd.to_datetime(batch['Month'])
+            yield from self.__split(batch)
+
+    """
+    Private function for pyarrow batches: types of the first rows are given to the streaming reader for the whole file,
+    so later blocks are converted to the same types, converted blocks are split to fit memory limit.
+    Only numeric types are fixed, text columns are converted by pyarrow itself.
+    """
+    def __arrow_batches(self, columns: list|None = None) -> Iterator[pd.DataFrame]:
+        import pyarrow
+        from pyarrow import csv as pyarrow_csv
+        block_size = self.ARROW_BLOCK_BYTES
+        if self.__memory_limit is not None:
+            block_size = max(2**16, min(block_size, self.__memory_limit // self.BATCH_SHARE))
+        _, dtypes = self.__sample(columns, self.SAMPLE_ROWS)
+        column_types = {
+            column: pyarrow.from_numpy_dtype(dtype)
+            for column, dtype in dtypes.items() if isinstance(dtype, np.dtype) and pd.api.types.is_numeric_dtype(dtype)
+        }
+        reader = pyarrow_csv.open_csv(
+            str(self.__path),
+            read_options=pyarrow_csv.ReadOptions(block_size=block_size),
+            convert_options=pyarrow_csv.ConvertOptions(include_columns=columns, column_types=column_types)
+        )
+        for record_batch in reader:
+            batch = record_batch.to_pandas()
+            batch['Month'] = pd.to_datetime(batch['Month'])
+            yield from self.__split(batch)
+
+    """
+    Private function that parses first rows with type inference and returns them with types fixed for the whole file:
+    numeric columns are float64 (later rows may have decimals or empty values), explicit dtypes win.
+    """
+    def __sample(self, columns: list|None, rows: int) -> tuple[pd.DataFrame, dict]:
+        explicit = self.__column_dtypes(self.__dtypes, columns)
+        sample = pd.read_csv(self.__path, usecols=columns, dtype=explicit, nrows=rows)
+        dtypes = {
+            column: np.dtype(np.float64) if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype) else dtype
+            for column, dtype in sample.dtypes.items() if column != 'Month'
+        }
+        dtypes.update({column: pd.api.types.pandas_dtype(dtype) for column, dtype in explicit.items()})
+        sample = sample.astype(dtypes)
+        sample['Month'] = pd.to_datetime(sample['Month'])
+        return sample, dtypes
+
+    """
+    Private function that splits batch into parts of at most chunk_rows rows and a quarter of memory limit.
+    """
+    def __split(self, batch: pd.DataFrame) -> Iterator[pd.DataFrame]:
+        rows = self.__batch_rows(batch, max(len(batch), 1))
+        if len(batch) <= rows:
+            yield batch
+            return
+        for start in range(0, len(batch), rows):
+            yield batch.iloc[start:start + rows].reset_index(drop=True)
+
+    """
+    Private function for rows per batch: chunk_rows if it is set or default otherwise,
+    limited to rows of batch size that fit into a quarter of memory limit.
+    """
+    def __batch_rows(self, batch: pd.DataFrame, default: int) -> int:
+        rows = self.__chunk_rows or default
+        if self.__memory_limit is None or len(batch) == 0:
+            return rows
+        row_bytes = max(1, int(batch.memory_usage(deep=True, index=False).sum()) // len(batch))
+        return max(1, min(rows, self.__memory_limit // self.BATCH_SHARE // row_bytes))
+
+    """
+    Private function that leaves explicit dtypes of parsed columns only.
+    """
+    def __column_dtypes(self, dtypes: dict, columns: list|None) -> dict:
+        return {column: dtype for column, dtype in dtypes.items() if columns is None or column in columns}
+
     """
     Private function to add next month row with NaN values for numerical columns.
     """
@@ -56,12 +245,23 @@ class RawData:
         return pd.concat([df, pd.DataFrame([next_row])], ignore_index=True)
 
     """
-    Private function for feature dataframe template. 
+    Private function for feature dataframe: every month after the first gets features of rows before it.
+    """
+    def __create_feature(self, df, spec: dict|None = None) -> pd.DataFrame:
+        history = df.iloc[:-1].drop(columns=['Month'])
+        return FeatureEngine(spec).transform(history, df['Month'].iloc[1:])
+
     """
-    def __create_feature(self, df) -> pd.DataFrame:
-        features = pd.DataFrame()
-        features['Month'] = df['Month']
-        for col in df.select_dtypes(include=[np.number]).columns:
-            features[f'{col} lag1'] = df[col].shift(1)
-        features = features.iloc[1:].reset_index(drop=True)
-        return features
\ No newline at end of file
+    Private function for panel feature dataframe: every row gives features of the next month of its series.
+    Series are processed in one pass with segment starts, the last row of every series gives its next month.
+    """
+    def __create_panel_feature(self, df, spec: dict|None = None) -> pd.DataFrame:
+        starts = FeatureEngine.segment_starts(df, self.__series)
+        ends = np.append(starts[1:], True)
+        months = df['Month']
+        next_months = np.where(ends, months + pd.DateOffset(months=1), months.shift(-1))
+        history = df.drop(columns=['Month', *self.__series])
+        features = FeatureEngine(spec).transform(history, pd.to_datetime(next_months), starts)
+        for position, key in enumerate(self.__series, start=1):
+            features.insert(position, key, df[key].to_numpy())
+        return features
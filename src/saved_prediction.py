@@ -0,0 +1,44 @@
+import json
+import os
+from pathlib import Path
+
+"""
+Next month prediction saved next to model artifacts (prediction.json) together with fingerprint of the artifacts.
+Uses only standard library, so the saved value is read without importing NumPy, pandas or the model stack.
+
+Example:
+    SavedPrediction("../saved_models/xgb_model/versions/<version>").save(1669.0, fingerprint)
+    SavedPrediction("../saved_models/xgb_model/versions/<version>").value(fingerprint)
+"""
+
+class SavedPrediction:
+
+    FILE = 'prediction.json'
+
+    def __init__(self, model_folder: str|Path):
+        self.__path = os.path.join(model_folder, self.FILE)
+
+    """
+    Checks that prediction was saved.
+    """
+    def exists(self) -> bool:
+        return os.path.exists(self.__path)
+
+    """
+    Returns saved prediction if it was made for artifacts with given fingerprint, otherwise None.
+    """
+    def value(self, fingerprint: str) -> float|None:
+        if not self.exists():
+            return None
+        with open(self.__path, encoding='utf-8') as file:
+            saved = json.load(file)
+        if saved.get('fingerprint') != fingerprint:
+            return None
+        return float(saved['prediction'])
+
+    """
+    Writes prediction with fingerprint of artifacts it was made by.
+    """
+    def save(self, prediction: float, fingerprint: str):
+        with open(self.__path, 'w', encoding='utf-8') as file:
+            json.dump({'prediction': float(prediction), 'fingerprint': fingerprint}, file)
@@ -0,0 +1,86 @@
+import functools
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable
+
+"""
+Process-wide timing hooks for pipeline stages (loading model, reading CSV, building features, fitting, predicting).
+Stages are wrapped once with decorator or with-block and report their duration to a recorder set by the application.
+Without recorder a hook is one attribute check, so hooks stay in code and cost nearly nothing when timing is off.
+
+Example:
+    StageTimer.enable(lambda stage, seconds: print(stage, seconds))
+
+    @StageTimer.timed('predictor.load_model')
+    def load_model(...): ...
+
+    with StageTimer.stage('predictor.model_predict'):
+        model.predict(features)
+"""
+
+class StageTimer:
+
+    __recorder = None
+    __disabled = nullcontext()
+
+    """
+    Starts reporting stage durations to recorder called with stage name and seconds.
+    """
+    @staticmethod
+    def enable(recorder: Callable[[str, float], None]):
+        StageTimer.__recorder = recorder
+
+    """
+    Stops reporting stage durations.
+    """
+    @staticmethod
+    def disable():
+        StageTimer.__recorder = None
+
+    """
+    Checks that durations are reported.
+    """
+    @staticmethod
+    def enabled() -> bool:
+        return StageTimer.__recorder is not None
+
+    """
+    Returns context manager that times block as stage, or shared no-op context manager if timing is off.
+    """
+    @staticmethod
+    def stage(name: str):
+        recorder = StageTimer.__recorder
+        if recorder is None:
+            return StageTimer.__disabled
+        return StageTimer.__timing(name, recorder)
+
+    """
+    Returns decorator that times every call of function as stage.
+    """
+    @staticmethod
+    def timed(name: str) -> Callable:
+        def decorate(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                recorder = StageTimer.__recorder
+                if recorder is None:
+                    return function(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    recorder(name, time.perf_counter() - started)
+            return wrapper
+        return decorate
+
+    """
+    Times block and reports its duration, also when block raises.
+    """
+    @staticmethod
+    @contextmanager
+    def __timing(name: str, recorder: Callable[[str, float], None]):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            recorder(name, time.perf_counter() - started)
@@ -0,0 +1,282 @@
+import json
+import os
+import numpy as np
+from pathlib import Path
+from typing import Any
+
+"""
+Pure-NumPy evaluator of XGBoost tree ensembles for low-latency inference.
+Trees from the booster JSON dump are compiled into flat arrays (feature index, threshold, children, default direction,
+leaf value) and all trees are walked at once for a block of rows, one vectorized step per tree level.
+Leaves point to themselves, so every row makes the same number of steps and no per-row branching is needed.
+Splits follow XGBoost rules: go left if value < threshold in float32, missing values follow the default direction.
+Compiled arrays can be saved next to the model as one node record file and opened memory-mapped,
+so every server worker process maps the same read-only pages instead of holding its own copy of the model.
+
+Example:
+    evaluator = TreeEvaluator.from_model(XGBRegressor().fit(x, y))
+    evaluator.predict(x)
+
+    TreeEvaluator.load("../saved_models/xgb_model/versions/<version>/xgb_model.json").predict(x)
+
+    evaluator.save_compiled(staging)
+    TreeEvaluator.load_compiled("../saved_models/xgb_model/versions/<version>").predict(x)
+"""
+
+class TreeEvaluator:
+
+    LINKS = {
+        'reg:squarederror': 'identity',
+        'reg:squaredlogerror': 'identity',
+        'reg:pseudohubererror': 'identity',
+        'reg:absoluteerror': 'identity',
+        'reg:linear': 'identity',
+        'reg:logistic': 'logistic',
+        'binary:logistic': 'logistic',
+        'count:poisson': 'log',
+        'reg:gamma': 'log',
+        'reg:tweedie': 'log'
+    }
+    BLOCK_NODES = 1 << 20
+    NODES_FILE = 'tree_evaluator.npy'
+    META_FILE = 'tree_evaluator.json'
+    NODE_DTYPE = np.dtype([
+        ('feature', np.int64),
+        ('threshold', np.float32),
+        ('left', np.int64),
+        ('right', np.int64),
+        ('default_left', np.bool_),
+        ('value', np.float64)
+    ])
+
+    def __init__(self, model: dict):
+        learner = model['learner']
+        self.__check_single_output(learner['learner_model_param'])
+        self.__link = self.__objective_link(learner['objective']['name'])
+        self.__base_margin = self.__margin(self.__base_score(learner['learner_model_param']['base_score']))
+        trees, weights = self.__trees(learner['gradient_booster'])
+        self.__compile(trees, weights)
+
+    """
+    Returns number of compiled trees.
+    """
+    def __len__(self) -> int:
+        return len(self.__roots)
+
+    """
+    Returns depth of the deepest tree, that is number of traversal steps per row.
+    """
+    def depth(self) -> int:
+        return self.__depth
+
+    """
+    Predicts target for every row of features frame or array.
+    """
+    def predict(self, features: Any) -> np.ndarray:
+        values = np.asarray(features, dtype=np.float32)
+        if values.ndim == 1:
+            values = values.reshape(1, -1)
+        if values.shape[1] < self.__num_features:
+            raise ValueError(f"Model expects {self.__num_features} features, got {values.shape[1]}")
+        return self.__transform(self.__base_margin + self.__leaf_sum(values))
+
+    """
+    Compiles booster of fitted XGBoost model, Booster or BoosterModel.
+    """
+    @staticmethod
+    def from_model(model: Any) -> 'TreeEvaluator':
+        booster = TreeEvaluator.booster_of(model)
+        if booster is None:
+            raise ValueError(f"Tree evaluator supports only XGBoost models, got {type(model).__name__}")
+        return TreeEvaluator(json.loads(bytes(booster.save_raw(raw_format='json'))))
+
+    """
+    Compiles model saved in XGBoost JSON format without loading XGBoost.
+    """
+    @staticmethod
+    def load(model_path: str|Path) -> 'TreeEvaluator':
+        with open(model_path, encoding='utf-8') as file:
+            return TreeEvaluator(json.load(file))
+
+    """
+    Writes compiled nodes as one record array and scalar parameters as JSON into folder.
+    """
+    def save_compiled(self, folder: str|Path):
+        nodes = np.empty(len(self.__feature), dtype=self.NODE_DTYPE)
+        nodes['feature'] = self.__feature
+        nodes['threshold'] = self.__threshold
+        nodes['left'] = self.__left
+        nodes['right'] = self.__right
+        nodes['default_left'] = self.__default_left
+        nodes['value'] = self.__value
+        np.save(os.path.join(folder, self.NODES_FILE), nodes)
+        meta = {
+            'link': self.__link,
+            'base_margin': self.__base_margin,
+            'depth': self.__depth,
+            'num_features': self.__num_features,
+            'roots': self.__roots.tolist()
+        }
+        with open(os.path.join(folder, self.META_FILE), 'w', encoding='utf-8') as file:
+            json.dump(meta, file)
+
+    """
+    Checks that folder contains compiled evaluator.
+    """
+    @staticmethod
+    def compiled_exists(folder: str|Path) -> bool:
+        return os.path.exists(os.path.join(folder, TreeEvaluator.NODES_FILE)) and \
+            os.path.exists(os.path.join(folder, TreeEvaluator.META_FILE))
+
+    """
+    Opens evaluator saved by save_compiled without XGBoost.
+    With mmap node arrays are read-only views of the file shared through page cache by all processes that open it.
+    """
+    @staticmethod
+    def load_compiled(folder: str|Path, mmap: bool = True) -> 'TreeEvaluator':
+        with open(os.path.join(folder, TreeEvaluator.META_FILE), encoding='utf-8') as file:
+            meta = json.load(file)
+        nodes = np.load(os.path.join(folder, TreeEvaluator.NODES_FILE), mmap_mode='r' if mmap else None)
+        evaluator = TreeEvaluator.__new__(TreeEvaluator)
+        evaluator.__link = meta['link']
+        evaluator.__base_margin = float(meta['base_margin'])
+        evaluator.__depth = int(meta['depth'])
+        evaluator.__num_features = int(meta['num_features'])
+        evaluator.__roots = np.asarray(meta['roots'], dtype=np.int64)
+        evaluator.__feature = nodes['feature']
+        evaluator.__threshold = nodes['threshold']
+        evaluator.__left = nodes['left']
+        evaluator.__right = nodes['right']
+        evaluator.__default_left = nodes['default_left']
+        evaluator.__value = nodes['value']
+        return evaluator
+
+    """
+    Returns XGBoost booster of the model or None if model is not a tree booster.
+    """
+    @staticmethod
+    def booster_of(model: Any) -> Any:
+        if hasattr(model, 'get_booster'):
+            return model.get_booster()
+        if hasattr(model, 'booster') and callable(model.booster):
+            return model.booster()
+        if hasattr(model, 'save_raw'):
+            return model
+        return None
+
+    """
+    Rejects multi-class and multi-target models that have more than one output per row.
+    """
+    def __check_single_output(self, params: dict):
+        for name in ('num_class', 'num_target'):
+            if int(params.get(name, 0) or 0) > 1:
+                raise ValueError(f"Tree evaluator supports only single-output models, got {name}={params[name]}")
+
+    """
+    Returns link function of objective.
+    """
+    def __objective_link(self, objective: str) -> str:
+        if objective not in self.LINKS:
+            raise ValueError(f"Tree evaluator does not support objective {objective}")
+        return self.LINKS[objective]
+
+    """
+    Parses base score stored as number or one-element list string like '[5E-1]'.
+    """
+    def __base_score(self, value: Any) -> float:
+        return float(str(value).strip('[]'))
+
+    """
+    Converts base score from prediction space to margin space.
+    """
+    def __margin(self, score: float) -> float:
+        if self.__link == 'logistic':
+            return float(np.log(score / (1.0 - score)))
+        if self.__link == 'log':
+            return float(np.log(score))
+        return score
+
+    """
+    Converts summed margin to prediction space.
+    """
+    def __transform(self, margin: np.ndarray) -> np.ndarray:
+        if self.__link == 'logistic':
+            return 1.0 / (1.0 + np.exp(-margin))
+        if self.__link == 'log':
+            return np.exp(margin)
+        return margin
+
+    """
+    Returns trees and their weights (dropout weights for dart, ones for gbtree).
+    """
+    def __trees(self, gradient_booster: dict) -> tuple[list, list]:
+        if gradient_booster['name'] == 'dart':
+            trees = gradient_booster['gbtree']['model']['trees']
+            return trees, list(gradient_booster['weight_drop'])
+        if gradient_booster['name'] != 'gbtree':
+            raise ValueError(f"Tree evaluator does not support booster {gradient_booster['name']}")
+        trees = gradient_booster['model']['trees']
+        return trees, [1.0] * len(trees)
+
+    """
+    Concatenates nodes of all trees into flat arrays with global child indices.
+    """
+    def __compile(self, trees: list, weights: list):
+        features, thresholds, lefts, rights, defaults, values, roots = [], [], [], [], [], [], []
+        depth, offset = 0, 0
+        for tree, weight in zip(trees, weights):
+            if any(int(split_type) != 0 for split_type in tree.get('split_type', [])):
+                raise ValueError("Tree evaluator does not support categorical splits")
+            left = np.asarray(tree['left_children'], dtype=np.int64)
+            right = np.asarray(tree['right_children'], dtype=np.int64)
+            conditions = np.asarray(tree['split_conditions'], dtype=np.float32)
+            leaf = left == -1
+            nodes = np.arange(len(left))
+            features.append(np.where(leaf, 0, np.asarray(tree['split_indices'], dtype=np.int64)))
+            thresholds.append(np.where(leaf, np.float32(0), conditions))
+            lefts.append(np.where(leaf, nodes, left) + offset)
+            rights.append(np.where(leaf, nodes, right) + offset)
+            defaults.append(np.asarray(tree['default_left'], dtype=bool))
+            values.append(np.where(leaf, conditions.astype(np.float64) * weight, 0.0))
+            roots.append(offset)
+            depth = max(depth, self.__tree_depth(left, right))
+            offset += len(left)
+        self.__feature = np.concatenate(features) if features else np.zeros(0, dtype=np.int64)
+        self.__threshold = np.concatenate(thresholds) if thresholds else np.zeros(0, dtype=np.float32)
+        self.__left = np.concatenate(lefts) if lefts else np.zeros(0, dtype=np.int64)
+        self.__right = np.concatenate(rights) if rights else np.zeros(0, dtype=np.int64)
+        self.__default_left = np.concatenate(defaults) if defaults else np.zeros(0, dtype=bool)
+        self.__value = np.concatenate(values) if values else np.zeros(0, dtype=np.float64)
+        self.__roots = np.asarray(roots, dtype=np.int64)
+        self.__depth = depth
+        self.__num_features = int(self.__feature.max()) + 1 if len(self.__feature) else 0
+
+    """
+    Computes number of split levels of one tree.
+    """
+    def __tree_depth(self, left: np.ndarray, right: np.ndarray) -> int:
+        depth, level = 0, [0]
+        while True:
+            level = [child for node in level for child in (left[node], right[node]) if child != -1]
+            if not level:
+                return depth
+            depth += 1
+
+    """
+    Walks all trees for rows in blocks that keep node index matrix bounded and sums leaf values per row.
+    """
+    def __leaf_sum(self, values: np.ndarray) -> np.ndarray:
+        result = np.zeros(values.shape[0], dtype=np.float64)
+        if len(self.__roots) == 0:
+            return result
+        block_rows = max(1, self.BLOCK_NODES // len(self.__roots))
+        for start in range(0, values.shape[0], block_rows):
+            block = values[start:start + block_rows]
+            rows = np.arange(block.shape[0])[:, None]
+            nodes = np.broadcast_to(self.__roots, (block.shape[0], len(self.__roots))).copy()
+            for _ in range(self.__depth):
+                value = block[rows, self.__feature[nodes]]
+                go_left = np.where(np.isnan(value), self.__default_left[nodes], value < self.__threshold[nodes])
+                nodes = np.where(go_left, self.__left[nodes], self.__right[nodes])
+            result[start:start + block.shape[0]] = self.__value[nodes].sum(axis=1)
+        return result
@@ -0,0 +1,54 @@
+import asyncio
+import unittest
+from scripts.benchmark_api import benchmark_api, compare, percentile
+
+"""
+Unit tests for API load-testing harness.
+
+Benchmark runs against in-process app and baseline comparison flags regressions.
+"""
+
+class TestBenchmarkApi(unittest.TestCase):
+    """
+    In-process benchmark sends all requests and reports latency percentiles without errors.
+    """
+    def test_inprocess_benchmark_reports_latency(self):
+        report = asyncio.run(benchmark_api(["predict", "batch"], concurrency=4, requests=20, warmup=2))
+        for name in ("predict", "batch"):
+            scenario = report["scenarios"][name]
+            self.assertEqual(scenario["requests"], 20, f"Not all {name} requests were sent")
+            self.assertEqual(scenario["error_rate"], 0.0, f"{name} requests failed: {scenario['statuses']}")
+            self.assertLessEqual(scenario["p50_ms"], scenario["p99_ms"], f"{name} percentiles are not ordered")
+
+    """
+    Benchmark with shadow model measures primary latency with shadow evaluation off and on and compares them.
+    """
+    def test_inprocess_benchmark_compares_latency_with_shadow(self):
+        report = asyncio.run(benchmark_api(["predict"], concurrency=2, requests=20, warmup=2, shadows=["xgb_testing_model"]))
+        shadow = report["shadow"]
+        self.assertEqual(report["scenarios"]["predict"]["error_rate"], 0.0, "Requests without shadow failed")
+        self.assertEqual(shadow["scenarios"]["predict"]["error_rate"], 0.0, "Requests with shadow failed")
+        self.assertGreater(shadow["report"]["submits"], 0, "Shadow evaluation was not on")
+        self.assertIn("xgb_testing_model", shadow["report"]["shadows"], "Shadow model was not evaluated")
+        self.assertIn("p95_ms", shadow["comparison"]["scenarios"]["predict"], "Latency with shadow was not compared")
+
+    """
+    Percentile uses nearest rank of sorted values.
+    """
+    def test_percentile_uses_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual((percentile(values, 50), percentile(values, 95), percentile(values, 99)), (50, 95, 99), "Percentiles are incorrect")
+
+    """
+    Comparison flags slower latency and passes unchanged throughput.
+    """
+    def test_compare_flags_latency_regression(self):
+        baseline = {"scenarios": {"predict": {"p50_ms": 2.0, "p95_ms": 4.0, "p99_ms": 6.0, "throughput_rps": 500.0, "error_rate": 0.0}}}
+        report = {"scenarios": {"predict": {"p50_ms": 2.0, "p95_ms": 8.0, "p99_ms": 6.0, "throughput_rps": 500.0, "error_rate": 0.0}}}
+        comparison = compare(report, baseline, tolerance=0.1)
+        self.assertTrue(comparison["regression"], "Latency regression was not flagged")
+        self.assertTrue(comparison["scenarios"]["predict"]["p95_ms"]["regression"], "p95 regression was not flagged")
+        self.assertFalse(comparison["scenarios"]["predict"]["throughput_rps"]["regression"], "Unchanged throughput was flagged")
+
+if __name__ == "__main__":
+    unittest.main()
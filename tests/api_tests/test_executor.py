@@ -0,0 +1,56 @@
+import asyncio
+import time
+import unittest
+from api.executor import InferenceExecutor, ExecutorBusyError
+
+"""
+Unit tests for bounded inference executor.
+
+Covers results, queue limit and timeout.
+"""
+
+class TestInferenceExecutor(unittest.TestCase):
+    """
+    Executor returns result of the function.
+    """
+    def test_run_returns_function_result(self):
+        executor = InferenceExecutor(kind="thread", workers=1, queue=0, timeout=5.0)
+        result = asyncio.run(executor.run(pow, 2, 10))
+        executor.shutdown()
+        self.assertEqual(result, 1024, "Executor returned wrong result")
+
+    """
+    Executor rejects jobs when workers and queue are full.
+    """
+    def test_run_rejects_when_queue_is_full(self):
+        executor = InferenceExecutor(kind="thread", workers=1, queue=0, timeout=5.0)
+
+        async def scenario():
+            first = asyncio.ensure_future(executor.run(time.sleep, 0.2))
+            await asyncio.sleep(0.01)
+            with self.assertRaises(ExecutorBusyError):
+                await executor.run(time.sleep, 0)
+            await first
+
+        asyncio.run(scenario())
+        executor.shutdown()
+
+    """
+    Executor raises TimeoutError for slow jobs and keeps slot until job ends.
+    """
+    def test_run_times_out_slow_job(self):
+        executor = InferenceExecutor(kind="thread", workers=1, queue=0, timeout=0.05)
+
+        async def scenario():
+            with self.assertRaises(TimeoutError):
+                await executor.run(time.sleep, 0.3)
+            in_flight = executor.in_flight()
+            await asyncio.sleep(0.4)
+            return in_flight, executor.in_flight()
+
+        during, after = asyncio.run(scenario())
+        executor.shutdown()
+        self.assertEqual((during, after), (1, 0), "Slot of timed out job was not held until job ended")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from fastapi.testclient import TestClient
+from api.main import app
+from api.executor import InferenceExecutor
+from api.routers.predict import warm_up_worker
+from api.warmup import WarmUp
+
+"""
+Unit tests for API health endpoints and startup warm-up.
+
+Liveness is always reported, readiness only after models were primed.
+"""
+
+class TestHealthEndpoints(unittest.TestCase):
+    """
+    Liveness endpoint returns HTTP 200 status code.
+    """
+    def test_live_endpoint_returns_200(self):
+        client = TestClient(app)
+        response = client.get("/health/live")
+        self.assertEqual(response.status_code, 200, "Liveness endpoint did not return 200 status code")
+
+    """
+    Readiness endpoint reports ready after startup warm-up finishes.
+    """
+    def test_ready_endpoint_reports_ready_after_warm_up(self):
+        with TestClient(app) as client:
+            deadline = time.monotonic() + 30
+            response = client.get("/health/ready")
+            while response.status_code != 200 and time.monotonic() < deadline:
+                time.sleep(0.1)
+                response = client.get("/health/ready")
+        self.assertEqual(response.status_code, 200, "Readiness endpoint did not become ready")
+        self.assertTrue(response.json()["ready"], "Readiness flag is not set")
+
+    """
+    Warm-up is not ready when a model fails to load.
+    """
+    def test_warm_up_is_not_ready_when_model_fails(self):
+        executor = InferenceExecutor(kind="thread", workers=1, queue=0, timeout=5.0)
+        warm_up = WarmUp(retries=0)
+
+        def fail(model_folder):
+            raise FileNotFoundError(model_folder)
+
+        asyncio.run(warm_up.run(executor, fail, {"missing_model": "missing_model"}))
+        executor.shutdown()
+        self.assertFalse(warm_up.ready(), "Warm-up reported ready after failure")
+        self.assertIsNotNone(warm_up.report()["missing_model"]["error"], "Warm-up error was not reported")
+
+    """
+    Failed model is retried with backoff and readiness recovers once it loads.
+    """
+    def test_warm_up_retries_failed_model(self):
+        executor = InferenceExecutor(kind="thread", workers=1, queue=0, timeout=5.0)
+        warm_up = WarmUp(backoff=0.01)
+        calls = []
+
+        def fail_twice(model_folder):
+            calls.append(model_folder)
+            if len(calls) < 3:
+                raise FileNotFoundError(model_folder)
+            return 1.0
+
+        asyncio.run(warm_up.run(executor, fail_twice, {"модель": "модель"}))
+        executor.shutdown()
+        self.assertTrue(warm_up.ready(), "Readiness did not recover after retries")
+        self.assertEqual(warm_up.report()["модель"]["attempts"], 3, "Failed model was not retried")
+
+    """
+    Warm-up waits for slow model longer than request timeout and optional models do not block readiness.
+    """
+    def test_warm_up_ignores_request_timeout_and_optional_models(self):
+        executor = InferenceExecutor(kind="thread", workers=1, queue=0, timeout=0.01)
+        warm_up = WarmUp(timeout=None, retries=0)
+
+        def load(model_folder):
+            if model_folder == "shadow_model":
+                raise FileNotFoundError(model_folder)
+            time.sleep(0.1)
+            return 1.0
+
+        asyncio.run(warm_up.run(executor, load, {"slow_model": "slow_model", "shadow_model": "shadow_model"}, optional=["shadow_model"]))
+        executor.shutdown()
+        report = warm_up.report()
+        self.assertTrue(warm_up.ready(), "Slow model or failed optional model blocked readiness")
+        self.assertIsNone(report["slow_model"]["error"], "Warm-up was cut by request timeout")
+        self.assertFalse(report["shadow_model"]["required"], "Optional model is reported as required")
+
+    """
+    Every process pool worker runs initializer before the pool is used.
+    """
+    def test_process_workers_run_initializer(self):
+        folder = tempfile.mkdtemp()
+        executor = InferenceExecutor(kind="process", workers=2, queue=0, timeout=5.0)
+        executor.set_initializer(mark_worker, folder)
+        asyncio.run(executor.start())
+        executor.shutdown()
+        marks = os.listdir(folder)
+        shutil.rmtree(folder)
+        self.assertEqual(len(marks), 2, "Not every process worker ran initializer")
+
+    """
+    Job run on workers reaches every process pool worker and gives one result per worker.
+    """
+    def test_run_on_workers_reaches_every_process_worker(self):
+        executor = InferenceExecutor(kind="process", workers=2, queue=0, timeout=5.0)
+        pids = asyncio.run(executor.run_on_workers(os.getpid))
+        executor.shutdown()
+        self.assertEqual(len(set(pids)), 2, "Job did not run in every process worker")
+
+    """
+    Warm-up of every worker runs the job in each process worker and fails when one of them fails.
+    """
+    def test_warm_up_fails_when_one_process_worker_fails(self):
+        folder = tempfile.mkdtemp()
+        executor = InferenceExecutor(kind="process", workers=2, queue=0, timeout=5.0)
+        executor.set_initializer(mark_worker, folder)
+        warm_up = WarmUp(retries=0)
+        asyncio.run(warm_up.run(executor, fail_in_one_worker, {"модель": folder}))
+        executor.shutdown()
+        shutil.rmtree(folder)
+        self.assertFalse(warm_up.ready(), "Warm-up reported ready although one worker failed")
+
+    """
+    Worker initializer logs warm-up failure instead of breaking the pool.
+    """
+    def test_warm_up_worker_logs_failure(self):
+        with self.assertLogs("api.predict", level="ERROR"):
+            warm_up_worker(["missing_model"])
+
+"""
+Writes file named after worker process id, used as process pool initializer.
+"""
+def mark_worker(folder: str):
+    Path(folder, str(os.getpid())).touch()
+
+"""
+Fails in the worker with the highest process id among workers marked in folder.
+"""
+def fail_in_one_worker(folder: str) -> float:
+    if os.getpid() == max(int(name) for name in os.listdir(folder)):
+        raise RuntimeError("Worker failed to warm up")
+    return 1.0
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import os
+import unittest
+from scripts.memory_report import memory_report
+
+"""
+Unit tests for memory report of server processes.
+"""
+
+class TestMemoryReport(unittest.TestCase):
+    """
+    Report of a process splits its resident memory into unique and shared parts.
+    """
+    def test_memory_report_splits_resident_memory(self):
+        report = memory_report(os.getpid())
+        current = report["processes"][0]
+        self.assertEqual(current["pid"], os.getpid(), "Report does not start with inspected process")
+        self.assertLessEqual(current["uss"], current["rss"], "Unique memory exceeds resident memory")
+        self.assertEqual(current["shared"], current["rss"] - current["uss"], "Shared memory is not the rest of resident memory")
+        self.assertGreaterEqual(report["total_rss"], current["rss"], "Totals do not include inspected process")
+
+
+if __name__ == "__main__":
+    unittest.main()
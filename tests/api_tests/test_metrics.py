@@ -0,0 +1,36 @@
+import unittest
+from fastapi.testclient import TestClient
+from api.main import app
+
+"""
+Unit tests for API metrics endpoint.
+
+/metrics exposes stage and request histograms and cache statistics in Prometheus text format.
+"""
+
+class TestMetricsEndpoint(unittest.TestCase):
+    """
+    Metrics endpoint returns Prometheus text with stage timings after prediction.
+    """
+    def test_metrics_contain_stage_histograms(self):
+        client = TestClient(app)
+        client.get("/predict")
+        response = client.get("/metrics")
+        self.assertEqual(response.status_code, 200, "Metrics endpoint did not return 200 status code")
+        self.assertIn("text/plain", response.headers["content-type"], "Metrics are not in Prometheus text format")
+        self.assertIn('demand_predictor_stage_seconds_count{stage="config.model"}', response.text, "Stage timings are missing")
+
+    """
+    Metrics contain cache statistics, model loads and in-flight gauges.
+    """
+    def test_metrics_contain_cache_and_in_flight_gauges(self):
+        client = TestClient(app)
+        client.get("/predict")
+        text = client.get("/metrics").text
+        for name in ("demand_predictor_cache_hits_total", "demand_predictor_model_loads_total",
+                     "demand_predictor_inference_in_flight", "demand_predictor_http_requests_in_flight",
+                     'route="/predict/"'):
+            self.assertIn(name, text, f"Metric {name} is missing")
+
+if __name__ == "__main__":
+    unittest.main()
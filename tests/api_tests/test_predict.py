@@ -1,6 +1,19 @@
+import asyncio
+import json
+import math
+import os
+import shutil
+import tempfile
 import unittest
+import joblib
+import pandas as pd
 from fastapi.testclient import TestClient
+from sklearn.linear_model import LinearRegression
 from api.main import app
+from api.models.request_models import ScenarioRequest
+from api.routers.predict import SCENARIO_CHUNK, predict_batch, predict_scenario_block, scenario_response
+from api.state import config
+from src.model_versions import ModelVersions
 
 """
 Unit tests for API prediction endpoint.
@@ -36,5 +49,290 @@ class TestPredictEndpoint(unittest.TestCase):
         value = data["predicted_deals"]
         self.assertIsInstance(value, (float, int), "Predicted deals is not numeric")
 
+    """
+    Cache endpoint reports hits after repeated predictions.
+    """
+    def test_cache_endpoint_counts_hits(self):
+        client = TestClient(app)
+        client.get("/predict")
+        client.get("/predict")
+        data = client.get("/predict/cache").json()
+        self.assertGreater(data["hits"], 0, "Repeated prediction was not served from cache")
+
+    """
+    Batch endpoint returns one prediction per stored month in range.
+    """
+    def test_batch_endpoint_predicts_month_range(self):
+        client = TestClient(app)
+        response = client.post("/predict/batch", json={"start_month": "2025-07-01", "end_month": "2025-09-01"})
+        data = response.json()
+        self.assertEqual(response.status_code, 200, "Batch endpoint did not return 200 status code")
+        self.assertEqual(len(data["months"]), len(data["predicted_deals"]), "Months and predictions differ in length")
+
+    """
+    Batch endpoint rejects feature rows with unknown columns.
+    """
+    def test_batch_endpoint_rejects_unknown_columns(self):
+        client = TestClient(app)
+        response = client.post("/predict/batch", json={"features": {"unknown": [1.0, 2.0]}})
+        self.assertEqual(response.status_code, 422, "Unknown columns were not rejected")
+
+    """
+    Batch endpoint rejects more feature rows than the configured limit.
+    """
+    def test_batch_endpoint_rejects_too_many_rows(self):
+        client = TestClient(app)
+        rows = config.max_batch_rows() + 1
+        response = client.post("/predict/batch", json={"features": {"Deals lag1": [1.0] * rows}})
+        self.assertEqual(response.status_code, 422, "Too many batch rows were not rejected")
+        self.assertIn("limit", response.json()["detail"], "Batch limit is not explained")
+
+    """
+    Batch prediction gives null instead of predictions that overflow to infinity.
+    """
+    def test_batch_maps_non_finite_to_none(self):
+        folder = tempfile.mkdtemp()
+        model_name = "пакет_∞"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder)
+        features = pd.DataFrame({'Month': ['2020-01-01', '2020-02-01', '2020-03-01'], 'Ставка lag1': [1.0, 2.0, 3.0]})
+        features.to_csv(os.path.join(model_folder, "features.csv"), index=False)
+        joblib.dump(LinearRegression().fit(features[['Ставка lag1']], [0.0, 1000.0, 2000.0]), os.path.join(model_folder, model_name + ".joblib"))
+        _, predictions = predict_batch(model_folder, {'Ставка lag1': [653.0, 1e307]}, None, None)
+        shutil.rmtree(folder)
+        self.assertTrue(math.isfinite(predictions[0]), "Finite prediction was changed")
+        self.assertIsNone(predictions[1], "Non-finite prediction was not mapped to None")
+
+    """
+    Forecast with horizon returns one month per step starting from the next month.
+    """
+    def test_predict_with_horizon_returns_forecast(self):
+        client = TestClient(app)
+        prediction = client.get("/predict").json()["predicted_deals"]
+        data = client.get("/predict", params={"horizon": 1}).json()
+        self.assertEqual(len(data["months"]), 1, "Forecast has wrong number of months")
+        self.assertEqual(int(data["predicted_deals"][0]), prediction, "First forecast month differs from prediction")
+
+    """
+    Bundled default model forecasts several months ahead, as in README example.
+    """
+    def test_predict_with_horizon_of_several_months(self):
+        client = TestClient(app)
+        response = client.get("/predict", params={"horizon": 6})
+        data = response.json()
+        self.assertEqual(response.status_code, 200, "Multi-month forecast of bundled model failed")
+        self.assertEqual(len(data["months"]), 6, "Forecast has wrong number of months")
+        self.assertEqual(len(data["predicted_deals"]), 6, "Forecast has wrong number of predictions")
+
+    """
+    Forecast horizon outside allowed range is rejected.
+    """
+    def test_predict_rejects_invalid_horizon(self):
+        client = TestClient(app)
+        response = client.get("/predict", params={"horizon": 0})
+        self.assertEqual(response.status_code, 422, "Invalid horizon was not rejected")
+
+    """
+    Scenario endpoint streams one prediction per grid point in columnar form.
+    """
+    def test_scenarios_endpoint_streams_grid(self):
+        client = TestClient(app)
+        response = client.post("/predict/scenarios", json={
+            "overrides": {"External feature 4": 16.0},
+            "grid": {"Deals": [1500.0, 1700.0], "Apartment features 1": [290.0, 300.0, 310.0]}
+        })
+        data = response.json()
+        self.assertEqual(response.status_code, 200, "Scenario endpoint did not return 200 status code")
+        self.assertEqual(data["shape"], [2, 3], "Scenario grid shape is incorrect")
+        self.assertEqual(len(data["predicted_deals"]), 6, "Not every grid point was predicted")
+
+    """
+    Scenario endpoint streams grids larger than one block with every variant in grid order.
+    """
+    def test_scenarios_endpoint_streams_many_blocks(self):
+        client = TestClient(app)
+        grid = {"Deals": [1500.0 + step for step in range(100)], "Apartment features 1": [290.0 + step for step in range(100)]}
+        response = client.post("/predict/scenarios", json={"grid": grid})
+        data = response.json()
+        first = client.post("/predict/scenarios", json={"grid": {"Deals": grid["Deals"][:1], "Apartment features 1": grid["Apartment features 1"]}}).json()
+        self.assertGreater(100 * 100, SCENARIO_CHUNK, "Grid fits into one block")
+        self.assertEqual(response.status_code, 200, "Scenario endpoint did not return 200 status code")
+        self.assertEqual(len(data["predicted_deals"]), 100 * 100, "Not every grid point was predicted")
+        self.assertEqual(data["predicted_deals"][:100], first["predicted_deals"], "Blocks are not in grid order")
+
+    """
+    Scenario block gives null instead of predictions that overflow to infinity.
+    """
+    def test_scenario_block_maps_non_finite_to_none(self):
+        folder = tempfile.mkdtemp()
+        model_name = "сценарий_∞"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder)
+        features = pd.DataFrame({'Month': ['2020-01-01', '2020-02-01', '2020-03-01'], 'Ставка lag1': [1.0, 2.0, 3.0]})
+        features.to_csv(os.path.join(model_folder, "features.csv"), index=False)
+        joblib.dump(LinearRegression().fit(features[['Ставка lag1']], [0.0, 1000.0, 2000.0]), os.path.join(model_folder, model_name + ".joblib"))
+        _, block = predict_scenario_block(model_folder, None, None, {'Ставка lag1': [569.0, 1e307, -1e307]}, 0, 3)
+        shutil.rmtree(folder)
+        self.assertTrue(math.isfinite(block[0]), "Finite prediction was changed")
+        self.assertEqual(block[1:], [None, None], "Non-finite predictions were not mapped to None")
+
+    """
+    Publishes version of linear model with given slope into versioned model folder.
+    """
+    def publish_linear_model(self, model_folder: str, slope: float):
+        versions = ModelVersions(model_folder)
+        staging = versions.stage()
+        features = pd.DataFrame({'Month': ['2020-01-01', '2020-02-01'], 'Ставка lag1': [1.0, 2.0]})
+        features.to_csv(os.path.join(staging, "features.csv"), index=False)
+        model = LinearRegression().fit(features[['Ставка lag1']], [slope, 2 * slope])
+        joblib.dump(model, os.path.join(staging, os.path.basename(model_folder) + ".joblib"))
+        versions.publish(staging)
+
+    """
+    Streams scenario response of grid larger than one block and runs action after the first block is sent.
+    """
+    def stream_scenarios(self, model_folder: str, grid: dict, action) -> dict:
+        async def stream() -> str:
+            response = await scenario_response(model_folder, ScenarioRequest(grid=grid))
+            parts = []
+            async for part in response.body_iterator:
+                parts.append(part)
+                if len(parts) == 3:
+                    action()
+            return "".join(parts)
+        return json.loads(asyncio.run(stream()))
+
+    """
+    All blocks of one scenario response are scored by the model version of the first block.
+    """
+    def test_scenarios_stream_pins_model_version(self):
+        folder = tempfile.mkdtemp()
+        model_folder = os.path.join(folder, "сценарий_версия")
+        os.makedirs(model_folder)
+        self.publish_linear_model(model_folder, 10.0)
+        values = [float(step) for step in range(SCENARIO_CHUNK + 100)]
+        data = self.stream_scenarios(model_folder, {'Ставка lag1': values}, lambda: self.publish_linear_model(model_folder, 20.0))
+        shutil.rmtree(folder)
+        self.assertNotIn("error", data, "Scenario stream failed")
+        self.assertTrue(all(math.isclose(prediction, 10.0 * value, abs_tol=1e-6) for prediction, value in zip(data["predicted_deals"], values)),
+                        "Blocks were scored by different model versions")
+        self.assertEqual(len(data["predicted_deals"]), len(values), "Not every grid point was predicted")
+
+    """
+    Failure of a later block ends scenario document with error field instead of truncated JSON.
+    """
+    def test_scenarios_stream_reports_error_of_later_block(self):
+        folder = tempfile.mkdtemp()
+        model_folder = os.path.join(folder, "сценарий_ошибка")
+        os.makedirs(model_folder)
+        self.publish_linear_model(model_folder, 10.0)
+        values = [float(step) for step in range(SCENARIO_CHUNK + 100)]
+        data = self.stream_scenarios(model_folder, {'Ставка lag1': values}, lambda: shutil.rmtree(model_folder))
+        shutil.rmtree(folder)
+        self.assertEqual(len(data["predicted_deals"]), SCENARIO_CHUNK, "Predictions of the first block are missing")
+        self.assertEqual(data["error"]["status_code"], 404, "Error of later block is not reported")
+        self.assertEqual(data["error"]["scored"], SCENARIO_CHUNK, "Number of scored variants is incorrect")
+
+    """
+    Scenario endpoint rejects unknown columns.
+    """
+    def test_scenarios_endpoint_rejects_unknown_columns(self):
+        client = TestClient(app)
+        response = client.post("/predict/scenarios", json={"grid": {"unknown": [1.0]}})
+        self.assertEqual(response.status_code, 422, "Unknown columns were not rejected")
+
+    """
+    Simulation endpoint returns mean and requested quantiles for every month.
+    """
+    def test_simulation_endpoint_returns_quantiles(self):
+        client = TestClient(app)
+        response = client.post("/predict/simulation", json={"horizon": 1, "paths": 200, "seed": 5, "quantiles": [0.1, 0.9]})
+        data = response.json()
+        self.assertEqual(response.status_code, 200, "Simulation endpoint did not return 200 status code")
+        self.assertEqual(len(data["months"]), 1, "Simulation has wrong number of months")
+        self.assertListEqual(sorted(data["quantiles"]), ["p10", "p90"], "Simulation quantiles are incorrect")
+        self.assertEqual(data, client.post("/predict/simulation", json={"horizon": 1, "paths": 200, "seed": 5, "quantiles": [0.1, 0.9]}).json(), "Equal seeds gave different simulations")
+
+    """
+    Bundled default model simulates several months ahead, as in README example.
+    """
+    def test_simulation_endpoint_with_horizon_of_several_months(self):
+        client = TestClient(app)
+        response = client.post("/predict/simulation", json={"horizon": 6, "paths": 200, "seed": 42})
+        data = response.json()
+        self.assertEqual(response.status_code, 200, "Multi-month simulation of bundled model failed")
+        self.assertEqual(len(data["months"]), 6, "Simulation has wrong number of months")
+        self.assertEqual(len(data["mean"]), 6, "Simulation has wrong number of means")
+
+    """
+    Simulation endpoint rejects too many paths.
+    """
+    def test_simulation_endpoint_rejects_too_many_paths(self):
+        client = TestClient(app)
+        response = client.post("/predict/simulation", json={"paths": 10_000_000})
+        self.assertEqual(response.status_code, 422, "Too many paths were not rejected")
+
+    """
+    Prediction names served model and shadow report is available without shadow models.
+    """
+    def test_predict_names_variant_and_reports_shadows(self):
+        client = TestClient(app)
+        response = client.get("/predict", headers={"X-Client-ID": "client-1"})
+        report = client.get("/predict/shadow")
+        self.assertEqual(response.headers["X-Model-Variant"], "xgb_model", "Default model was not named as variant")
+        self.assertEqual(report.status_code, 200, "Shadow report did not return 200 status code")
+        self.assertIn("submit_max_seconds", report.json(), "Shadow report has no scheduling time")
+
+    """
+    Models endpoint lists every saved model.
+    """
+    def test_models_endpoint_lists_saved_models(self):
+        client = TestClient(app)
+        names = [model["name"] for model in client.get("/predict/models").json()["models"]]
+        self.assertIn("xgb_testing_model", names, "Saved model is not listed")
+
+    """
+    Named model endpoint returns prediction of that model.
+    """
+    def test_named_model_endpoint_returns_prediction(self):
+        client = TestClient(app)
+        response = client.get("/predict/xgb_testing_model")
+        self.assertEqual(response.status_code, 200, "Named model endpoint did not return 200 status code")
+        self.assertIn("predicted_deals", response.json(), "Response does not contain predicted_deals key")
+
+    """
+    Named model endpoint returns 404 for unknown model.
+    """
+    def test_named_model_endpoint_returns_404_for_unknown_model(self):
+        client = TestClient(app)
+        response = client.get("/predict/unknown_model")
+        self.assertEqual(response.status_code, 404, "Unknown model did not return 404 status code")
+
+    """
+    Prediction response carries ETag and Cache-Control headers.
+    """
+    def test_predict_endpoint_sets_caching_headers(self):
+        client = TestClient(app)
+        response = client.get("/predict")
+        self.assertIn("etag", response.headers, "Response does not contain ETag header")
+        self.assertIn("max-age", response.headers.get("cache-control", ""), "Response does not contain Cache-Control header")
+
+    """
+    Request with matching If-None-Match gets 304 Not Modified.
+    """
+    def test_predict_endpoint_returns_304_for_matching_etag(self):
+        client = TestClient(app)
+        etag = client.get("/predict").headers["etag"]
+        response = client.get("/predict", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304, "Matching ETag did not return 304 status code")
+
+    """
+    Request with stale If-None-Match gets full prediction.
+    """
+    def test_predict_endpoint_returns_200_for_stale_etag(self):
+        client = TestClient(app)
+        response = client.get("/predict", headers={"If-None-Match": '"stale"'})
+        self.assertEqual(response.status_code, 200, "Stale ETag did not return 200 status code")
+
 if __name__ == "__main__":
     unittest.main()
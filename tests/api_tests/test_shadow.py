@@ -0,0 +1,91 @@
+import threading
+import time
+import unittest
+from api.shadow import ShadowRouter
+
+"""
+Unit tests for shadow and A/B routing.
+
+Covers stable traffic split, background shadow evaluation that does not block the caller,
+dropping of shadow jobs when queue is full and comparison report.
+"""
+
+class TestShadowRouter(unittest.TestCase):
+    """
+    Client keys are split by configured shares and every key always gets the same variant.
+    """
+    def test_variant_is_stable_per_key_and_follows_shares(self):
+        router = ShadowRouter(split={"кандидат_α": 0.2, "кандидат_β": 0.1}, shadows=[])
+        variants = [router.variant(f"клиент-{i}") for i in range(20000)]
+        self.assertEqual(variants[:100], [router.variant(f"клиент-{i}") for i in range(100)], "Variant of a key changed")
+        self.assertAlmostEqual(variants.count("кандидат_α") / len(variants), 0.2, delta=0.02, msg="First candidate share is wrong")
+        self.assertAlmostEqual(variants.count("кандидат_β") / len(variants), 0.1, delta=0.02, msg="Second candidate share is wrong")
+        self.assertAlmostEqual(variants.count(None) / len(variants), 0.7, delta=0.02, msg="Primary share is wrong")
+
+    """
+    Router without split always serves the primary model.
+    """
+    def test_variant_without_split_is_primary(self):
+        router = ShadowRouter(split={}, shadows=[])
+        self.assertIsNone(router.variant("клиент"), "Request without split was sent to a candidate")
+        self.assertFalse(router.splits(), "Empty split is reported as configured")
+
+    """
+    Shares above one are rejected.
+    """
+    def test_split_above_one_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ShadowRouter(split={"кандидат_α": 0.7, "кандидат_β": 0.4}, shadows=[])
+
+    """
+    Submit returns before slow shadow model finishes, pair is compared once it does.
+    """
+    def test_submit_does_not_wait_for_shadow(self):
+        router = ShadowRouter(split={}, shadows=["тень_γ"], workers=1, queue=4)
+        finished = threading.Event()
+
+        def slow_prediction(name: str) -> float:
+            time.sleep(0.3)
+            finished.set()
+            return 1700.0
+
+        started = time.perf_counter()
+        router.submit(slow_prediction, "основная", 1650.0)
+        elapsed = time.perf_counter() - started
+        finished.wait(5)
+        time.sleep(0.05)
+        report = router.report()
+        router.shutdown()
+        self.assertLess(elapsed, 0.1, "Submit waited for shadow model")
+        self.assertLessEqual(report["submit_max_seconds"], elapsed, "Scheduling time was not measured")
+        stats = report["shadows"]["тень_γ"]
+        self.assertEqual(stats["pairs"], 1, "Shadow pair was not recorded")
+        self.assertAlmostEqual(stats["mean_diff"], 50.0, msg="Shadow difference is wrong")
+        self.assertAlmostEqual(stats["mean_abs_diff"], 50.0, msg="Shadow absolute difference is wrong")
+
+    """
+    Shadow jobs beyond workers and queue are dropped, failures are counted.
+    """
+    def test_submit_drops_jobs_when_queue_is_full(self):
+        router = ShadowRouter(split={}, shadows=["тень_δ"], workers=1, queue=0)
+        release = threading.Event()
+
+        def blocked_prediction(name: str) -> float:
+            release.wait(5)
+            raise RuntimeError("сбой")
+
+        router.submit(blocked_prediction, "основная", 1650.0)
+        router.submit(blocked_prediction, "основная", 1650.0)
+        release.set()
+        deadline = time.perf_counter() + 5
+        while router.report()["pending"] and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        stats = router.report()["shadows"]["тень_δ"]
+        router.shutdown()
+        self.assertEqual(stats["dropped"], 1, "Job beyond queue was not dropped")
+        self.assertEqual(stats["errors"], 1, "Failed shadow evaluation was not counted")
+        self.assertEqual(stats["pairs"], 0, "Failed shadow evaluation was recorded as pair")
+
+
+if __name__ == "__main__":
+    unittest.main()
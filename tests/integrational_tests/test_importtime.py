@@ -0,0 +1,69 @@
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from src.model_fingerprint import ModelFingerprint
+from src.saved_prediction import SavedPrediction
+
+"""
+Integration test of CLI startup cost.
+
+Every subcommand is run with -X importtime and heavy modules must not be imported where subcommand does not need them.
+Imported modules are checked instead of wall-clock time, so results do not depend on the machine.
+"""
+
+ROOT = Path(__file__).parent.parent.parent
+HEAVY_MODULES = ('numpy', 'pandas', 'sklearn', 'xgboost', 'joblib', 'fastapi')
+
+class TestCliImportTime(unittest.TestCase):
+
+    """
+    Runs main.py with -X importtime and returns names of imported top-level modules.
+    """
+    def imported_modules(self, *args: str) -> set:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "main.py", *args],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        modules = set()
+        for line in result.stderr.splitlines():
+            match = re.match(r"import time:\s+\d+ \|\s+\d+ \|\s*(\S+)", line)
+            if match:
+                modules.add(match.group(1).split('.')[0])
+        return modules
+
+    """
+    Checks that CLI help is printed without importing model stack.
+    """
+    def test_help_imports_no_model_stack(self):
+        modules = self.imported_modules("--help")
+        self.assertFalse(modules & set(HEAVY_MODULES), f"Heavy modules imported: {modules & set(HEAVY_MODULES)}")
+
+    """
+    Checks that train arguments are parsed without importing training stack.
+    """
+    def test_train_help_imports_no_model_stack(self):
+        modules = self.imported_modules("train", "--help")
+        self.assertFalse(modules & set(HEAVY_MODULES), f"Heavy modules imported: {modules & set(HEAVY_MODULES)}")
+
+    """
+    Checks that predict with saved prediction of current artifacts uses only standard library.
+    """
+    def test_predict_with_saved_prediction_imports_no_model_stack(self):
+        folder = tempfile.mkdtemp()
+        model_folder = os.path.join(folder, "модель_импорт")
+        os.makedirs(model_folder)
+        with open(os.path.join(model_folder, "модель_импорт.joblib"), "wb") as file:
+            file.write(b"model")
+        SavedPrediction(model_folder).save(1669.0, ModelFingerprint(model_folder).hexdigest())
+        modules = self.imported_modules("predict", "--model_folder", model_folder)
+        shutil.rmtree(folder)
+        self.assertFalse(modules & set(HEAVY_MODULES), f"Heavy modules imported: {modules & set(HEAVY_MODULES)}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ import tempfile
 import os
 from xgboost import XGBRegressor
 from scripts.save_model import save_model
+from src.model_versions import ModelVersions
 
 """
 Integration test verifying the full model training and saving pipeline.
@@ -29,11 +30,11 @@ class TestSaveModelCanSaveValidArtifacts(unittest.TestCase):
             models_folder_path=temp_dir,
             model_name=model_name
         )
-        joblib_file = os.path.join(result_path, f"{model_name}.joblib")
+        joblib_file = os.path.join(ModelVersions(result_path).current(), f"{model_name}.joblib")
         self.assertTrue(os.path.exists(joblib_file), "Model joblib file was not created")
 
     """
-    Checks that features CSV file is created in correct location.
+    Checks that features matrix file is created in correct location.
     """
     def test_save_model_produces_features_file(self):
         temp_dir = tempfile.mkdtemp()
@@ -48,8 +49,8 @@ class TestSaveModelCanSaveValidArtifacts(unittest.TestCase):
             models_folder_path=temp_dir,
             model_name=model_name
         )
-        features_file = os.path.join(result_path, "features.csv")
-        self.assertTrue(os.path.exists(features_file), "Features CSV file was not created")
+        features_file = os.path.join(ModelVersions(result_path).current(), "features.npy")
+        self.assertTrue(os.path.exists(features_file), "Features matrix file was not created")
 
     """
     Checks that returned path matches expected model directory.
@@ -86,11 +87,11 @@ class TestSaveModelCanSaveValidArtifacts(unittest.TestCase):
             models_folder_path=temp_dir,
             model_name=model_name
         )
-        joblib_file = os.path.join(result_path, f"{model_name}.joblib")
+        joblib_file = os.path.join(ModelVersions(result_path).current(), f"{model_name}.joblib")
         self.assertGreater(os.path.getsize(joblib_file), 0, "Model joblib file is empty")
 
     """
-    Checks that features CSV file is not empty.
+    Checks that features matrix file is not empty.
     """
     def test_save_model_produces_non_empty_features(self):
         temp_dir = tempfile.mkdtemp()
@@ -105,8 +106,8 @@ class TestSaveModelCanSaveValidArtifacts(unittest.TestCase):
             models_folder_path=temp_dir,
             model_name=model_name
         )
-        features_file = os.path.join(result_path, "features.csv")
-        self.assertGreater(os.path.getsize(features_file), 0, "Features CSV file is empty")
+        features_file = os.path.join(ModelVersions(result_path).current(), "features.npy")
+        self.assertGreater(os.path.getsize(features_file), 0, "Features matrix file is empty")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+import unittest
+import numpy as np
+import pandas as pd
+import tempfile
+import os
+import sys
+import shutil
+from xgboost import XGBRegressor
+from sklearn.linear_model import LinearRegression
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.booster_model import BoosterModel
+
+"""
+Unit tests for BoosterModel class.
+Tests cover saving in native formats, metadata and prediction parity with XGBRegressor.
+"""
+
+class TestBoosterModel(unittest.TestCase):
+
+    """
+    Trains small XGBoost model.
+    """
+    def make_model(self) -> tuple:
+        x = pd.DataFrame({'f1': np.arange(20, dtype=float), 'f2': np.arange(20, dtype=float) % 3})
+        y = x['f1'] * 2 + x['f2']
+        return XGBRegressor(n_estimators=10).fit(x, y), x
+
+    """
+    Checks that loaded UBJSON booster predicts the same values as the fitted model.
+    """
+    def test_predict_matches_fitted_model_for_ubj(self):
+        model, x = self.make_model()
+        folder = tempfile.mkdtemp()
+        path = BoosterModel.save(model, os.path.join(folder, "model.ubj"))
+        result = BoosterModel(path).predict(x)
+        shutil.rmtree(folder)
+        self.assertTrue(np.allclose(result, model.predict(x), atol=1e-5), "Native predictions differ from model")
+
+    """
+    Checks that loaded JSON booster predicts the same values as the fitted model.
+    """
+    def test_predict_matches_fitted_model_for_json(self):
+        model, x = self.make_model()
+        folder = tempfile.mkdtemp()
+        path = BoosterModel.save(model, os.path.join(folder, "model.json"))
+        result = BoosterModel(path).predict(x.to_numpy())
+        shutil.rmtree(folder)
+        self.assertTrue(np.allclose(result, model.predict(x), atol=1e-5), "Native predictions differ from model")
+
+    """
+    Checks that metadata with format and feature names is written next to the model.
+    """
+    def test_save_writes_metadata(self):
+        model, _ = self.make_model()
+        folder = tempfile.mkdtemp()
+        path = BoosterModel.save(model, os.path.join(folder, "model.ubj"))
+        metadata = BoosterModel(path).metadata()
+        shutil.rmtree(folder)
+        self.assertEqual(metadata['format'], 'ubj', "Metadata format is incorrect")
+        self.assertListEqual(metadata['feature_names'], ['f1', 'f2'], "Metadata feature names are incorrect")
+
+    """
+    Checks that non XGBoost model cannot be saved in native format.
+    """
+    def test_save_rejects_non_xgboost_model(self):
+        folder = tempfile.mkdtemp()
+        with self.assertRaises(ValueError):
+            BoosterModel.save(LinearRegression(), os.path.join(folder, "model.ubj"))
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    unittest.main()
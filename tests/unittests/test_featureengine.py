@@ -0,0 +1,107 @@
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.feature_engine import FeatureEngine
+
+"""
+Unit tests for FeatureEngine class.
+Tests compare lags, rolling statistics and differences with pandas shift, rolling and diff.
+"""
+
+class TestFeatureEngine(unittest.TestCase):
+
+    """
+    Builds history with Cyrillic column names and months after every row.
+    """
+    def make_history(self, rows: int = 12, seed: int = 0) -> tuple[pd.DataFrame, pd.DatetimeIndex]:
+        rng = np.random.default_rng(seed)
+        history = pd.DataFrame({
+            'Сделки': rng.integers(100, 200, size=rows),
+            'Цена': rng.normal(300, 10, size=rows),
+            'Метка': ['x'] * rows
+        })
+        return history, pd.date_range('2020-02-01', periods=rows, freq='MS')
+
+    """
+    Checks that default spec gives 1-month lags of numeric columns only.
+    """
+    def test_default_spec_gives_one_month_lags(self):
+        history, months = self.make_history()
+        result = FeatureEngine().transform(history, months)
+        self.assertListEqual(list(result.columns), ['Month', 'Сделки lag1', 'Цена lag1'], "Default features are incorrect")
+        self.assertTrue(np.allclose(result['Цена lag1'], history['Цена']), "Lag 1 is not the value of the same row")
+        self.assertTrue((result['Month'] == months).all(), "Months are incorrect")
+
+    """
+    Checks that lags, rolling statistics and differences match pandas.
+    """
+    def test_features_match_pandas(self):
+        history, months = self.make_history(rows=20)
+        spec = {'lags': 3, 'rolling': {'mean': [4], 'std': [3], 'min': [2], 'max': [5]}, 'diffs': [1, 2]}
+        result = FeatureEngine(spec).transform(history, months)
+        for column in ('Сделки', 'Цена'):
+            values = history[column].astype(float)
+            expected = {
+                f'{column} lag1': values,
+                f'{column} lag2': values.shift(1),
+                f'{column} lag3': values.shift(2),
+                f'{column} rolling_mean4': values.rolling(4).mean(),
+                f'{column} rolling_std3': values.rolling(3).std(),
+                f'{column} rolling_min2': values.rolling(2).min(),
+                f'{column} rolling_max5': values.rolling(5).max(),
+                f'{column} diff1': values.diff(1),
+                f'{column} diff2': values.diff(2)
+            }
+            for name, series in expected.items():
+                np.testing.assert_allclose(result[name].to_numpy(), series.to_numpy(), err_msg=f"{name} differs from pandas")
+
+    """
+    Checks that column spec overrides spec of all columns.
+    """
+    def test_column_spec_overrides_default(self):
+        history, months = self.make_history()
+        result = FeatureEngine({'lags': [1], 'columns': {'Цена': {'lags': [2], 'diffs': [1]}}}).transform(history, months)
+        self.assertSetEqual(set(result.columns), {'Month', 'Сделки lag1', 'Цена lag2', 'Цена diff1'}, "Column spec was not applied")
+
+    """
+    Checks that unknown statistics and non-positive windows are rejected.
+    """
+    def test_invalid_spec_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FeatureEngine({'rolling': {'median': [3]}})
+        with self.assertRaises(ValueError):
+            FeatureEngine({'lags': [0]})
+        with self.assertRaises(ValueError):
+            FeatureEngine({'windows': [3]})
+
+    """
+    Checks that features of series stacked with segment starts match pandas groupby and do not cross series.
+    """
+    def test_segmented_features_match_pandas_groupby(self):
+        rng = np.random.default_rng(1)
+        panel = pd.DataFrame({
+            'Комплекс': np.repeat(['А', 'Б', 'В'], [7, 2, 5]),
+            'Сделки': rng.integers(100, 200, size=14).astype(float)
+        })
+        starts = FeatureEngine.segment_starts(panel, ['Комплекс'])
+        spec = {'lags': 2, 'rolling': {'mean': [3], 'std': [2]}, 'diffs': [1]}
+        result = FeatureEngine(spec).transform(panel[['Сделки']], np.arange(14), starts)
+        grouped = panel.groupby('Комплекс', sort=False)['Сделки']
+        expected = {
+            'Сделки lag1': panel['Сделки'],
+            'Сделки lag2': grouped.shift(1),
+            'Сделки rolling_mean3': grouped.rolling(3).mean().reset_index(drop=True),
+            'Сделки rolling_std2': grouped.rolling(2).std().reset_index(drop=True),
+            'Сделки diff1': grouped.diff(1)
+        }
+        for name, series in expected.items():
+            np.testing.assert_allclose(result[name].to_numpy(), series.to_numpy(), err_msg=f"{name} differs from groupby")
+        self.assertListEqual(FeatureEngine.segment_positions(starts).tolist(), [*range(7), 0, 1, *range(5)], "Positions are incorrect")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+import pandas as pd
+import numpy as np
+import tempfile
+import os
+import sys
+import shutil
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.feature_matrix import FeatureMatrix
+
+"""
+Unit tests for FeatureMatrix class.
+Tests cover binary save and memory-mapped load, row access and legacy CSV fallback.
+"""
+
+class TestFeatureMatrix(unittest.TestCase):
+
+    """
+    Test that saved matrix is loaded memory-mapped with the same values and column order.
+    """
+    def test_save_and_load_keeps_values_and_columns(self):
+        folder = tempfile.mkdtemp()
+        features = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01', '2020-03-01'],
+            'признак_б': [3.0, 5.0, np.nan],
+            'признак_а': [7.0, 11.0, 13.0]
+        })
+        FeatureMatrix.save(features, folder)
+        matrix = FeatureMatrix.load(folder)
+        is_mapped = isinstance(matrix.values(), np.memmap)
+        values = np.array(matrix.values())
+        columns = matrix.columns()
+        del matrix
+        shutil.rmtree(folder)
+        self.assertTrue(is_mapped, msg="Values were not memory-mapped")
+        self.assertListEqual(columns, ['признак_б', 'признак_а'], msg="Column order was not kept")
+        self.assertTrue(np.allclose(values, features[columns].to_numpy(), equal_nan=True), msg="Values changed")
+
+    """
+    Test that target name is saved in schema and loaded back.
+    """
+    def test_save_and_load_keeps_target(self):
+        folder = tempfile.mkdtemp()
+        features = pd.DataFrame({'Month': ['2020-01-01'], 'Продажи lag1': [37.0]})
+        FeatureMatrix.save(features, folder, target='Продажи')
+        target = FeatureMatrix.load(folder).target()
+        shutil.rmtree(folder)
+        self.assertEqual(target, 'Продажи', msg="Target name was not kept")
+
+    """
+    Test that last returns the last row as 2D array.
+    """
+    def test_last_returns_last_row(self):
+        matrix = FeatureMatrix.from_frame(pd.DataFrame({'Month': ['a', 'b'], 'f': [17.0, 19.0]}))
+        self.assertEqual(matrix.last().tolist(), [[19.0]], msg="Last row is incorrect")
+
+    """
+    Test that frame returns selected rows with Month column first.
+    """
+    def test_frame_returns_selected_rows_with_month(self):
+        matrix = FeatureMatrix.from_frame(pd.DataFrame({'Month': ['a', 'b', 'c'], 'f': [23.0, 29.0, 31.0]}))
+        frame = matrix.frame(np.array([False, True, True]))
+        self.assertListEqual(list(frame.columns), ['Month', 'f'], msg="Frame columns are incorrect")
+        self.assertListEqual(frame['f'].tolist(), [29.0, 31.0], msg="Frame rows are incorrect")
+
+    """
+    Test that folder with only features.csv is loaded through the same interface.
+    """
+    def test_load_reads_legacy_csv(self):
+        folder = tempfile.mkdtemp()
+        pd.DataFrame({'Month': ['2020-01-01', '2020-02-01'], 'f': [37, 41]}).to_csv(
+            os.path.join(folder, 'features.csv'), index=False
+        )
+        matrix = FeatureMatrix.load(folder)
+        shutil.rmtree(folder)
+        self.assertEqual(matrix.months(), ['2020-01-01', '2020-02-01'], msg="Months were not read from CSV")
+        self.assertEqual(matrix.last().tolist(), [[41.0]], msg="Last CSV row is incorrect")
+
+    """
+    Test that appended rows are added to saved .npy file and schema in place.
+    """
+    def test_append_adds_rows_to_saved_matrix(self):
+        folder = tempfile.mkdtemp()
+        FeatureMatrix.save(pd.DataFrame({'Month': ['2020-01-01', '2020-02-01'], 'признак_ω': [43.0, 47.0]}), folder, target='Сделки')
+        FeatureMatrix.append(folder, pd.DataFrame({'Month': ['2020-03-01'], 'признак_ω': [53.0]}))
+        matrix = FeatureMatrix.load(folder)
+        values, months, target = np.array(matrix.values()), matrix.months(), matrix.target()
+        del matrix
+        with self.assertRaises(ValueError):
+            FeatureMatrix.append(folder, pd.DataFrame({'Month': ['2020-04-01'], 'другой': [59.0]}))
+        shutil.rmtree(folder)
+        self.assertEqual(values.tolist(), [[43.0], [47.0], [53.0]], msg="Rows were not appended")
+        self.assertEqual(months, ['2020-01-01', '2020-02-01', '2020-03-01'], msg="Months were not appended")
+        self.assertEqual(target, 'Сделки', msg="Target was lost on append")
+
+    """
+    Test that append does not rewrite schema and overwrites rows left behind by an interrupted append.
+    """
+    def test_append_overwrites_rows_of_interrupted_append(self):
+        folder = tempfile.mkdtemp()
+        FeatureMatrix.save(pd.DataFrame({'Month': ['2020-01-01', '2020-02-01'], 'признак_ω': [61.0, 67.0]}), folder)
+        schema_path = os.path.join(folder, FeatureMatrix.SCHEMA_FILE)
+        values_path = os.path.join(folder, FeatureMatrix.VALUES_FILE)
+        with open(schema_path, 'rb') as file:
+            schema = file.read()
+        with open(values_path, 'ab') as file:
+            file.write(np.array([999.0]).tobytes())
+        FeatureMatrix.append(folder, pd.DataFrame({'Month': ['2020-03-01'], 'признак_ω': [71.0]}))
+        matrix = FeatureMatrix.load(folder)
+        values, months = np.array(matrix.values()), matrix.months()
+        del matrix
+        with open(schema_path, 'rb') as file:
+            schema_after = file.read()
+        size = os.path.getsize(values_path) - np.lib.format.open_memmap(values_path, mode='r').offset
+        shutil.rmtree(folder)
+        self.assertEqual(values.tolist(), [[61.0], [67.0], [71.0]], msg="Stale row was kept")
+        self.assertEqual(months, ['2020-01-01', '2020-02-01', '2020-03-01'], msg="Months are incorrect")
+        self.assertEqual(schema, schema_after, msg="Schema was rewritten on append")
+        self.assertEqual(size, 3 * 8, msg="File was not cut after appended rows")
+
+
+if __name__ == "__main__":
+    unittest.main()
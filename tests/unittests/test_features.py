@@ -170,6 +170,16 @@ class TestFeaturesCanAddSeasonalityAndManageColumns(unittest.TestCase):
         expected_columns = ['Month', 'B']
         self.assertListEqual(list(result.columns), expected_columns, "drop_columns did not remove multiple columns correctly")
 
+    """
+    Checks that seasonality of panel data counts months within every series and series columns are kept.
+    """
+    def test_seasonality_of_panel_counts_months_within_series(self):
+        df = pd.DataFrame({'Month': range(5), 'Комплекс': ['А', 'А', 'А', 'Б', 'Б'], 'dummy': range(5)})
+        features = Features(df.copy(), series=['Комплекс']).add_sin_seasonality(period=4).choose_features(['sin_season']).prepare_data()
+        expected = np.sin(2 * np.pi * np.array([0, 1, 2, 0, 1]) / 4)
+        self.assertTrue(np.allclose(features['sin_season'].to_numpy(), expected), "Panel seasonality values are incorrect")
+        self.assertListEqual(list(features.columns), ['Month', 'Комплекс', 'sin_season'], "Series column was not kept")
+
 
 if __name__ == "__main__":
     unittest.main()
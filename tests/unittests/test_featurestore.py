@@ -0,0 +1,126 @@
+import unittest
+import numpy as np
+import pandas as pd
+import tempfile
+import os
+import sys
+import shutil
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.feature_store import FeatureStore
+from src.features import Features
+from src.rawdata import RawData
+
+"""
+Unit tests for FeatureStore class.
+Tests check that incremental append gives the same features and target as rebuilding from the whole file.
+"""
+
+class TestFeatureStore(unittest.TestCase):
+
+    SPEC = {'lags': 2, 'rolling': {'mean': [3], 'std': [3]}, 'diffs': [1]}
+
+    """
+    Builds raw data with Cyrillic column names.
+    """
+    def make_raw(self, rows: int, seed: int = 0) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        return pd.DataFrame({
+            'Month': pd.date_range('2020-01-01', periods=rows, freq='MS'),
+            'Сделки': rng.integers(100, 200, size=rows),
+            'Цена': rng.normal(300, 10, size=rows)
+        })
+
+    """
+    Builds features of the whole raw data with RawData and Features pipeline.
+    """
+    def rebuild(self, raw: pd.DataFrame, folder: str) -> pd.DataFrame:
+        path = os.path.join(folder, 'данные.csv')
+        raw.to_csv(path, index=False)
+        return (
+            Features(RawData(path).make_features(spec=self.SPEC))
+            .add_sin_seasonality(period=12)
+            .add_cos_seasonality(period=12)
+            .prepare_data()
+        )
+
+    """
+    Checks that appended months give the same features and target as building from all rows.
+    """
+    def test_append_matches_full_rebuild(self):
+        folder = tempfile.mkdtemp()
+        raw = self.make_raw(20)
+        store = FeatureStore(os.path.join(folder, 'признаки'))
+        store.build(raw.iloc[:15], target='Сделки', spec=self.SPEC, period=12)
+        store.append(raw.iloc[15:16])
+        store.append(raw.iloc[16:])
+        features, target = store.features(), store.target()
+        expected = self.rebuild(raw, folder)
+        shutil.rmtree(folder)
+        self.assertListEqual(list(features.columns), list(expected.columns), "Columns differ from rebuild")
+        self.assertTrue((features['Month'] == expected['Month']).all(), "Months differ from rebuild")
+        np.testing.assert_allclose(features.drop(columns=['Month']).to_numpy(), expected.drop(columns=['Month']).to_numpy(), err_msg="Values differ from rebuild")
+        self.assertTrue((target['Month'] == raw['Month']).all(), "Target months are incorrect")
+        self.assertListEqual(target['Сделки'].tolist(), raw['Сделки'].astype(float).tolist(), "Target values are incorrect")
+
+    """
+    Checks that append adds one row per new month and keeps earlier rows unchanged.
+    """
+    def test_append_keeps_earlier_rows(self):
+        folder = tempfile.mkdtemp()
+        raw = self.make_raw(10, seed=1)
+        store = FeatureStore(folder)
+        before = np.array(store.build(raw.iloc[:8], target='Сделки', spec=self.SPEC).values())
+        after = np.array(store.append(raw.iloc[8:]).values())
+        shutil.rmtree(folder)
+        self.assertEqual(after.shape[0], 10, "Append did not add one row per month")
+        np.testing.assert_array_equal(after[:8], before, err_msg="Earlier rows were changed")
+
+    """
+    Checks that months not after the last stored month are rejected.
+    """
+    def test_append_rejects_old_months(self):
+        folder = tempfile.mkdtemp()
+        raw = self.make_raw(6, seed=2)
+        store = FeatureStore(folder)
+        store.build(raw, target='Сделки')
+        with self.assertRaises(ValueError):
+            store.append(raw.iloc[-1:])
+        shutil.rmtree(folder)
+
+    """
+    Checks that ingesting raw data batch by batch gives the same features as rebuilding from all rows.
+    """
+    def test_ingest_batches_matches_full_rebuild(self):
+        folder = tempfile.mkdtemp()
+        raw = self.make_raw(17, seed=3)
+        path = os.path.join(folder, 'выгрузка.csv')
+        raw.to_csv(path, index=False)
+        store = FeatureStore(os.path.join(folder, 'признаки'))
+        store.ingest(RawData(path, chunk_rows=4), target='Сделки', spec=self.SPEC, period=12)
+        features, target = store.features(), store.target()
+        expected = self.rebuild(raw, folder)
+        shutil.rmtree(folder)
+        self.assertListEqual(list(features.columns), list(expected.columns), "Columns differ from rebuild")
+        np.testing.assert_allclose(features.drop(columns=['Month']).to_numpy(), expected.drop(columns=['Month']).to_numpy(), err_msg="Values differ from rebuild")
+        self.assertListEqual(target['Сделки'].tolist(), raw['Сделки'].astype(float).tolist(), "Target values are incorrect")
+
+    """
+    Checks that months with a gap are rejected, so seasonality and target months stay aligned with rows.
+    """
+    def test_append_rejects_gap_in_months(self):
+        folder = tempfile.mkdtemp()
+        raw = self.make_raw(8, seed=4)
+        store = FeatureStore(folder)
+        store.build(raw.iloc[:6], target='Сделки')
+        with self.assertRaises(ValueError):
+            store.append(raw.iloc[7:])
+        store.append(raw.iloc[6:])
+        target = store.target()
+        shutil.rmtree(folder)
+        self.assertTrue((target['Month'] == raw['Month']).all(), "Target months are incorrect")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import unittest
+import tempfile
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.model_cache import ModelCache
+
+"""
+Unit tests for ModelCache class.
+Tests cover hits, misses, invalidation on file change, version swaps and counters.
+"""
+
+class TestModelCache(unittest.TestCase):
+
+    """
+    Test that second get for unchanged folder returns cached value without calling loader.
+    """
+    def test_get_returns_cached_value_for_unchanged_folder(self):
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, "features.csv")
+        with open(path, "w") as file:
+            file.write("Month,f\n2020-01-01,1\n")
+        cache = ModelCache()
+        calls = []
+        cache.get(folder, lambda: calls.append(1) or "model")
+        result = cache.get(folder, lambda: calls.append(1) or "other")
+        os.remove(path)
+        os.rmdir(folder)
+        self.assertEqual((result, len(calls)), ("model", 1), msg="Loader was called for unchanged folder")
+
+    """
+    Test that get reloads value when file in folder was changed.
+    """
+    def test_get_reloads_value_when_file_changed(self):
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, "features.csv")
+        with open(path, "w") as file:
+            file.write("Month,f\n2020-01-01,1\n")
+        cache = ModelCache()
+        cache.get(folder, lambda: "old")
+        with open(path, "a") as file:
+            file.write("2020-02-01,2\n")
+        result = cache.get(folder, lambda: "new")
+        os.remove(path)
+        os.rmdir(folder)
+        self.assertEqual(result, "new", msg="Changed folder was not reloaded")
+
+    """
+    Test that stats counts hits and misses.
+    """
+    def test_stats_counts_hits_and_misses(self):
+        folder = tempfile.mkdtemp()
+        cache = ModelCache()
+        cache.get(folder, lambda: "model")
+        cache.get(folder, lambda: "model")
+        cache.get(folder, lambda: "model")
+        os.rmdir(folder)
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (2, 1, 1), msg="Cache counters are incorrect")
+
+    """
+    Test that clear removes cached values and resets counters.
+    """
+    def test_clear_resets_cache(self):
+        folder = tempfile.mkdtemp()
+        cache = ModelCache()
+        cache.get(folder, lambda: "model")
+        cache.clear()
+        os.rmdir(folder)
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (0, 0, 0), msg="Cache was not cleared")
+
+    """
+    Test that least recently used folder is evicted when memory budget is exceeded.
+    """
+    def test_get_evicts_least_recently_used_folder(self):
+        folders = [tempfile.mkdtemp() for _ in range(3)]
+        for folder in folders:
+            with open(os.path.join(folder, "model.bin"), "wb") as file:
+                file.write(b"x" * 100)
+        cache = ModelCache(max_bytes=250)
+        cache.get(folders[0], lambda: "first")
+        cache.get(folders[1], lambda: "second")
+        cache.get(folders[0], lambda: "first")
+        cache.get(folders[2], lambda: "third")
+        resident = cache.resident()
+        for folder in folders:
+            os.remove(os.path.join(folder, "model.bin"))
+            os.rmdir(folder)
+        self.assertNotIn(str(Path(folders[1]).resolve()), resident, msg="Least recently used folder was not evicted")
+        self.assertEqual(cache.stats()['evictions'], 1, msg="Eviction was not counted")
+
+    """
+    Test that resident reports size and load time of cached folder.
+    """
+    def test_resident_reports_size_and_load_time(self):
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, "model.bin")
+        with open(path, "wb") as file:
+            file.write(b"x" * 64)
+        cache = ModelCache()
+        cache.get(folder, lambda: "model")
+        entry = cache.resident()[str(Path(folder).resolve())]
+        os.remove(path)
+        os.rmdir(folder)
+        self.assertEqual(entry['size_bytes'], 64, msg="Resident size is incorrect")
+        self.assertGreaterEqual(entry['load_seconds'], 0.0, msg="Load time is not reported")
+
+    """
+    Test that concurrent misses run loader once and share its result.
+    """
+    def test_get_coalesces_concurrent_loads(self):
+        folder = tempfile.mkdtemp()
+        cache = ModelCache()
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            time.sleep(0.2)
+            return "model"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: cache.get(folder, slow_loader), range(8)))
+        os.rmdir(folder)
+        self.assertEqual(len(calls), 1, msg="Loader ran more than once")
+        self.assertEqual(results, ["model"] * 8, msg="Waiting callers did not get loaded value")
+        self.assertEqual(cache.stats()['coalesced'] + cache.stats()['hits'], 7, msg="Coalesced requests were not counted")
+
+    """
+    Test that waiting callers get loader error and error is not cached.
+    """
+    def test_get_shares_loader_error_without_caching_it(self):
+        folder = tempfile.mkdtemp()
+        cache = ModelCache()
+
+        def failing_loader():
+            time.sleep(0.1)
+            raise FileNotFoundError("model file")
+
+        def call(_):
+            try:
+                return cache.get(folder, failing_loader)
+            except FileNotFoundError:
+                return "error"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(call, range(4)))
+        retry = cache.get(folder, lambda: "model")
+        os.rmdir(folder)
+        self.assertEqual(results, ["error"] * 4, msg="Loader error was not shared")
+        self.assertEqual(retry, "model", msg="Loader error was cached")
+
+    """
+    Test that loaded folder replaces other folders of its group while old value stays usable.
+    """
+    def test_get_replaces_folders_of_same_group(self):
+        model_folder = tempfile.mkdtemp()
+        old_version = os.path.join(model_folder, "v1")
+        new_version = os.path.join(model_folder, "v2")
+        os.makedirs(old_version)
+        os.makedirs(new_version)
+        cache = ModelCache()
+        old_model = cache.get(old_version, lambda: ["old"], group=model_folder)
+        new_model = cache.get(new_version, lambda: ["new"], group=model_folder)
+        resident = list(cache.resident())
+        stats = cache.stats()
+        os.rmdir(old_version)
+        os.rmdir(new_version)
+        os.rmdir(model_folder)
+        self.assertEqual((old_model, new_model), (["old"], ["new"]), msg="Values of versions were mixed")
+        self.assertListEqual(resident, [str(Path(new_version).resolve())], msg="Old version stayed in cache")
+        self.assertEqual((stats['swaps'], stats['evictions']), (1, 0), msg="Swap was not counted")
+
+
+if __name__ == "__main__":
+    unittest.main()
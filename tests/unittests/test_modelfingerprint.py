@@ -0,0 +1,67 @@
+import unittest
+import tempfile
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.model_fingerprint import ModelFingerprint
+
+"""
+Unit tests for ModelFingerprint class.
+Tests cover stability, sensitivity to content and exclusion of sidecar files.
+"""
+
+class TestModelFingerprint(unittest.TestCase):
+
+    """
+    Test that fingerprint changes when artifact content changes.
+    """
+    def test_hexdigest_changes_with_content(self):
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, "features.csv")
+        with open(path, "w") as file:
+            file.write("Month,f\n2020-01-01,1\n")
+        before = ModelFingerprint(folder).hexdigest()
+        with open(path, "w") as file:
+            file.write("Month,f\n2020-01-01,2\n")
+        after = ModelFingerprint(folder).hexdigest()
+        os.remove(path)
+        os.rmdir(folder)
+        self.assertNotEqual(before, after, msg="Fingerprint did not change with content")
+
+    """
+    Test that fingerprint is the same for unchanged artifacts.
+    """
+    def test_hexdigest_is_stable(self):
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, "features.csv")
+        with open(path, "w") as file:
+            file.write("Month,f\n2020-01-01,1\n")
+        first = ModelFingerprint(folder).hexdigest()
+        second = ModelFingerprint(folder).hexdigest()
+        os.remove(path)
+        os.rmdir(folder)
+        self.assertEqual(first, second, msg="Fingerprint is not stable")
+
+    """
+    Test that prediction.json does not affect fingerprint.
+    """
+    def test_hexdigest_ignores_prediction_sidecar(self):
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, "features.csv")
+        with open(path, "w") as file:
+            file.write("Month,f\n2020-01-01,1\n")
+        before = ModelFingerprint(folder).hexdigest()
+        sidecar = os.path.join(folder, "prediction.json")
+        with open(sidecar, "w") as file:
+            file.write("{}")
+        after = ModelFingerprint(folder).hexdigest()
+        os.remove(sidecar)
+        os.remove(path)
+        os.rmdir(folder)
+        self.assertEqual(before, after, msg="Sidecar file changed fingerprint")
+
+
+if __name__ == "__main__":
+    unittest.main()
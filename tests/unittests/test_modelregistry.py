@@ -0,0 +1,94 @@
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+import joblib
+import pandas as pd
+from pathlib import Path
+from sklearn.linear_model import LinearRegression
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.model_cache import ModelCache
+from src.model_registry import ModelRegistry
+
+"""
+Unit tests for ModelRegistry class.
+Tests cover discovery of model folders, lookup by name and residency report.
+"""
+
+class TestModelRegistry(unittest.TestCase):
+
+    """
+    Creates models folder with one trained model and one folder without model.
+    """
+    def make_models_folder(self, model_name: str) -> str:
+        folder = tempfile.mkdtemp()
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder)
+        os.makedirs(os.path.join(folder, "not_a_model"))
+        features = pd.DataFrame({'Month': ['2020-01-01', '2020-02-01'], 'признак': [1, 2]})
+        features.to_csv(os.path.join(model_folder, "features.csv"), index=False)
+        model = LinearRegression().fit(features.drop(columns=['Month']), [3, 5])
+        joblib.dump(model, os.path.join(model_folder, model_name + ".joblib"))
+        return folder
+
+    """
+    Test that names returns only folders with model artifact.
+    """
+    def test_names_lists_only_model_folders(self):
+        folder = self.make_models_folder("модель_α")
+        names = ModelRegistry(folder, ModelCache()).names()
+        shutil.rmtree(folder)
+        self.assertListEqual(names, ["модель_α"], msg="Registry discovered wrong folders")
+
+    """
+    Test that folder raises FileNotFoundError for unknown model.
+    """
+    def test_folder_raises_for_unknown_model(self):
+        folder = self.make_models_folder("модель_β")
+        registry = ModelRegistry(folder, ModelCache())
+        with self.assertRaises(FileNotFoundError):
+            registry.folder("../модель_β")
+        for name in ("..", ".", "", "not_a_model", "модель_β/.."):
+            with self.assertRaises(FileNotFoundError, msg=f"Name {name!r} was accepted"):
+                registry.folder(name)
+        found = registry.folder("модель_β")
+        shutil.rmtree(folder)
+        self.assertEqual(found.name, "модель_β", msg="Existing model was not found")
+
+    """
+    Test that models named after static /predict routes are neither listed nor served.
+    """
+    def test_reserved_names_are_rejected(self):
+        folder = self.make_models_folder("модель_δ")
+        for name in ModelRegistry.RESERVED_NAMES:
+            model_folder = os.path.join(folder, name)
+            os.makedirs(model_folder)
+            shutil.copy(os.path.join(folder, "модель_δ", "features.csv"), model_folder)
+            shutil.copy(os.path.join(folder, "модель_δ", "модель_δ.joblib"), os.path.join(model_folder, name + ".joblib"))
+        registry = ModelRegistry(folder, ModelCache())
+        names = registry.names()
+        for name in ModelRegistry.RESERVED_NAMES:
+            with self.assertRaises(FileNotFoundError, msg=f"Reserved name {name!r} was accepted"):
+                registry.folder(name)
+        shutil.rmtree(folder)
+        self.assertListEqual(names, ["модель_δ"], msg="Reserved names were listed")
+
+    """
+    Test that report marks model resident only after prediction.
+    """
+    def test_report_marks_model_resident_after_prediction(self):
+        folder = self.make_models_folder("модель_γ")
+        registry = ModelRegistry(folder, ModelCache())
+        before = registry.report()[0]['resident']
+        registry.predictor("модель_γ").predict()
+        after = registry.report()[0]
+        shutil.rmtree(folder)
+        self.assertFalse(before, msg="Model was resident before first prediction")
+        self.assertTrue(after['resident'], msg="Model is not resident after prediction")
+        self.assertGreater(after['size_bytes'], 0, msg="Resident model size is not reported")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,12 +3,17 @@ import pandas as pd
 import numpy as np
 import tempfile
 import os
+import json
+import shutil
 import sys
 from xgboost import XGBRegressor
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.model_trainer import ModelTrainer
+from src.model_fingerprint import ModelFingerprint
+from src.model_versions import ModelVersions
+from src.tree_evaluator import TreeEvaluator
 
 """
 Unit tests for the updated ModelTrainer class.
@@ -63,21 +68,99 @@ class TestModelTrainer(unittest.TestCase):
         model_path = trainer.save_model(folder, model_name)
 
         model_dir = os.path.join(folder, model_name)
-        joblib_file = os.path.join(model_dir, model_name + '.joblib')
-        csv_file = os.path.join(model_dir, 'features.csv')
+        version_dir = ModelVersions(model_dir).current()
+        joblib_file = os.path.join(version_dir, model_name + '.joblib')
+        npy_file = os.path.join(version_dir, 'features.npy')
+        schema_file = os.path.join(version_dir, 'features.schema.json')
 
-        self.assertTrue(os.path.exists(joblib_file), "Model file was not saved in subfolder")
-        self.assertTrue(os.path.exists(csv_file), "Features CSV file was not saved in subfolder")
-        self.assertTrue(model_path == model_dir, "Returned model path is not correct")
+        self.assertTrue(os.path.exists(joblib_file), "Model file was not saved in current version")
+        self.assertTrue(os.path.exists(npy_file), "Features matrix file was not saved in current version")
+        self.assertTrue(os.path.exists(schema_file), "Features schema file was not saved in current version")
+        self.assertTrue(model_path == os.path.abspath(model_dir), "Returned model path is not correct")
 
         # Cleanup
-        if os.path.exists(joblib_file):
-            os.remove(joblib_file)
-        if os.path.exists(csv_file):
-            os.remove(csv_file)
-        if os.path.exists(model_dir):
-            os.rmdir(model_dir)
-        os.rmdir(folder)
+        shutil.rmtree(folder)
+
+    """
+    Checks that save_model writes prediction for the last features row with fingerprint of saved artifacts.
+    """
+    def test_save_model_writes_precomputed_prediction(self):
+        features = pd.DataFrame({'Month':[2,3,4],'f':[1,2,3]})
+        target = pd.DataFrame({'Month':[2,3],'target':[1,2]})
+        model = XGBRegressor()
+        trainer = ModelTrainer(model, features)
+        trainer.train(target)
+
+        folder = tempfile.mkdtemp()
+        model_name = "unit_test_model_prediction"
+        version_dir = ModelVersions(trainer.save_model(folder, model_name)).current()
+        with open(os.path.join(version_dir, 'prediction.json'), encoding='utf-8') as file:
+            saved = json.load(file)
+        fingerprint = ModelFingerprint(version_dir).hexdigest()
+        expected = float(model.predict(features.drop(columns=['Month']).iloc[[-1]])[0])
+        shutil.rmtree(folder)
+
+        self.assertAlmostEqual(saved['prediction'], expected, places=5, msg="Saved prediction differs from model output")
+        self.assertEqual(saved['fingerprint'], fingerprint, msg="Saved fingerprint does not match artifacts")
+
+    """
+    Checks that save_model in native format writes booster and metadata instead of joblib file.
+    """
+    def test_save_model_native_format_writes_booster_and_metadata(self):
+        features = pd.DataFrame({'Month':[2,3,4],'f':[1,2,3]})
+        target = pd.DataFrame({'Month':[2,3,4],'target':[1,2,3]})
+        trainer = ModelTrainer(XGBRegressor(), features)
+        trainer.train(target)
+
+        folder = tempfile.mkdtemp()
+        model_name = "unit_test_model_native"
+        model_dir = trainer.save_model(folder, model_name, model_format='ubj')
+        files = set(os.listdir(ModelVersions(model_dir).current()))
+        shutil.rmtree(folder)
+
+        self.assertIn(model_name + '.ubj', files, "Native model file was not saved")
+        self.assertIn('metadata.json', files, "Metadata file was not saved")
+        self.assertIn(TreeEvaluator.NODES_FILE, files, "Compiled evaluator was not saved")
+        self.assertNotIn(model_name + '.joblib', files, "Joblib file was saved for native format")
+
+    """
+    Checks that save_model writes features.csv only when it is requested.
+    """
+    def test_save_model_writes_features_csv_on_request(self):
+        features = pd.DataFrame({'Month':[2,3],'f':[1,2]})
+        target = pd.DataFrame({'Month':[2,3],'target':[1,2]})
+        trainer = ModelTrainer(XGBRegressor(), features)
+        trainer.train(target)
+
+        folder = tempfile.mkdtemp()
+        without_csv = os.listdir(ModelVersions(trainer.save_model(folder, "unit_test_model_no_csv")).current())
+        with_csv = os.listdir(ModelVersions(trainer.save_model(folder, "unit_test_model_csv", features_csv=True)).current())
+        shutil.rmtree(folder)
+
+        self.assertNotIn('features.csv', without_csv, "Features CSV was saved without request")
+        self.assertIn('features.csv', with_csv, "Features CSV was not saved on request")
+
+    """
+    Checks that repeated save_model publishes a new verified version and switches current version to it.
+    """
+    def test_save_model_publishes_new_version(self):
+        features = pd.DataFrame({'Month':[2,3],'f':[1,2]})
+        target = pd.DataFrame({'Month':[2,3],'target':[1,2]})
+        trainer = ModelTrainer(XGBRegressor(), features)
+        trainer.train(target)
+
+        folder = tempfile.mkdtemp()
+        versions = ModelVersions(trainer.save_model(folder, "unit_test_model_versions"))
+        first = versions.version()
+        trainer.save_model(folder, "unit_test_model_versions")
+        second = versions.version()
+        verified = ModelVersions.verify(versions.current())
+        staging = [name for name in os.listdir(versions.current().parent) if name.startswith('.staging')]
+        shutil.rmtree(folder)
+
+        self.assertNotEqual(first, second, "Current version was not switched")
+        self.assertTrue(verified, "Published version does not match its manifest")
+        self.assertListEqual(staging, [], "Staging directory was left after publishing")
 
     """
     Checks that the private fit method works without errors.
@@ -0,0 +1,80 @@
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.model_versions import ModelVersions
+
+"""
+Unit tests for ModelVersions class.
+Tests cover resolving of legacy and versioned folders, publishing, manifest verification and cleanup of old versions.
+"""
+
+class TestModelVersions(unittest.TestCase):
+
+    """
+    Writes one artifact file to staging directory and publishes it.
+    """
+    def publish(self, versions: ModelVersions, content: str) -> str:
+        staging = versions.stage()
+        with open(staging / "модель_α.joblib", "w", encoding="utf-8") as file:
+            file.write(content)
+        return versions.publish(staging)
+
+    """
+    Test that folder without CURRENT pointer is resolved to itself.
+    """
+    def test_current_returns_model_folder_when_not_versioned(self):
+        folder = tempfile.mkdtemp()
+        versions = ModelVersions(folder)
+        result = (versions.current(), versions.version())
+        os.rmdir(folder)
+        self.assertEqual(result, (Path(folder), None), msg="Legacy folder was not resolved to itself")
+
+    """
+    Test that publish switches current version to the published artifacts.
+    """
+    def test_publish_switches_current_version(self):
+        folder = tempfile.mkdtemp()
+        versions = ModelVersions(folder)
+        first = self.publish(versions, "первая")
+        second = self.publish(versions, "вторая")
+        with open(versions.current() / "модель_α.joblib", encoding="utf-8") as file:
+            content = file.read()
+        current = versions.version()
+        shutil.rmtree(folder)
+        self.assertNotEqual(first, second, msg="Version ids are not unique")
+        self.assertEqual((current, content), (second, "вторая"), msg="Current version was not switched")
+
+    """
+    Test that manifest matches published files and detects changed artifact.
+    """
+    def test_verify_detects_changed_artifact(self):
+        folder = tempfile.mkdtemp()
+        versions = ModelVersions(folder)
+        self.publish(versions, "модель")
+        verified = ModelVersions.verify(versions.current())
+        with open(versions.current() / "модель_α.joblib", "w", encoding="utf-8") as file:
+            file.write("испорчено")
+        corrupted = ModelVersions.verify(versions.current())
+        shutil.rmtree(folder)
+        self.assertTrue(verified, msg="Published version does not match manifest")
+        self.assertFalse(corrupted, msg="Changed artifact was not detected")
+
+    """
+    Test that publish keeps only limited number of versions including current one.
+    """
+    def test_publish_removes_old_versions(self):
+        folder = tempfile.mkdtemp()
+        versions = ModelVersions(folder, keep=2)
+        published = [self.publish(versions, f"модель {i}") for i in range(4)]
+        remaining = sorted(os.listdir(os.path.join(folder, ModelVersions.VERSIONS_DIR)))
+        shutil.rmtree(folder)
+        self.assertListEqual(remaining, sorted(published[-2:]), msg="Old versions were not removed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,25 @@
 import unittest
 import pandas as pd
+import numpy as np
 import tempfile
 import os
 import sys
 import joblib
+import shutil
+import json
 from pathlib import Path
 from sklearn.linear_model import LinearRegression
+from xgboost import XGBRegressor
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.predictor import Predictor
+from src.booster_model import BoosterModel
+from src.model_cache import ModelCache
+from src.model_fingerprint import ModelFingerprint
+from src.model_versions import ModelVersions
+from src.tree_evaluator import TreeEvaluator
+from src.feature_matrix import FeatureMatrix
+from src.feature_engine import FeatureEngine
 
 """
 Unit tests for Predictor class.
@@ -148,6 +159,480 @@ class TestPredictor(unittest.TestCase):
         os.rmdir(folder)
         self.assertIsNotNone(loaded_model, msg="Model was not loaded")
 
+    """
+    Test that predictor with cache loads model only once for repeated predictions.
+    """
+    def test_predict_with_cache_loads_model_once(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑦"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01'],
+            'признак_ι': [127, 131],
+            'признак_κ': [137, 139]
+        })
+        features_path = os.path.join(model_folder, "features.csv")
+        features.to_csv(features_path, index=False)
+        model = LinearRegression()
+        model.fit(features.drop(columns=['Month']), [149, 151])
+        model_path = os.path.join(model_folder, model_name + ".joblib")
+        joblib.dump(model, model_path)
+        cache = ModelCache()
+        first = Predictor(model_folder, cache=cache).predict()
+        misses = cache.stats()['misses']
+        second = Predictor(model_folder, cache=cache).predict()
+        os.remove(model_path)
+        os.remove(features_path)
+        os.rmdir(model_folder)
+        os.rmdir(folder)
+        self.assertEqual(first, second, msg="Cached prediction differs from loaded one")
+        self.assertEqual(cache.stats()['misses'], misses, msg="Model was loaded more than once")
+
+    """
+    Test that predict returns value from prediction.json when fingerprint matches saved artifacts.
+    """
+    def test_predict_returns_precomputed_value_for_same_fingerprint(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑧"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features_path = os.path.join(model_folder, "features.csv")
+        pd.DataFrame({'Month': ['2020-01-01'], 'признак_λ': [157]}).to_csv(features_path, index=False)
+        model_path = os.path.join(model_folder, model_name + ".joblib")
+        joblib.dump(LinearRegression(), model_path)
+        prediction_path = os.path.join(model_folder, "prediction.json")
+        with open(prediction_path, "w", encoding="utf-8") as file:
+            json.dump({'prediction': 163.0, 'fingerprint': ModelFingerprint(model_folder).hexdigest()}, file)
+        result = Predictor(model_folder).predict()
+        os.remove(prediction_path)
+        os.remove(model_path)
+        os.remove(features_path)
+        os.rmdir(model_folder)
+        os.rmdir(folder)
+        self.assertEqual(result, 163.0, msg="Precomputed prediction was not used")
+
+    """
+    Test that warm-up returns prediction of predict and loads model even when saved prediction is used.
+    """
+    def test_warm_up_predicts_like_predict_and_loads_model(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑳"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({'Month': ['2020-01-01', '2020-02-01'], 'признак_ω': [619, 631]})
+        features.to_csv(os.path.join(model_folder, "features.csv"), index=False)
+        joblib.dump(LinearRegression().fit(features[['признак_ω']], [641, 643]), os.path.join(model_folder, model_name + ".joblib"))
+        with open(os.path.join(model_folder, "prediction.json"), "w", encoding="utf-8") as file:
+            json.dump({'prediction': 647.0, 'fingerprint': ModelFingerprint(model_folder).hexdigest()}, file)
+        cache = ModelCache()
+        result = Predictor(model_folder, cache=cache).warm_up()
+        artifacts = [entry['artifacts'] for entry in cache.resident().values()]
+        shutil.rmtree(folder)
+        self.assertEqual(result, 647.0, msg="Warm-up did not return prediction of predict")
+        self.assertIn('model', artifacts[0], msg="Warm-up did not load the model")
+
+    """
+    Test that predict ignores prediction.json saved for other artifacts.
+    """
+    def test_predict_ignores_precomputed_value_for_other_fingerprint(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑨"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({'Month': ['2020-01-01', '2020-02-01'], 'признак_μ': [167, 173]})
+        features_path = os.path.join(model_folder, "features.csv")
+        features.to_csv(features_path, index=False)
+        model = LinearRegression()
+        model.fit(features.drop(columns=['Month']), [179, 181])
+        model_path = os.path.join(model_folder, model_name + ".joblib")
+        joblib.dump(model, model_path)
+        prediction_path = os.path.join(model_folder, "prediction.json")
+        with open(prediction_path, "w", encoding="utf-8") as file:
+            json.dump({'prediction': -1.0, 'fingerprint': 'stale'}, file)
+        result = Predictor(model_folder).predict()
+        os.remove(prediction_path)
+        os.remove(model_path)
+        os.remove(features_path)
+        os.rmdir(model_folder)
+        os.rmdir(folder)
+        self.assertAlmostEqual(result, 181.0, places=6, msg="Stale precomputed prediction was used")
+
+    """
+    Test that predict_many scores every row and reorders columns to training order.
+    """
+    def test_predict_many_scores_all_rows_in_training_order(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑩"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01', '2020-03-01'],
+            'признак_ν': [1, 2, 3],
+            'признак_ξ': [0, 0, 1]
+        })
+        features_path = os.path.join(model_folder, "features.csv")
+        features.to_csv(features_path, index=False)
+        model = LinearRegression()
+        model.fit(features.drop(columns=['Month']), [10, 20, 130])
+        model_path = os.path.join(model_folder, model_name + ".joblib")
+        joblib.dump(model, model_path)
+        rows = pd.DataFrame({'признак_ξ': [0, 1], 'признак_ν': [2, 3]})
+        result = Predictor(model_folder).predict_many(rows)
+        os.remove(model_path)
+        os.remove(features_path)
+        os.rmdir(model_folder)
+        os.rmdir(folder)
+        self.assertTrue(np.allclose(result, [20, 130]), msg="Batch predictions are incorrect")
+
+    """
+    Test that predict_many raises KeyError when features miss training columns.
+    """
+    def test_predict_many_raises_for_missing_columns(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑪"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({'Month': ['2020-01-01', '2020-02-01'], 'признак_ο': [1, 2]})
+        features_path = os.path.join(model_folder, "features.csv")
+        features.to_csv(features_path, index=False)
+        model = LinearRegression()
+        model.fit(features.drop(columns=['Month']), [1, 2])
+        model_path = os.path.join(model_folder, model_name + ".joblib")
+        joblib.dump(model, model_path)
+        predictor = Predictor(model_folder)
+        with self.assertRaises(KeyError):
+            predictor.predict_many(pd.DataFrame({'другой': [1]}))
+        os.remove(model_path)
+        os.remove(features_path)
+        os.rmdir(model_folder)
+        os.rmdir(folder)
+
+    """
+    Test that features returns stored rows inside month range.
+    """
+    def test_features_returns_rows_in_month_range(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑫"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01', '2020-03-01', '2020-04-01'],
+            'признак_π': [191, 193, 197, 199]
+        })
+        features_path = os.path.join(model_folder, "features.csv")
+        features.to_csv(features_path, index=False)
+        result = Predictor(model_folder).features(start='2020-02-01', end='2020-03-01')
+        os.remove(features_path)
+        os.rmdir(model_folder)
+        os.rmdir(folder)
+        self.assertListEqual(list(result['признак_π']), [193, 197], msg="Month range selection is incorrect")
+
+    """
+    Test that load_model reads native XGBoost artifact into BoosterModel.
+    """
+    def test_load_model_reads_native_artifact(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑬"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        x = pd.DataFrame({'признак_ρ': [1.0, 2.0, 3.0, 4.0]})
+        model = XGBRegressor(n_estimators=5).fit(x, [211, 223, 227, 229])
+        BoosterModel.save(model, os.path.join(model_folder, model_name + ".ubj"))
+        loaded_model = Predictor(model_folder)._Predictor__load_model(model_folder)
+        result = loaded_model.predict(x)
+        shutil.rmtree(folder)
+        self.assertIsInstance(loaded_model, BoosterModel, msg="Native artifact was not loaded as BoosterModel")
+        self.assertTrue(np.allclose(result, model.predict(x), atol=1e-5), msg="Native predictions differ from model")
+
+    """
+    Test that cached predictor switches to newly published version and old model stays usable.
+    """
+    def test_predict_switches_to_published_version(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑭"
+        model_folder = os.path.join(folder, model_name)
+        features = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01'],
+            'признак_σ': [233, 239]
+        })
+        versions = ModelVersions(model_folder)
+
+        def publish(target):
+            staging = versions.stage()
+            features.to_csv(staging / "features.csv", index=False)
+            joblib.dump(LinearRegression().fit(features.drop(columns=['Month']), target), staging / (model_name + ".joblib"))
+            versions.publish(staging)
+
+        cache = ModelCache()
+        publish([241, 251])
+        first = Predictor(model_folder, cache=cache).predict()
+        old_model = cache.get(versions.current(), lambda: None, group=model_folder)
+        publish([257, 263])
+        second = Predictor(model_folder, cache=cache).predict()
+        old_prediction = old_model.predict(features.drop(columns=['Month']).iloc[[-1]])[0]
+        shutil.rmtree(folder)
+        self.assertAlmostEqual(first, 251, places=5, msg="First version prediction is incorrect")
+        self.assertAlmostEqual(second, 263, places=5, msg="Published version was not picked up")
+        self.assertAlmostEqual(old_prediction, 251, places=5, msg="Old model was broken by swap")
+        self.assertEqual(cache.stats()['size'], 1, msg="Old version stayed in cache")
+
+    """
+    Test that numpy engine compiles XGBoost model and predicts the same value as XGBoost.
+    """
+    def test_predict_with_numpy_engine_matches_xgboost(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑮"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01', '2020-03-01', '2020-04-01'],
+            'признак_τ': [269.0, 271.0, 277.0, 281.0]
+        })
+        features.to_csv(os.path.join(model_folder, "features.csv"), index=False)
+        model = XGBRegressor(n_estimators=5).fit(features.drop(columns=['Month']), [283, 293, 307, 311])
+        joblib.dump(model, os.path.join(model_folder, model_name + ".joblib"))
+        cache = ModelCache()
+        expected = Predictor(model_folder).predict()
+        result = Predictor(model_folder, cache=cache, engine='numpy').predict()
+        compiled = cache.get(model_folder, lambda: None, artifact='model.numpy')
+        shutil.rmtree(folder)
+        self.assertAlmostEqual(result, expected, places=4, msg="Numpy engine prediction differs from XGBoost")
+        self.assertIsInstance(compiled, TreeEvaluator, msg="Model was not compiled for numpy engine")
+
+    """
+    Test that forecast feeds every prediction into target lag and rotates seasonality one month forward.
+    """
+    def test_forecast_rolls_features_forward(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑯"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        month_index = np.arange(6)
+        features = pd.DataFrame({
+            'Month': [str(month.date()) for month in pd.date_range('2020-01-01', periods=6, freq='MS')],
+            'Продажи lag1': [313.0, 317.0, 331.0, 337.0, 347.0, 349.0],
+            'sin_season': np.sin(2 * np.pi * month_index / 12),
+            'cos_season': np.cos(2 * np.pi * month_index / 12)
+        })
+        FeatureMatrix.save(features, model_folder, target='Продажи')
+        x = features.drop(columns=['Month'])
+        model = LinearRegression().fit(x, [353, 359, 367, 373, 379, 383])
+        joblib.dump(model, os.path.join(model_folder, model_name + ".joblib"))
+        forecast = Predictor(model_folder, cache=ModelCache()).forecast(horizon=3)
+        shutil.rmtree(folder)
+        expected, lag = [], 349.0
+        for step in range(3):
+            row = pd.DataFrame({
+                'Продажи lag1': [lag],
+                'sin_season': [np.sin(2 * np.pi * (5 + step) / 12)],
+                'cos_season': [np.cos(2 * np.pi * (5 + step) / 12)]
+            })
+            lag = float(model.predict(row)[0])
+            expected.append(lag)
+        self.assertListEqual(forecast['Month'].tolist(), ['2020-06-01', '2020-07-01', '2020-08-01'], msg="Forecast months are incorrect")
+        self.assertTrue(np.allclose(forecast['prediction'], expected), msg="Features were not rolled forward correctly")
+
+    """
+    Test that forecast longer than one month requires saved target name.
+    """
+    def test_forecast_requires_target_for_long_horizon(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑰"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({'Month': ['2020-01-01', '2020-02-01'], 'признак_υ': [389.0, 397.0]})
+        features.to_csv(os.path.join(model_folder, "features.csv"), index=False)
+        joblib.dump(LinearRegression().fit(features[['признак_υ']], [401, 409]), os.path.join(model_folder, model_name + ".joblib"))
+        predictor = Predictor(model_folder)
+        single = predictor.forecast(horizon=1)
+        with self.assertRaises(ValueError):
+            predictor.forecast(horizon=2)
+        shutil.rmtree(folder)
+        self.assertEqual(len(single), 1, msg="One month forecast failed without target")
+
+    """
+    Test that numpy engine opens evaluator compiled at save time without loading the model file.
+    """
+    def test_predict_with_numpy_engine_opens_compiled_evaluator(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_㉑"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01', '2020-03-01', '2020-04-01'],
+            'признак_ψ': [811.0, 821.0, 823.0, 827.0]
+        })
+        features.to_csv(os.path.join(model_folder, "features.csv"), index=False)
+        model = XGBRegressor(n_estimators=5).fit(features.drop(columns=['Month']), [829, 839, 853, 857])
+        TreeEvaluator.from_model(model).save_compiled(model_folder)
+        result = Predictor(model_folder, engine='numpy').predict()
+        shutil.rmtree(folder)
+        self.assertAlmostEqual(result, float(model.predict(features[['признак_ψ']].iloc[[-1]])[0]), delta=1e-3, msg="Compiled evaluator prediction differs from XGBoost")
+
+    """
+    Test that simulation moves exogenous features by historical changes and feeds predictions into target lag.
+    """
+    def test_simulate_rolls_paths_with_historical_changes(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑲"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({
+            'Month': [str(month.date()) for month in pd.date_range('2020-01-01', periods=5, freq='MS')],
+            'Продажи lag1': [521.0, 523.0, 541.0, 547.0, 557.0],
+            'Цена lag1': [563.0, 565.0, 567.0, 569.0, 571.0]
+        })
+        FeatureMatrix.save(features, model_folder, target='Продажи')
+        model = LinearRegression().fit(features.drop(columns=['Month']), [577, 587, 593, 599, 601])
+        joblib.dump(model, os.path.join(model_folder, model_name + ".joblib"))
+        simulation = Predictor(model_folder).simulate(horizon=3, paths=50, seed=7, quantiles=(0.1, 0.9))
+        shutil.rmtree(folder)
+        expected, lag = [], 557.0
+        for step in range(3):
+            lag = float(model.predict(pd.DataFrame({'Продажи lag1': [lag], 'Цена lag1': [571.0 + 2 * step]}))[0])
+            expected.append(lag)
+        self.assertListEqual(list(simulation.columns), ['Month', 'mean', 'p10', 'p90'], msg="Simulation columns are incorrect")
+        self.assertListEqual(simulation['Month'].tolist(), ['2020-05-01', '2020-06-01', '2020-07-01'], msg="Simulation months are incorrect")
+        for column in ('mean', 'p10', 'p90'):
+            self.assertTrue(np.allclose(simulation[column], expected), msg="Paths were not rolled with historical changes")
+
+    """
+    Test that simulation with the same seed does not depend on number of workers.
+    """
+    def test_simulate_is_reproducible_across_workers(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑳"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({
+            'Month': [str(month.date()) for month in pd.date_range('2020-01-01', periods=6, freq='MS')],
+            'Продажи lag1': [607.0, 613.0, 617.0, 619.0, 631.0, 641.0],
+            'Цена lag1': [643.0, 647.0, 653.0, 659.0, 661.0, 673.0],
+            'Ставка lag1': [677.0, 683.0, 691.0, 701.0, 709.0, 719.0]
+        })
+        FeatureMatrix.save(features, model_folder, target='Продажи')
+        model = LinearRegression().fit(features.drop(columns=['Month']), [727, 733, 739, 743, 751, 757])
+        joblib.dump(model, os.path.join(model_folder, model_name + ".joblib"))
+        predictor = Predictor(model_folder, cache=ModelCache())
+        single = predictor.simulate(horizon=4, paths=101, seed=11)
+        parallel = predictor.simulate(horizon=4, paths=101, seed=11, workers=3)
+        shutil.rmtree(folder)
+        pd.testing.assert_frame_equal(single, parallel)
+        self.assertTrue((single['p95'] >= single['p5']).all(), msg="Quantiles are not ordered")
+        self.assertAlmostEqual(single['p5'][0], single['p95'][0], msg="Next month must not be perturbed")
+
+    """
+    Saves model trained on FeatureEngine features of raw history, rows without full history are stored but not trained on.
+    """
+    def save_engine_model(self, model_folder: str, raw: pd.DataFrame, spec: dict) -> LinearRegression:
+        months = pd.date_range('2020-02-01', periods=len(raw), freq='MS')
+        features = FeatureEngine(spec).transform(raw, [str(month.date()) for month in months])
+        FeatureMatrix.save(features, model_folder, target='Продажи')
+        x = features.drop(columns=['Month'])
+        known = ~x.isna().any(axis=1)
+        model = LinearRegression().fit(x[known], np.arange(known.sum()) * 3.0 + x[known].sum(axis=1) / 7)
+        joblib.dump(model, os.path.join(model_folder, os.path.basename(model_folder) + ".joblib"))
+        return model
+
+    """
+    Gives predictions of rolling raw history forward month by month with FeatureEngine recomputing all features.
+    """
+    def roll_with_engine(self, model: LinearRegression, raw: pd.DataFrame, spec: dict, steps: list) -> list:
+        expected = []
+        raw = raw.copy()
+        for step in steps:
+            features = FeatureEngine(spec).transform(raw, range(len(raw))).drop(columns=['Month'])
+            expected.append(float(model.predict(features.iloc[[-1]])[0]))
+            raw.loc[len(raw)] = {'Продажи': expected[-1], 'Цена': raw['Цена'].iloc[-1] + step}
+        return expected
+
+    """
+    Test that forecast shifts higher lags and recomputes rolling windows and differences from rolled history.
+    """
+    def test_forecast_rolls_engine_features(self):
+        folder = tempfile.mkdtemp()
+        model_folder = os.path.join(folder, "тест_модель_㉒")
+        os.makedirs(model_folder, exist_ok=True)
+        spec = {'lags': [1, 2], 'rolling': {'mean': [3]}, 'diffs': [1]}
+        raw = pd.DataFrame({
+            'Продажи': [811.0, 823.0, 827.0, 829.0, 839.0, 853.0, 857.0, 859.0, 863.0, 877.0],
+            'Цена': [881.0, 883.0, 887.0, 907.0, 911.0, 919.0, 929.0, 937.0, 941.0, 947.0]
+        })
+        model = self.save_engine_model(model_folder, raw, spec)
+        forecast = Predictor(model_folder).forecast(horizon=4)
+        shutil.rmtree(folder)
+        expected = self.roll_with_engine(model, raw, spec, [0.0] * 4)
+        self.assertTrue(np.allclose(forecast['prediction'], expected), msg="Engine features were not rolled forward")
+
+    """
+    Test that simulation recomputes engine features and ignores first rows without history in changes.
+    """
+    def test_simulate_rolls_engine_features(self):
+        folder = tempfile.mkdtemp()
+        model_folder = os.path.join(folder, "тест_модель_㉓")
+        os.makedirs(model_folder, exist_ok=True)
+        spec = {'lags': [1, 2], 'rolling': {'mean': [3]}, 'diffs': [1]}
+        raw = pd.DataFrame({
+            'Продажи': [953.0, 967.0, 971.0, 977.0, 983.0, 991.0, 997.0, 1009.0],
+            'Цена': 1013.0 + 2.0 * np.arange(8)
+        })
+        model = self.save_engine_model(model_folder, raw, spec)
+        simulation = Predictor(model_folder).simulate(horizon=3, paths=20, seed=5)
+        shutil.rmtree(folder)
+        expected = self.roll_with_engine(model, raw, spec, [2.0] * 3)
+        self.assertFalse(simulation.isna().any().any(), msg="Simulation has NaN values")
+        for column in ('mean', 'p5', 'p95'):
+            self.assertTrue(np.allclose(simulation[column], expected), msg="Paths were not rolled with engine features")
+
+    """
+    Test that scenarios score Cartesian grid with overrides like explicit feature rows.
+    """
+    def test_scenarios_match_predictions_of_explicit_rows(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑱"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01', '2020-03-01'],
+            'Ставка lag1': [439.0, 443.0, 449.0],
+            'Цена lag1': [457.0, 461.0, 463.0],
+            'признак_φ': [467.0, 479.0, 487.0]
+        })
+        features.to_csv(os.path.join(model_folder, "features.csv"), index=False)
+        model = LinearRegression().fit(features.drop(columns=['Month']), [491, 499, 503])
+        joblib.dump(model, os.path.join(model_folder, model_name + ".joblib"))
+        result = Predictor(model_folder).scenarios(overrides={'признак_φ': 509.0}, grid={'Ставка': [1.0, 2.0], 'Цена lag1': [3.0, 4.0, 5.0]})
+        shutil.rmtree(folder)
+        rows = pd.DataFrame(
+            [[rate, price, 509.0] for rate in [1.0, 2.0] for price in [3.0, 4.0, 5.0]],
+            columns=['Ставка lag1', 'Цена lag1', 'признак_φ']
+        )
+        self.assertEqual(result.shape, (2, 3), msg="Scenario grid has wrong shape")
+        self.assertTrue(np.allclose(result.ravel(), model.predict(rows)), msg="Scenario predictions differ from explicit rows")
+
+    """
+    Test that scenario block gives the same predictions as the slice of the whole grid.
+    """
+    def test_scenario_block_matches_slice_of_grid(self):
+        folder = tempfile.mkdtemp()
+        model_name = "тест_модель_⑲"
+        model_folder = os.path.join(folder, model_name)
+        os.makedirs(model_folder, exist_ok=True)
+        features = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01', '2020-03-01'],
+            'Ставка lag1': [571.0, 577.0, 587.0],
+            'Цена lag1': [593.0, 599.0, 601.0]
+        })
+        features.to_csv(os.path.join(model_folder, "features.csv"), index=False)
+        joblib.dump(LinearRegression().fit(features.drop(columns=['Month']), [607, 613, 617]), os.path.join(model_folder, model_name + ".joblib"))
+        grid = {'Ставка': [1.0, 2.0, 3.0], 'Цена lag1': [4.0, 5.0, 6.0, 7.0]}
+        predictor = Predictor(model_folder)
+        whole = predictor.scenarios(grid=grid).ravel()
+        block = predictor.scenario_block(None, grid, 5, 10)
+        shutil.rmtree(folder)
+        self.assertTrue(np.allclose(block, whole[5:10]), msg="Scenario block differs from slice of the grid")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -7,7 +7,7 @@ import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.rawdata import RawData
+from src.rawdata import RawData, ARROW_INSTALLED
 
 """
 Unit tests for RawData class in demandpredictor.raw_data module.
@@ -276,6 +276,220 @@ class TestRawData(unittest.TestCase):
         os.rmdir(directory)
         self.assertEqual(result.shape[0], 3, msg="Row count in create_feature is incorrect")
 
+    """
+    Test that features and target of one RawData object parse the file only once.
+    """
+    def test_make_features_and_target_parse_file_once(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'данные_15.csv')
+        frame = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01', '2020-03-01'],
+            'Deals': [197, 199, 211],
+            'Value': [521, 523, 541]
+        })
+        frame.to_csv(path, index=False)
+        raw = RawData(path)
+        features = raw.make_features()
+        os.remove(path)
+        target = raw.target('Deals')
+        os.rmdir(directory)
+        self.assertEqual(features.at[2, 'Deals lag1'], 211, msg="Features are incorrect")
+        self.assertListEqual(target['Deals'].tolist(), [197, 199, 211], msg="Target was not taken from parsed frame")
+
+    """
+    Test that target requested first reads only Month and target columns.
+    """
+    def test_target_reads_only_month_and_target_columns(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'данные_16.csv')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write("Month,Deals,Broken\n2020-01-01,223,a\n2020-02-01,227,b\n")
+        raw = RawData(path)
+        target = raw.target('Deals')
+        os.remove(path)
+        os.rmdir(directory)
+        self.assertListEqual(list(target.columns), ['Month', 'Deals'], msg="Target columns are incorrect")
+        self.assertIsNone(raw._RawData__frame, msg="Whole file was parsed for target")
+
+    """
+    Test that make_features builds features from spec for the month after every row.
+    """
+    def test_make_features_with_spec(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'данные_17.csv')
+        frame = pd.DataFrame({
+            'Month': ['2020-01-01', '2020-02-01', '2020-03-01'],
+            'Deals': [229, 233, 239],
+            'Value': [547, 557, 563]
+        })
+        frame.to_csv(path, index=False)
+        result = RawData(path).make_features(spec={'lags': 2, 'diffs': [1]})
+        os.remove(path)
+        os.rmdir(directory)
+        self.assertEqual(result.at[2, 'Deals lag2'], 233, msg="Lag 2 of the next month is incorrect")
+        self.assertEqual(result.at[2, 'Deals diff1'], 6, msg="Difference of the next month is incorrect")
+        self.assertTrue(np.isnan(result.at[0, 'Deals lag2']), msg="Lag without history is not NaN")
+
+    """
+    Test that panel features equal features of every series built separately and series get own next month.
+    """
+    def test_panel_features_match_single_series(self):
+        directory = tempfile.mkdtemp()
+        months = pd.date_range('2020-01-01', periods=6, freq='MS')
+        frames = {
+            'Север': pd.DataFrame({'Month': months, 'Deals': [241, 251, 257, 263, 269, 271], 'Value': [1, 2, 3, 4, 5, 6]}),
+            'Юг': pd.DataFrame({'Month': months[:4], 'Deals': [277, 281, 283, 293], 'Value': [7, 8, 9, 10]})
+        }
+        panel = pd.concat([frame.assign(Complex=name) for name, frame in frames.items()]).sample(frac=1, random_state=0)
+        path = os.path.join(directory, 'панель.csv')
+        panel.to_csv(path, index=False)
+        spec = {'lags': 2, 'rolling': {'mean': [3]}, 'diffs': [1]}
+        raw = RawData(path, series='Complex')
+        result = raw.make_features(spec=spec)
+        target = raw.target('Deals')
+        for name, frame in frames.items():
+            single_path = os.path.join(directory, f'{name}.csv')
+            frame.to_csv(single_path, index=False)
+            expected = RawData(single_path).make_features(spec=spec)
+            os.remove(single_path)
+            actual = result[result['Complex'] == name].drop(columns=['Complex']).reset_index(drop=True)
+            pd.testing.assert_frame_equal(actual, expected, check_dtype=False, obj=f"Features of {name}")
+        os.remove(path)
+        os.rmdir(directory)
+        self.assertListEqual(list(result.columns[:2]), ['Month', 'Complex'], msg="Series column does not follow Month")
+        self.assertListEqual(list(target.columns), ['Month', 'Complex', 'Deals'], msg="Target columns are incorrect")
+        self.assertListEqual(target['Complex'].tolist(), ['Север'] * 6 + ['Юг'] * 4, msg="Target is not sorted by series")
+
+    """
+    Checks with given parser that streaming mode gives typed batches of chunk rows and the same features as parsing the whole file.
+    """
+    def check_streaming_batches(self, parser: str):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'выгрузка.csv')
+        frame = pd.DataFrame({
+            'Month': pd.date_range('2020-01-01', periods=7, freq='MS').strftime('%Y-%m-%d'),
+            'Deals': [307, 311, 313, 317, 331, 337, 347],
+            'Value': [1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5]
+        })
+        frame.to_csv(path, index=False)
+        streaming = RawData(path, dtypes={'Value': 'float32'}, chunk_rows=3, parser=parser)
+        batches = list(streaming.batches(['Month', 'Deals', 'Value']))
+        features = streaming.make_features(spec={'lags': 2})
+        expected = RawData(path).make_features(spec={'lags': 2})
+        os.remove(path)
+        os.rmdir(directory)
+        self.assertListEqual([len(batch) for batch in batches], [3, 3, 1], msg="Batches do not follow chunk rows")
+        for batch in batches:
+            self.assertEqual(batch['Deals'].dtype, np.float64, msg="Integer column is not float64 in every batch")
+            self.assertEqual(batch['Value'].dtype, np.float32, msg="Explicit dtype was not applied")
+            self.assertTrue(pd.api.types.is_datetime64_any_dtype(batch['Month']), msg="Month is not datetime")
+        pd.testing.assert_frame_equal(features, expected, check_dtype=False, obj="Streaming features")
+
+    """
+    Test that pandas streaming batches are typed and match whole file.
+    """
+    def test_streaming_batches_match_whole_file(self):
+        self.check_streaming_batches('pandas')
+
+    """
+    Test that pyarrow streaming batches are typed and match whole file.
+    """
+    @unittest.skipUnless(ARROW_INSTALLED, "pyarrow is not installed")
+    def test_arrow_streaming_batches_match_whole_file(self):
+        self.check_streaming_batches('pyarrow')
+
+    """
+    Checks with given parser that streamed panel data with text series column gives the same features as parsing the whole file.
+    """
+    def check_streaming_panel(self, parser: str):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'панель_поток.csv')
+        months = pd.date_range('2020-01-01', periods=5, freq='MS').strftime('%Y-%m-%d')
+        panel = pd.concat([
+            pd.DataFrame({'Month': months, 'Complex': 'Север', 'Deals': [349, 353, 359, 367, 373]}),
+            pd.DataFrame({'Month': months, 'Complex': 'Юг', 'Deals': [379, 383, 389, 397, 401]})
+        ])
+        panel.to_csv(path, index=False)
+        streaming = RawData(path, series='Complex', chunk_rows=3, memory_limit=2**20, parser=parser)
+        batches = list(streaming.batches())
+        features = streaming.make_features(spec={'lags': 2})
+        expected = RawData(path, series='Complex').make_features(spec={'lags': 2})
+        os.remove(path)
+        os.rmdir(directory)
+        self.assertEqual(sum(len(batch) for batch in batches), 10, msg="Rows were lost")
+        for batch in batches:
+            self.assertEqual(batch['Deals'].dtype, np.float64, msg="Integer column is not float64 in every batch")
+        pd.testing.assert_frame_equal(features, expected, check_dtype=False, obj="Streaming panel features")
+
+    """
+    Test that pandas streaming reads panel data with text series column.
+    """
+    def test_streaming_panel_with_text_series(self):
+        self.check_streaming_panel('pandas')
+
+    """
+    Test that pyarrow streaming reads panel data with text series column.
+    """
+    @unittest.skipUnless(ARROW_INSTALLED, "pyarrow is not installed")
+    def test_arrow_streaming_panel_with_text_series(self):
+        self.check_streaming_panel('pyarrow')
+
+    """
+    Test that pyarrow reader keeps integer-looking column as float64 when decimals appear in later blocks
+    and converted batches fit into a quarter of memory limit.
+    """
+    @unittest.skipUnless(ARROW_INSTALLED, "pyarrow is not installed")
+    def test_arrow_streaming_reads_decimals_of_later_blocks(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'выгрузка_3.csv')
+        deals = np.arange(20_000).astype(object)
+        deals[-1] = 0.5
+        frame = pd.DataFrame({'Month': pd.date_range('2000-01-01', periods=20_000, freq='D').strftime('%Y-%m-%d'), 'Deals': deals})
+        frame.to_csv(path, index=False)
+        batches = list(RawData(path, memory_limit=2**16, parser='pyarrow').batches())
+        os.remove(path)
+        os.rmdir(directory)
+        self.assertGreater(len(batches), 1, msg="File was not read in batches")
+        self.assertEqual(sum(len(batch) for batch in batches), 20_000, msg="Rows were lost")
+        self.assertEqual(batches[-1]['Deals'].iloc[-1], 0.5, msg="Decimal of the last block is incorrect")
+        for batch in batches:
+            self.assertEqual(batch['Deals'].dtype, np.float64, msg="Integer column is not float64 in every batch")
+            self.assertLessEqual(batch.memory_usage(deep=True, index=False).sum(), 2**16 // 4 + 64, msg="Batch exceeds memory budget")
+
+    """
+    Test that header-only file gives empty frame with its columns in streaming mode.
+    """
+    def test_streaming_header_only_file_gives_empty_frame(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'выгрузка_4.csv')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write("Month,Deals\n")
+        frames = [RawData(path, chunk_rows=2, parser=parser).frame() for parser in RawData.PARSERS if parser == 'pandas' or ARROW_INSTALLED]
+        os.remove(path)
+        os.rmdir(directory)
+        for frame in frames:
+            self.assertListEqual(list(frame.columns), ['Month', 'Deals'], msg="Columns of empty file are incorrect")
+            self.assertEqual(len(frame), 0, msg="Empty file has rows")
+
+    """
+    Test that parsed data above memory limit raises MemoryError.
+    """
+    def test_streaming_memory_limit_raises_memory_error(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'выгрузка_2.csv')
+        frame = pd.DataFrame({
+            'Month': pd.date_range('2000-01-01', periods=300, freq='MS').strftime('%Y-%m-%d'),
+            'Deals': np.arange(300)
+        })
+        frame.to_csv(path, index=False)
+        raw = RawData(path, memory_limit=2048)
+        with self.assertRaises(MemoryError):
+            raw.frame()
+        target = RawData(path, memory_limit=2**20).target('Deals')
+        os.remove(path)
+        os.rmdir(directory)
+        self.assertEqual(len(target), 300, msg="Target under memory limit is incomplete")
+
 
 if __name__ == "__main__":
     unittest.main()
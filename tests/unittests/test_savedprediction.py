@@ -0,0 +1,49 @@
+import unittest
+import tempfile
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.saved_prediction import SavedPrediction
+
+"""
+Unit tests for SavedPrediction class.
+Tests cover reading prediction for matching and stale fingerprint and missing file.
+"""
+
+class TestSavedPrediction(unittest.TestCase):
+
+    """
+    Test that saved prediction is returned for the same fingerprint.
+    """
+    def test_value_returns_prediction_for_matching_fingerprint(self):
+        folder = tempfile.mkdtemp()
+        SavedPrediction(folder).save(419.5, "отпечаток_α")
+        result = SavedPrediction(folder).value("отпечаток_α")
+        shutil.rmtree(folder)
+        self.assertEqual(result, 419.5, msg="Saved prediction was not returned")
+
+    """
+    Test that prediction saved for other artifacts is ignored.
+    """
+    def test_value_ignores_stale_fingerprint(self):
+        folder = tempfile.mkdtemp()
+        SavedPrediction(folder).save(421.0, "отпечаток_β")
+        result = SavedPrediction(folder).value("отпечаток_γ")
+        shutil.rmtree(folder)
+        self.assertIsNone(result, msg="Stale prediction was returned")
+
+    """
+    Test that folder without prediction.json gives None.
+    """
+    def test_value_returns_none_without_file(self):
+        folder = tempfile.mkdtemp()
+        exists = SavedPrediction(folder).exists()
+        result = SavedPrediction(folder).value("отпечаток_δ")
+        shutil.rmtree(folder)
+        self.assertEqual((exists, result), (False, None), msg="Missing prediction was not detected")
+
+
+if __name__ == "__main__":
+    unittest.main()
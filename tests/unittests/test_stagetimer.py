@@ -0,0 +1,65 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.stage_timer import StageTimer
+
+"""
+Unit tests for StageTimer class.
+Tests cover recording of decorated functions and blocks, errors and disabled hooks.
+"""
+
+class TestStageTimer(unittest.TestCase):
+
+    def tearDown(self):
+        StageTimer.disable()
+
+    """
+    Test that decorated function and with-block are reported with their stage names.
+    """
+    def test_enabled_hooks_report_stages(self):
+        records = []
+        StageTimer.enable(lambda stage, seconds: records.append((stage, seconds)))
+
+        @StageTimer.timed('этап_α')
+        def stage_function(value):
+            return value * 2
+
+        result = stage_function(431)
+        with StageTimer.stage('этап_β'):
+            pass
+        self.assertEqual(result, 862, msg="Decorated function result changed")
+        self.assertListEqual([stage for stage, _ in records], ['этап_α', 'этап_β'], msg="Stages were not reported")
+        self.assertTrue(all(seconds >= 0 for _, seconds in records), msg="Durations are negative")
+
+    """
+    Test that stage raising error is still reported and error is propagated.
+    """
+    def test_failed_stage_is_reported(self):
+        records = []
+        StageTimer.enable(lambda stage, seconds: records.append(stage))
+        with self.assertRaises(KeyError):
+            with StageTimer.stage('этап_γ'):
+                raise KeyError('признак')
+        self.assertListEqual(records, ['этап_γ'], msg="Failed stage was not reported")
+
+    """
+    Test that disabled hooks do not call recorder.
+    """
+    def test_disabled_hooks_record_nothing(self):
+        records = []
+        StageTimer.enable(lambda stage, seconds: records.append(stage))
+        StageTimer.disable()
+
+        @StageTimer.timed('этап_δ')
+        def stage_function():
+            return 433
+
+        with StageTimer.stage('этап_ε'):
+            result = stage_function()
+        self.assertEqual((result, records, StageTimer.enabled()), (433, [], False), msg="Disabled hooks recorded stages")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import numpy as np
+import pandas as pd
+import tempfile
+import os
+import sys
+import shutil
+from xgboost import XGBClassifier, XGBRegressor
+from sklearn.linear_model import LinearRegression
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.tree_evaluator import TreeEvaluator
+from src.booster_model import BoosterModel
+
+"""
+Unit tests for TreeEvaluator class.
+Tests cover prediction parity with XGBoost for single rows, batches, missing values and logistic objective.
+"""
+
+class TestTreeEvaluator(unittest.TestCase):
+
+    """
+    Builds random features with Cyrillic column names.
+    """
+    def make_features(self, rows: int, seed: int = 0) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        return pd.DataFrame({
+            'признак_α': rng.normal(size=rows),
+            'признак_β': rng.uniform(0, 10, size=rows),
+            'признак_γ': rng.integers(0, 5, size=rows).astype(float)
+        })
+
+    """
+    Checks that batch predictions match XGBoost within float tolerance.
+    """
+    def test_predict_matches_xgboost_for_batch(self):
+        x = self.make_features(500)
+        y = x['признак_α'] * 3 + np.sin(x['признак_β']) + x['признак_γ']
+        model = XGBRegressor(n_estimators=50, max_depth=5).fit(x, y)
+        result = TreeEvaluator.from_model(model).predict(x)
+        self.assertTrue(np.allclose(result, model.predict(x), atol=1e-4), "Batch predictions differ from XGBoost")
+
+    """
+    Checks that one row given as 1D array is predicted like XGBoost predicts it.
+    """
+    def test_predict_matches_xgboost_for_single_row(self):
+        x = self.make_features(200)
+        model = XGBRegressor(n_estimators=20).fit(x, x['признак_β'] * 2)
+        row = x.to_numpy()[7]
+        result = TreeEvaluator.from_model(model).predict(row)
+        self.assertEqual(result.shape, (1,), "Single row prediction has wrong shape")
+        self.assertAlmostEqual(float(result[0]), float(model.predict(x.iloc[[7]])[0]), places=4, msg="Single row prediction differs")
+
+    """
+    Checks that missing values follow default split direction as in XGBoost.
+    """
+    def test_predict_handles_missing_values(self):
+        x = self.make_features(300)
+        y = x['признак_α'] + x['признак_γ']
+        x.loc[::4, 'признак_α'] = np.nan
+        model = XGBRegressor(n_estimators=30).fit(x, y)
+        result = TreeEvaluator.from_model(model).predict(x)
+        self.assertTrue(np.allclose(result, model.predict(x), atol=1e-4), "Missing values were routed differently")
+
+    """
+    Checks that logistic objective is converted from margin to probability.
+    """
+    def test_predict_applies_logistic_link(self):
+        x = self.make_features(300)
+        y = (x['признак_β'] > 5).astype(int)
+        model = XGBClassifier(n_estimators=20).fit(x, y)
+        result = TreeEvaluator.from_model(model).predict(x)
+        self.assertTrue(np.allclose(result, model.predict_proba(x)[:, 1], atol=1e-4), "Probabilities differ from XGBoost")
+
+    """
+    Checks that model saved in JSON format is compiled without XGBoost booster object.
+    """
+    def test_load_compiles_saved_json_model(self):
+        x = self.make_features(100)
+        model = XGBRegressor(n_estimators=10).fit(x, x['признак_γ'])
+        folder = tempfile.mkdtemp()
+        path = BoosterModel.save(model, os.path.join(folder, "model.json"))
+        result = TreeEvaluator.load(path).predict(x)
+        shutil.rmtree(folder)
+        self.assertTrue(np.allclose(result, model.predict(x), atol=1e-4), "Loaded JSON model predictions differ")
+
+    """
+    Checks that evaluator saved compiled is opened as read-only memory map and predicts the same values.
+    """
+    def test_load_compiled_memory_maps_saved_nodes(self):
+        x = self.make_features(200)
+        model = XGBRegressor(n_estimators=15, max_depth=4).fit(x, x['признак_β'])
+        folder = tempfile.mkdtemp()
+        TreeEvaluator.from_model(model).save_compiled(folder)
+        evaluator = TreeEvaluator.load_compiled(folder)
+        result = evaluator.predict(x)
+        depth, trees = evaluator.depth(), len(evaluator)
+        mapped = TreeEvaluator.compiled_exists(folder)
+        del evaluator
+        shutil.rmtree(folder)
+        self.assertTrue(mapped, "Compiled evaluator files were not written")
+        self.assertEqual((depth, trees), (4, 15), "Compiled parameters were not restored")
+        self.assertTrue(np.allclose(result, model.predict(x), atol=1e-4), "Memory-mapped evaluator predictions differ")
+
+    """
+    Checks that non-XGBoost model is rejected.
+    """
+    def test_from_model_rejects_non_xgboost_model(self):
+        x = self.make_features(10)
+        with self.assertRaises(ValueError):
+            TreeEvaluator.from_model(LinearRegression().fit(x, x['признак_α']))
+
+
+if __name__ == "__main__":
+    unittest.main()